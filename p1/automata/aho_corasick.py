@@ -0,0 +1,206 @@
+"""Aho-Corasick automata for sets of literal strings."""
+from collections import deque
+from typing import (
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from automata.automaton import FiniteAutomaton
+from automata.compact import CompactDFA
+
+
+class AhoCorasick():
+    """
+    Aho-Corasick automaton for a list of literals.
+
+    The trie of the literals (goto function) is completed with the
+    failure links, so that every node has a transition for every
+    symbol of the alphabet. The construction takes time linear in
+    the total length of the literals times the size of the alphabet.
+
+    Args:
+        literals: Strings to search for.
+        alphabet: Additional symbols of the alphabet. The symbols
+            of the literals are always part of it.
+
+    Attributes:
+        goto: Children of each node of the trie.
+        fail: Failure link of each node.
+        terminal: Indexes of the literals that end at each node.
+        output_link: Nearest node in the failure chain (excluding
+            the node itself) where a literal ends, ``-1`` if none.
+        table: Complete transition table of the search automaton.
+
+    """
+
+    literals: List[str]
+    alphabet: List[str]
+    goto: List[Dict[str, int]]
+    fail: List[int]
+    terminal: List[List[int]]
+    output_link: List[int]
+    table: List[List[int]]
+
+    def __init__(
+        self,
+        literals: Iterable[str],
+        alphabet: Optional[Iterable[str]] = None,
+    ) -> None:
+        self.literals = list(literals)
+        symbols = set(alphabet) if alphabet is not None else set()
+        for literal in self.literals:
+            symbols.update(literal)
+        self.alphabet = sorted(symbols)
+
+        self.goto = [{}]
+        self.terminal = [[]]
+        for literal_index, literal in enumerate(self.literals):
+            node = 0
+            for symbol in literal:
+                child = self.goto[node].get(symbol)
+                if child is None:
+                    child = len(self.goto)
+                    self.goto[node][symbol] = child
+                    self.goto.append({})
+                    self.terminal.append([])
+                node = child
+            self.terminal[node].append(literal_index)
+
+        self._compute_links()
+
+    def _compute_links(self) -> None:
+        """
+        Compute the failure links, the output links and the
+        complete transition table with a BFS over the trie.
+        """
+        num_nodes = len(self.goto)
+        self.fail = [0] * num_nodes
+        self.output_link = [-1] * num_nodes
+        self.table = [[0] * len(self.alphabet) for _ in range(num_nodes)]
+
+        queue: Deque[int] = deque([0])
+        while queue:
+            node = queue.popleft()
+            row = self.table[node]
+            fail_row = self.table[self.fail[node]]
+            for column, symbol in enumerate(self.alphabet):
+                child = self.goto[node].get(symbol)
+                if child is None:
+                    # at the root, missing symbols loop to the root itself
+                    row[column] = fail_row[column] if node else 0
+                    continue
+
+                row[column] = child
+                child_fail = fail_row[column] if node else 0
+                self.fail[child] = child_fail
+                self.output_link[child] = (
+                    child_fail if self.terminal[child_fail]
+                    else self.output_link[child_fail]
+                )
+                queue.append(child)
+
+    def _is_match_node(self, node: int) -> bool:
+        return bool(self.terminal[node]) or self.output_link[node] != -1
+
+    def matches_at(self, node: int) -> List[int]:
+        """
+        Return the indexes of every literal that ends at a node.
+
+        Args:
+            node: Node of the automaton.
+
+        Returns:
+            Indexes of the literals, longest first.
+
+        """
+        found: List[int] = list(self.terminal[node])
+        node = self.output_link[node]
+        while node != -1:
+            found.extend(self.terminal[node])
+            node = self.output_link[node]
+        return found
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, str]]:
+        """
+        Find every occurrence of every literal in a text.
+
+        Symbols outside of the alphabet restart the search.
+
+        Args:
+            text: Text to search.
+
+        Returns:
+            Iterator over ``(start, literal)`` pairs, sorted by the
+            position where the occurrence ends.
+
+        """
+        symbol_index = {symbol: i for i, symbol in enumerate(self.alphabet)}
+        node = 0
+        for literal_index in self.matches_at(0):
+            yield 0, self.literals[literal_index]
+
+        for position, symbol in enumerate(text, start=1):
+            column = symbol_index.get(symbol)
+            node = self.table[node][column] if column is not None else 0
+            if self._is_match_node(node):
+                for literal_index in self.matches_at(node):
+                    literal = self.literals[literal_index]
+                    yield position - len(literal), literal
+
+    def to_compact(self, search: bool = True) -> CompactDFA:
+        """
+        Return the automaton as a transition table.
+
+        Args:
+            search: If ``True``, the automaton accepts every string
+                that ends with one of the literals (failure links are
+                compiled into the table). If ``False``, it accepts
+                exactly the literals (plain union, missing trie edges
+                go to a dead state).
+
+        Returns:
+            Equivalent compact automaton.
+
+        """
+        num_nodes = len(self.goto)
+        if search:
+            return CompactDFA(
+                alphabet=self.alphabet,
+                table=[list(row) for row in self.table],
+                finals=[self._is_match_node(node) for node in range(num_nodes)],
+            )
+
+        dead = num_nodes
+        table = [
+            [self.goto[node].get(symbol, dead) for symbol in self.alphabet]
+            for node in range(num_nodes)
+        ]
+        table.append([dead] * len(self.alphabet))
+        finals = [bool(self.terminal[node]) for node in range(num_nodes)]
+        finals.append(False)
+        names = [str(node) for node in range(num_nodes)] + ['empty']
+
+        return CompactDFA(
+            alphabet=self.alphabet,
+            table=table,
+            finals=finals,
+            names=names,
+        )
+
+    def to_automaton(self, search: bool = True) -> FiniteAutomaton:
+        """
+        Return the automaton as a deterministic FiniteAutomaton.
+
+        Args:
+            search: Same as in :meth:`to_compact`.
+
+        Returns:
+            Equivalent deterministic automaton.
+
+        """
+        return self.to_compact(search=search).to_automaton()
@@ -2,14 +2,29 @@
 
 
 """Automaton implementation."""
+from collections import deque
+from functools import cached_property
+import time
 from typing import (
+    Deque,
     Optional,
     Set,
     List,
     Dict,
     FrozenSet,
+    Iterable,
+    NamedTuple,
+    Tuple,
 )
 
+from automata.stats import CompilationStats
+
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
 class State():
     """
     Definition of an automaton state. 
@@ -141,46 +156,341 @@ class FiniteAutomaton():
             f"states={self.states!r}, "
         )
 
+    @property
+    def alphabet(self) -> FrozenSet[str]:
+        """Every symbol there is a transition for."""
+        return frozenset(utils.alphabet(self.states))
+
+    @property
+    def closures(self) -> Dict[State, FrozenSet[State]]:
+        """Lambda closure of each state (see utils.compute_closures)."""
+        return utils.compute_closures(self)
+
+    @property
+    def final_states(self) -> FrozenSet[State]:
+        """Set of final states."""
+        return frozenset(utils.get_final_states(self.states))
+
+    @property
+    def accessible_states(self) -> List[State]:
+        """States reachable from the initial state, in order."""
+        return [
+            state
+            for state, accessible in zip(self.states, utils.accessible_indices(self))
+            if accessible
+        ]
+
+    @property
+    def live_states(self) -> FrozenSet[State]:
+        """States from which a final state can be reached."""
+        return frozenset(
+            state
+            for state, live in zip(self.states, utils.coaccessible_indices(self))
+            if live
+        )
+
+    @property
+    def has_lambdas(self) -> bool:
+        """Whether there is some lambda transition."""
+        return any(
+            transition.symbol is None
+            for state in self.states
+            for transition in state.transitions
+        )
+
+    @property
+    def is_deterministic(self) -> bool:
+        """Whether there are no lambdas nor two transitions with the same origin and symbol."""
+        checked_origins: Set[Tuple[str, str]] = set()
+        for state in self.states:
+            for transition in state.transitions:
+                if transition.symbol is None:
+                    return False
+                origin = (state.name, transition.symbol)
+                if origin in checked_origins:
+                    return False
+                checked_origins.add(origin)
+        return True
+
+    def freeze(self) -> 'FrozenAutomaton':
+        """
+        Return an immutable copy of the automaton.
+
+        The derived properties (alphabet, closures, final states...)
+        of the copy are computed once, the first time they are used.
+
+        Returns:
+            Frozen copy of the automaton.
+
+        """
+        return FrozenAutomaton(self.states)
 
-    def to_deterministic(self) -> 'FiniteAutomaton':
+    def remove_lambdas(self) -> 'FiniteAutomaton':
+        """
+        Return an equivalent automaton without lambda transitions.
+
+        Each state gets the symbol transitions of every state in its
+        closure, and it is final if its closure contains a final state.
+        Only the states reachable from the initial state are kept.
+
+        Returns:
+            Equivalent lambda-free automaton.
+
+        """
+        closures: Dict[State, FrozenSet[State]] = utils.compute_closures(self)
+
+        new_states: List[State] = []
+        open_list: Deque[State] = deque([self.states[0]])
+        visited: Set[str] = {self.states[0].name}
+
+        while open_list:
+            current_state = open_list.popleft()
+            closure = closures[current_state]
+            new_state = State(
+                name=current_state.name,
+                is_final=any(state.is_final for state in closure),
+            )
+            new_state.add_transitions([
+                Transition(symbol=transition.symbol, state=transition.state)
+                for state in closure
+                for transition in state.transitions
+                if transition.symbol is not None
+            ])
+            new_states.append(new_state)
+
+            for transition in new_state.transitions:
+                if transition.state not in visited:
+                    visited.add(transition.state)
+                    open_list.append(self.name2state[transition.state])
+
+        return FiniteAutomaton(new_states)
+
+    def trim(self) -> Tuple['FiniteAutomaton', 'TrimReport']:
+        """
+        Return an equivalent automaton without useless states.
+
+        Removes the states that are not reachable from the initial
+        state and the states from which no final state can be reached
+        (the initial state is always kept). Both searches are linear in
+        the size of the automaton.
+
+        Returns:
+            Trimmed automaton (not necessarily complete) and the
+            number of removed states.
+
+        """
+        accessible: List[bool] = utils.accessible_indices(self)
+        coaccessible: List[bool] = utils.coaccessible_indices(self)
+        useful: List[bool] = [
+            reach and coreach
+            for reach, coreach in zip(accessible, coaccessible)
+        ]
+        useful[0] = True
+        useful_names: Set[str] = {
+            state.name
+            for state, keep in zip(self.states, useful)
+            if keep
+        }
+
+        new_states: List[State] = []
+        for state, keep in zip(self.states, useful):
+            if not keep:
+                continue
+            new_state = State(name=state.name, is_final=state.is_final)
+            new_state.add_transitions([
+                Transition(symbol=transition.symbol, state=transition.state)
+                for transition in state.transitions
+                if transition.state in useful_names
+            ])
+            new_states.append(new_state)
+
+        unreachable = accessible.count(False)
+        report = TrimReport(
+            unreachable=unreachable,
+            dead=len(self.states) - len(new_states) - unreachable,
+        )
+        return FiniteAutomaton(new_states), report
+
+    def reverse(self) -> 'FiniteAutomaton':
+        """
+        Return an automaton that accepts the reversed strings.
+
+        Every transition is flipped, the old initial state becomes the
+        only final state and a new initial state has lambda transitions
+        to the old final states.
+
+        Returns:
+            Automaton of the reversed language.
+
+        """
+        initial_name = 'start'
+        while initial_name in self.name2state:
+            initial_name = '_' + initial_name
+
+        initial_state = State(name=initial_name, is_final=False)
+        initial_state.add_transitions([
+            Transition(symbol=None, state=state.name)
+            for state in self.final_states
+        ])
+
+        new_states: Dict[str, State] = {
+            state.name: State(name=state.name, is_final=False)
+            for state in self.states
+        }
+        new_states[self.states[0].name].is_final = True
+
+        reversed_transitions: Dict[str, List[Transition]] = {
+            state.name: [] for state in self.states
+        }
+        for state in self.states:
+            for transition in state.transitions:
+                reversed_transitions[transition.state].append(
+                    Transition(symbol=transition.symbol, state=state.name)
+                )
+        for name, transitions in reversed_transitions.items():
+            new_states[name].add_transitions(transitions)
+
+        return FiniteAutomaton([initial_state] + list(new_states.values()))
+
+    def to_deterministic(
+        self,
+        trim: bool = False,
+        max_states: Optional[int] = None,
+        max_seconds: Optional[float] = None,
+        stats: Optional[CompilationStats] = None,
+        complete: bool = True,
+    ) -> 'FiniteAutomaton':
         """
         Return an equivalent deterministic automaton.
 
+        Args:
+            trim: Whether to remove the useless states of the
+                automaton before the subset construction.
+            max_states: Maximum number of states of the deterministic
+                automaton. ``None`` for no limit.
+            max_seconds: Maximum time spent in the subset construction.
+                ``None`` for no limit.
+            stats: Where to record the statistics of the construction.
+            complete: Whether to add a non-final state (the empty
+                set of states) that receives the missing transitions.
+                If ``False``, the automaton is partial: a missing
+                transition rejects the string.
+
         Returns:
             Equivalent deterministic automaton.
+
+        Raises:
+            DeterminizationBudgetExceeded: If one of the limits is exceeded.
         """
-        alphabet: Set[str] = utils.alphabet(self.states)
-        closures: Dict[State, FrozenSet[State]] = utils.compute_closures(self)
+        if trim:
+            return self.trim()[0].to_deterministic(
+                max_states=max_states,
+                max_seconds=max_seconds,
+                stats=stats,
+                complete=complete,
+            )
+
+        closures: Dict[State, FrozenSet[State]] = utils.compute_closures(self, stats=stats)
+        return self._subset_construction(
+            initial_set=closures[self.states[0]],
+            closures=closures,
+            max_states=max_states,
+            max_seconds=max_seconds,
+            stats=stats,
+            complete=complete,
+        )
+
+    def _subset_construction(
+        self,
+        initial_set: FrozenSet[State],
+        closures: Dict[State, FrozenSet[State]],
+        max_states: Optional[int] = None,
+        max_seconds: Optional[float] = None,
+        stats: Optional[CompilationStats] = None,
+        complete: bool = True,
+        symbols: Optional[Iterable[str]] = None,
+    ) -> 'FiniteAutomaton':
+        '''
+        Builds the deterministic automaton whose initial (new)state 
+        is initial_set, which has to be closed under lambda transitions.
+        The state limit is checked before each (new)state is added,
+        counting the empty set if it is kept, and the time limit
+        after each (new)state is expanded.
+        If not complete, the transitions to the empty set are left out.
+        symbols is the alphabet of the result (by default, the
+        alphabet of self).
+        '''
+        alphabet: Set[str] = set(symbols) if symbols is not None else set(self.alphabet)
+        start_time: float = time.perf_counter()
+        peak_live_states: int = 0
 
         # open_set: contains the visited (new)states, which are frozensets
-        open_set: Set[FrozenSet[State]] = set([closures[self.states[0]]]) 
+        open_set: Set[FrozenSet[State]] = set([initial_set]) 
         # closed_set contains the expanded (new)states, which are frozensets
         closed_set: Set[FrozenSet[State]] = set()
 
         in_construction_automaton: Dict[FrozenSet[State], Dict[str, FrozenSet[State]]] = {}
         empty_set_flag: bool = False
+        # (new)states of the result found so far
+        num_states: int = 0
+
+        def budget_exceeded(elapsed: float) -> DeterminizationBudgetExceeded:
+            if stats is not None:
+                stats.add_time("subset_construction", elapsed)
+                stats.increment("subsets_expanded", len(closed_set))
+                stats.update_peak("live_states", peak_live_states)
+                stats.increment("budget_exceeded")
+            return DeterminizationBudgetExceeded(
+                expanded_states=len(closed_set),
+                pending_states=len(open_set.difference(closed_set)),
+                elapsed=elapsed,
+                max_states=max_states,
+                max_seconds=max_seconds,
+            )
 
         while open_set:
+            peak_live_states = max(peak_live_states, len(open_set) + len(closed_set))
             current_set = open_set.pop() 
+            if current_set in closed_set or (not current_set and empty_set_flag):
+                continue
+
+            # the empty set is kept if complete or if it is the initial (new)state
+            if current_set or complete or not closed_set:
+                if max_states is not None and num_states >= max_states:
+                    raise budget_exceeded(time.perf_counter() - start_time)
+                num_states += 1
+
             if not current_set: 
                 empty_set_flag = True
-            elif current_set not in closed_set:
-                self._to_det_expand_set(
-                    current_set=current_set, 
-                    alphabet=alphabet, 
-                    closures=closures, 
-                    open_set=open_set, 
-                    closed_set=closed_set, 
-                    in_construction_automaton=in_construction_automaton
-                )
+                continue
+
+            self._to_det_expand_set(
+                current_set=current_set, 
+                alphabet=alphabet, 
+                closures=closures, 
+                open_set=open_set, 
+                closed_set=closed_set, 
+                in_construction_automaton=in_construction_automaton
+            )
+            elapsed: float = time.perf_counter() - start_time
+            if max_seconds is not None and elapsed > max_seconds:
+                raise budget_exceeded(elapsed)
 
         # new states:
         new_automaton_states: List[State] = utils.states_from_in_construction_automaton(
             in_construction_automaton=in_construction_automaton,
-            empty_set_flag=empty_set_flag,
-            alphabet=alphabet
+            # the empty set is kept if it is the initial (new)state
+            empty_set_flag=empty_set_flag and (complete or not in_construction_automaton),
+            alphabet=alphabet,
+            complete=complete,
         )        
 
+        if stats is not None:
+            stats.add_time("subset_construction", time.perf_counter() - start_time)
+            stats.increment("subsets_expanded", len(closed_set))
+            stats.update_peak("live_states", peak_live_states)
+            stats.update_peak("deterministic_states", len(new_automaton_states))
+
         return FiniteAutomaton(new_automaton_states)
 
     def _to_det_expand_set(
@@ -221,7 +531,11 @@ class FiniteAutomaton():
         current_set after consuming the symbol.
         '''
         # all possible transitions from current set of states:
-        transitions: List[Transition] = sum([state.transitions for state in current_set], [])
+        transitions: List[Transition] = [
+            transition
+            for state in current_set
+            for transition in state.transitions
+        ]
         # set of states that we can transition to using the symbol:
         next_states_set: Set[State] = set(
             self.name2state[transition.state]
@@ -232,21 +546,161 @@ class FiniteAutomaton():
         # we can transition to with the symbol
         return utils.closure_of_set(states_set=next_states_set, closures=closures)
 
-    def to_minimized(self) -> 'FiniteAutomaton':
+    def to_minimized(
+        self,
+        strategy: str = "moore",
+        stats: Optional[CompilationStats] = None,
+        complete: bool = True,
+    ) -> 'FiniteAutomaton':
         """
         Return a equivalent minimal automaton.
 
+        Args:
+            strategy: Minimization algorithm. One of:
+
+                - ``"moore"``: determinize and refine the partition
+                  until it does not change.
+                - ``"hopcroft"``: determinize and refine the partition
+                  with Hopcroft's worklist algorithm.
+                - ``"brzozowski"``: reverse, determinize, reverse and
+                  determinize again. Avoids building the forward DFA
+                  of the original automaton.
+                - ``"vectorized"``: determinize and refine an array
+                  with the block of each state, grouping the states
+                  by their signature (own block and blocks of the
+                  next states). Uses NumPy if it is installed.
+                - ``"auto"``: choose one of the above depending on
+                  the size and the lambda density of the automaton.
+            stats: Where to record the statistics of the construction.
+            complete: Whether the result has a transition for every
+                symbol in every state. If ``False``, the minimal
+                partial automaton is returned: the states that can
+                not reach a final state are removed (except the
+                initial one) and the transitions to them are missing.
+
         Returns:
             Equivalent minimal automaton.
 
         """
-        return self.to_deterministic()._deterministic_to_minimized()
+        if strategy == "auto":
+            strategy = self._choose_minimization_strategy()
+
+        if strategy == "moore":
+            deterministic = self.to_deterministic(stats=stats, complete=complete)
+            if stats is None:
+                return deterministic._deterministic_to_minimized()
+            with stats.phase("minimization"):
+                return deterministic._deterministic_to_minimized(stats=stats)
+        if strategy == "hopcroft":
+            deterministic = self.to_deterministic(stats=stats, complete=complete)
+            if stats is None:
+                return deterministic._deterministic_to_minimized_hopcroft()
+            with stats.phase("minimization"):
+                return deterministic._deterministic_to_minimized_hopcroft(stats=stats)
+        if strategy == "brzozowski":
+            return self._brzozowski_minimized(stats=stats, complete=complete)
+        if strategy == "vectorized":
+            deterministic = self.to_deterministic(stats=stats, complete=complete)
+            if stats is None:
+                return deterministic._deterministic_to_minimized_vectorized()
+            with stats.phase("minimization"):
+                return deterministic._deterministic_to_minimized_vectorized(stats=stats)
+
+        raise ValueError(f"Unknown minimization strategy '{strategy}'.")
+
+    def _choose_minimization_strategy(self) -> str:
+        '''
+        Heuristic used by to_minimized(strategy="auto"):
+            - deterministic automata still go through the subset
+              construction (to complete them and drop unreachable
+              states), but it is cheap since every subset is a
+              single state, so Hopcroft is chosen.
+            - small automata are minimized with Moore.
+            - automata where most transitions are lambdas (as the ones
+              built by REParser) use Brzozowski, whose determinizations
+              work on the reversed automata.
+            - the rest use Hopcroft.
+        '''
+        transitions: List[Transition] = [
+            transition
+            for state in self.states
+            for transition in state.transitions
+        ]
+        lambdas = sum(1 for transition in transitions if transition.symbol is None)
+
+        if self.is_deterministic:
+            return "hopcroft"
+        if len(self.states) <= 32:
+            return "moore"
+        if 2 * lambdas >= len(transitions):
+            return "brzozowski"
+        return "hopcroft"
+
+    def _brzozowski_minimized(
+        self,
+        stats: Optional[CompilationStats] = None,
+        complete: bool = True,
+    ) -> 'FiniteAutomaton':
+        '''
+        Minimal automaton computed as det(rev(det(rev(self)))).
+        States are renamed to their index after each determinization,
+        so that the names do not grow with every step.
+        The intermediate automaton is partial: the empty set
+        would not be reachable once reversed. As it can lose the
+        symbols that only lead to dead states, the last step uses
+        the alphabet of self.
+        '''
+        reversed_det: FiniteAutomaton = utils.index_names(
+            self._reverse_to_deterministic(stats=stats, complete=False)
+        )
+        minimized = utils.index_names(
+            reversed_det._reverse_to_deterministic(
+                stats=stats,
+                complete=complete,
+                symbols=self.alphabet,
+            )
+        )
+        if stats is not None:
+            stats.update_peak("minimized_states", len(minimized.states))
+        return minimized
+
+    def _reverse_to_deterministic(
+        self,
+        stats: Optional[CompilationStats] = None,
+        complete: bool = True,
+        symbols: Optional[Iterable[str]] = None,
+    ) -> 'FiniteAutomaton':
+        '''
+        Determinization of self.reverse(). The auxiliary initial state 
+        of the reversed automaton is left out of the initial (new)state, 
+        otherwise it would be distinguished from the equivalent set 
+        of the old final states.
+        '''
+        reversed_automaton: FiniteAutomaton = self.reverse()
+        closures: Dict[State, FrozenSet[State]] = utils.compute_closures(
+            reversed_automaton, 
+            stats=stats,
+        )
+        auxiliary_initial: State = reversed_automaton.states[0]
+        return reversed_automaton._subset_construction(
+            initial_set=closures[auxiliary_initial] - {auxiliary_initial},
+            closures=closures,
+            stats=stats,
+            complete=complete,
+            symbols=symbols,
+        )
 
-    def _deterministic_to_minimized(self) -> 'FiniteAutomaton':
+    def _deterministic_to_minimized(
+        self,
+        stats: Optional[CompilationStats] = None,
+    ) -> 'FiniteAutomaton':
         """
         Return a equivalent minimal automaton. 
         self has to be deterministic
 
+        Args:
+            stats: Where to record the number of rounds.
+
         Returns:
             Equivalent minimal automaton.
 
@@ -254,15 +708,21 @@ class FiniteAutomaton():
         accessible_states: List[State] = self._get_accessible_states()
         alphabet: Set[str] = utils.alphabet(states=accessible_states)
         final_states: Set[State] = utils.get_final_states(accessible_states)
+        dead: Optional[State] = utils.implicit_dead_state(accessible_states, alphabet)
+        if dead is not None:
+            accessible_states.append(dead)
         new_partition: Set[FrozenSet[State]] = set([
             frozenset(set(accessible_states).difference(final_states)), 
             frozenset(final_states)
         ])
+        new_partition.discard(frozenset())
         old_partition: Set[FrozenSet[State]] = set()
         
         while old_partition != new_partition:
             old_partition = new_partition
             new_partition = set()
+            if stats is not None:
+                stats.increment("partition_rounds")
             
             for _old_eq_class in old_partition:
                 old_eq_class = set(_old_eq_class)
@@ -277,7 +737,8 @@ class FiniteAutomaton():
                             state1=current_state, 
                             state2=state, 
                             partition=old_partition,
-                            alphabet=alphabet
+                            alphabet=alphabet,
+                            dead=dead,
                         )
                     )
                     # remove from old eq. class the states already
@@ -287,34 +748,206 @@ class FiniteAutomaton():
                     new_partition.add(frozenset(new_eq_class))
 
             
-        states: List[State] = utils.get_states_list_from_partition(self, old_partition)
+        states: List[State] = utils.get_states_list_from_partition(
+            self, 
+            old_partition, 
+            dead=dead,
+        )
         min_automaton: FiniteAutomaton =  FiniteAutomaton(states=states)
+        if stats is not None:
+            stats.update_peak("minimized_states", len(states))
         return min_automaton
 
+    def _deterministic_to_minimized_vectorized(
+        self,
+        stats: Optional[CompilationStats] = None,
+    ) -> 'FiniteAutomaton':
+        """
+        Return a equivalent minimal automaton refining the
+        blocks of all the states at once (see utils.moore_blocks).
+        self has to be deterministic
+
+        Args:
+            stats: Where to record the number of rounds.
+
+        Returns:
+            Equivalent minimal automaton.
+
+        """
+        accessible_states: List[State] = self._get_accessible_states()
+        alphabet: List[str] = sorted(utils.alphabet(states=accessible_states))
+        index: Dict[str, int] = {
+            state.name: position for position, state in enumerate(accessible_states)
+        }
+        column: Dict[str, int] = {symbol: position for position, symbol in enumerate(alphabet)}
+        # -1 is the (implicit) dead state of a partial automaton
+        table: List[List[int]] = []
+        for state in accessible_states:
+            row = [-1] * len(alphabet)
+            for transition in state.transitions:
+                assert transition.symbol is not None
+                row[column[transition.symbol]] = index[transition.state]
+            table.append(row)
+        blocks: List[int] = utils.moore_blocks(
+            table=table,
+            finals=[state.is_final for state in accessible_states],
+            stats=stats,
+        )
+
+        classes: Dict[int, Set[State]] = {}
+        for state, block in zip(accessible_states, blocks):
+            classes.setdefault(block, set()).add(state)
+        partition: Set[FrozenSet[State]] = set(
+            frozenset(eq_class) for eq_class in classes.values()
+        )
+        dead: Optional[State] = None
+        if -1 in classes:
+            dead = utils.implicit_dead_state(accessible_states, alphabet)
+            assert dead is not None
+            partition.remove(frozenset(classes[-1]))
+            partition.add(frozenset(classes[-1] | {dead}))
+
+        states: List[State] = utils.get_states_list_from_partition(self, partition, dead=dead)
+        if stats is not None:
+            stats.update_peak("minimized_states", len(states))
+        return FiniteAutomaton(states=states)
+
+    def _deterministic_to_minimized_hopcroft(
+        self,
+        stats: Optional[CompilationStats] = None,
+    ) -> 'FiniteAutomaton':
+        """
+        Return a equivalent minimal automaton using Hopcroft's algorithm.
+        self has to be deterministic
+
+        Args:
+            stats: Where to record the number of splitters processed.
+
+        Returns:
+            Equivalent minimal automaton.
+
+        """
+        accessible_states: List[State] = self._get_accessible_states()
+        alphabet: List[str] = sorted(utils.alphabet(states=accessible_states))
+        dead: Optional[State] = utils.implicit_dead_state(accessible_states, alphabet)
+        if dead is not None:
+            accessible_states.append(dead)
+        index: Dict[State, int] = {
+            state: position for position, state in enumerate(accessible_states)
+        }
+
+        # predecessors[symbol][state]: states that go to state with symbol
+        predecessors: Dict[str, List[List[int]]] = {
+            symbol: [[] for _ in accessible_states] for symbol in alphabet
+        }
+        for state in accessible_states:
+            for symbol in alphabet:
+                next_state = self._next_state(state, symbol, dead)
+                predecessors[symbol][index[next_state]].append(index[state])
+
+        finals: Set[int] = {
+            index[state] for state in accessible_states if state.is_final
+        }
+        non_finals: Set[int] = set(range(len(accessible_states))) - finals
+        blocks: List[Set[int]] = [block for block in (finals, non_finals) if block]
+        block_of: List[int] = [0] * len(accessible_states)
+        for block_id, block in enumerate(blocks):
+            for state_index in block:
+                block_of[state_index] = block_id
+
+        # worklist of splitters (block, symbol)
+        smallest = min(range(len(blocks)), key=lambda block_id: len(blocks[block_id]))
+        pending: Set[Tuple[int, str]] = (
+            {(smallest, symbol) for symbol in alphabet}
+            if len(blocks) > 1 else set()
+        )
+
+        splitters: int = 0
+        while pending:
+            splitters += 1
+            splitter, symbol = pending.pop()
+            # states that go to the splitter block with the symbol
+            incoming: Dict[int, Set[int]] = {}
+            for target in blocks[splitter]:
+                for origin in predecessors[symbol][target]:
+                    incoming.setdefault(block_of[origin], set()).add(origin)
+
+            for block_id, inside in incoming.items():
+                block = blocks[block_id]
+                if len(inside) == len(block):
+                    continue
+
+                outside = block - inside
+                new_id = len(blocks)
+                if len(inside) <= len(outside):
+                    blocks[block_id], new_block = outside, inside
+                else:
+                    blocks[block_id], new_block = inside, outside
+                blocks.append(new_block)
+                for state_index in new_block:
+                    block_of[state_index] = new_id
+
+                # if (block_id, symbol) was pending, both halves must be;
+                # otherwise it is enough with the smallest one (new_id)
+                pending.update((new_id, other_symbol) for other_symbol in alphabet)
+
+        partition: Set[FrozenSet[State]] = {
+            frozenset(accessible_states[state_index] for state_index in block)
+            for block in blocks
+        }
+        states: List[State] = utils.get_states_list_from_partition(self, partition, dead=dead)
+        if stats is not None:
+            stats.increment("partition_rounds", splitters)
+            stats.update_peak("minimized_states", len(states))
+        return FiniteAutomaton(states=states)
+
     def _transition_function(
         self,
         state: State,
         symbol: str
-    ) -> State:
+    ) -> Optional[State]:
+        '''
+        Next state of a deterministic automaton, or None if 
+        the transition is missing (the automaton is partial).
+        '''
         for transition in state.transitions:
             if transition.symbol == symbol:
                 return self.name2state[transition.state]
-        raise DFAError(f"State {state} does not contain a transition for symbol '{symbol}'.")
+        return None
+
+    def _next_state(
+        self,
+        state: State,
+        symbol: str,
+        dead: Optional[State],
+    ) -> State:
+        '''
+        Next state, where the missing transitions go to the
+        implicit dead state (see utils.implicit_dead_state).
+        '''
+        next_state = self._transition_function(state, symbol)
+        if next_state is not None:
+            return next_state
+        if dead is None:
+            raise DFAError(f"State {state} does not contain a transition for symbol '{symbol}'.")
+        return dead
 
     def _distinguisable(
         self,
         state1: State,
         state2: State,
         partition: Set[FrozenSet[State]],
-        alphabet: Set[str]
+        alphabet: Set[str],
+        dead: Optional[State] = None,
     ) -> bool:
         '''
         Comprueba si dos estados son distinguibles en una partición k.
         partition: partición k-1
+        dead: estado muerto implícito de un autómata parcial
         '''
         for symbol in alphabet:
-            next_state1 = self._transition_function(state1, symbol)
-            next_state2 = self._transition_function(state2, symbol)
+            next_state1 = self._next_state(state1, symbol, dead)
+            next_state2 = self._next_state(state2, symbol, dead)
             if next_state2 not in utils.get_equivalence_class(next_state1, partition):
                 return True
                 
@@ -323,18 +956,157 @@ class FiniteAutomaton():
     def _get_accessible_states(self) -> List[State]:
         '''returns the list of accessible states 
         from the initial state'''
-        open_list: List[State] = [self.states[0]]
-        closed_list: List[State] = []
-        while open_list:
-            current_state: State = open_list.pop()
-            if current_state not in closed_list:
-                closed_list.append(current_state)
-                open_list.extend([
-                    self.name2state[transition.state] 
-                    for transition in current_state.transitions
-                ])
-        return closed_list
+        return list(self.accessible_states)
+
+
+class FrozenTransition(Transition):
+    """Transition that can not be modified (see FrozenAutomaton)."""
+
+    _frozen: bool = False
 
+    def __init__(
+        self,
+        symbol: Optional[str],
+        state: str,
+    ) -> None:
+        super().__init__(symbol, state)
+        self._frozen = True
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if self._frozen:
+            raise AttributeError(f"{type(self).__name__} can not be modified")
+        super().__setattr__(name, value)
+
+
+class FrozenState(State):
+    """
+    State that can not be modified (see FrozenAutomaton).
+
+    Args:
+        name: Name of the state.
+        is_final: Whether the state is a final state or not.
+        transitions: Transitions starting at this state (they are copied).
+
+    """
+
+    transitions: Tuple[Transition, ...]  # type: ignore[assignment]
+    _frozen: bool = False
+
+    def __init__(
+        self,
+        name: str,
+        is_final: bool = False,
+        transitions: Iterable[Transition] = (),
+    ) -> None:
+        super().__init__(name, is_final)
+        self.transitions = tuple(
+            FrozenTransition(symbol=transition.symbol, state=transition.state)
+            for transition in transitions
+        )
+        self._frozen = True
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if self._frozen:
+            raise AttributeError(f"{type(self).__name__} can not be modified")
+        super().__setattr__(name, value)
+
+    def add_transitions(self, transitions: List[Transition]) -> None:
+        """Transitions can not be added to a frozen state."""
+        raise AttributeError(f"{type(self).__name__} can not be modified")
+
+
+class FrozenAutomaton(FiniteAutomaton):
+    """
+    Automaton that can not be modified.
+
+    Its derived properties are computed the first time they are
+    used and then cached, so several algorithms (evaluation,
+    determinization, minimization...) can share them. Use
+    ``FiniteAutomaton.freeze`` to build one and ``thaw`` to get
+    a mutable copy back.
+
+    The states are stored in a tuple, as FrozenState copies whose
+    transitions are FrozenTransition tuples, so that modifying them
+    raises an AttributeError instead of leaving the cached properties
+    stale.
+
+    Args:
+        states: List of states of the automaton. The first state in the 
+                list is the initial state. They are copied.
+
+    """
+
+    states: Tuple[State, ...]  # type: ignore[assignment]
+    _frozen: bool = False
+
+    def __init__(
+        self,
+        states: Iterable[State],
+    ) -> None:
+        super().__init__([
+            FrozenState(
+                name=state.name,
+                is_final=state.is_final,
+                transitions=state.transitions,
+            )
+            for state in states
+        ])
+        self.states = tuple(self.states)
+        self._frozen = True
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if self._frozen:
+            raise AttributeError(f"{type(self).__name__} can not be modified")
+        super().__setattr__(name, value)
+
+    @cached_property
+    def alphabet(self) -> FrozenSet[str]:
+        """Every symbol there is a transition for."""
+        return super().alphabet
+
+    @cached_property
+    def closures(self) -> Dict[State, FrozenSet[State]]:
+        """Lambda closure of each state (see utils.compute_closures)."""
+        return utils.lambda_closures(self)
+
+    @cached_property
+    def final_states(self) -> FrozenSet[State]:
+        """Set of final states."""
+        return super().final_states
+
+    @cached_property
+    def accessible_states(self) -> List[State]:
+        """States reachable from the initial state, in order."""
+        return super().accessible_states
+
+    @cached_property
+    def live_states(self) -> FrozenSet[State]:
+        """States from which a final state can be reached."""
+        return super().live_states
+
+    @cached_property
+    def has_lambdas(self) -> bool:
+        """Whether there is some lambda transition."""
+        return super().has_lambdas
+
+    @cached_property
+    def is_deterministic(self) -> bool:
+        """Whether there are no lambdas nor two transitions with the same origin and symbol."""
+        return super().is_deterministic
+
+    def freeze(self) -> 'FrozenAutomaton':
+        """The automaton is already frozen: return it."""
+        return self
+
+    def thaw(self) -> FiniteAutomaton:
+        """
+        Return a mutable copy of the automaton.
+
+        Returns:
+            Copy of the automaton, with copies of its states.
+
+        """
+        return FiniteAutomaton(utils.copy_states(self.states))
 
 
 class utils:
@@ -357,17 +1129,156 @@ class utils:
         Returns the alphabet of the transitions of all the states.
         That is, every symbol there is a transition for.
         '''
-        # all transitions of every state
-        transitions: List[Transition] = sum(
-            [state.transitions for state in states], 
-            []
-        )
         # the alphabet contains every symbol that appears in a transition 
-        return set(transition.symbol for transition in transitions if transition.symbol)
+        return set(
+            transition.symbol
+            for state in states
+            for transition in state.transitions
+            if transition.symbol
+        )
 
     @staticmethod
-    def compute_closures(
+    def accessible_indices(
+        automaton: FiniteAutomaton
+    ) -> List[bool]:
+        '''
+        Returns, for the index of each state, whether it can be
+        reached from the initial state (BFS over the transitions).
+        '''
+        index: Dict[str, int] = {
+            state.name: position
+            for position, state in enumerate(automaton.states)
+        }
+        visited: List[bool] = [False] * len(automaton.states)
+        visited[0] = True
+        open_list: Deque[int] = deque([0])
+
+        while open_list:
+            current = open_list.popleft()
+            for transition in automaton.states[current].transitions:
+                target = index[transition.state]
+                if not visited[target]:
+                    visited[target] = True
+                    open_list.append(target)
+
+        return visited
+
+    @staticmethod
+    def coaccessible_indices(
+        automaton: FiniteAutomaton
+    ) -> List[bool]:
+        '''
+        Returns, for the index of each state, whether a final
+        state can be reached from it (BFS over the reversed
+        transitions, starting at the final states).
+        '''
+        index: Dict[str, int] = {
+            state.name: position
+            for position, state in enumerate(automaton.states)
+        }
+        predecessors: List[List[int]] = [[] for _ in automaton.states]
+        for origin, state in enumerate(automaton.states):
+            for transition in state.transitions:
+                predecessors[index[transition.state]].append(origin)
+
+        visited: List[bool] = [state.is_final for state in automaton.states]
+        open_list: Deque[int] = deque(
+            position for position, final in enumerate(visited) if final
+        )
+
+        while open_list:
+            current = open_list.popleft()
+            for origin in predecessors[current]:
+                if not visited[origin]:
+                    visited[origin] = True
+                    open_list.append(origin)
+
+        return visited
+
+    @staticmethod
+    def lambda_successors(
         automaton: FiniteAutomaton
+    ) -> List[List[int]]:
+        '''
+        Returns, for the index of each state, the indices of
+        the states reached from it with a lambda transition.
+        '''
+        index: Dict[str, int] = {
+            state.name: position
+            for position, state in enumerate(automaton.states)
+        }
+        return [
+            [
+                index[transition.state]
+                for transition in state.transitions
+                if not transition.symbol
+            ]
+            for state in automaton.states
+        ]
+
+    @staticmethod
+    def lambda_components(
+        automaton: FiniteAutomaton
+    ) -> Tuple[List[int], List[List[int]]]:
+        '''
+        Strongly connected components of the graph of lambda
+        transitions (iterative version of Tarjan's algorithm).
+        Returns the component of the index of each state and
+        the indices of the states of each component. Every
+        component comes after the components reachable from it.
+        '''
+        successors = utils.lambda_successors(automaton)
+        num_states = len(successors)
+        order: List[int] = [-1] * num_states
+        lowlink: List[int] = [0] * num_states
+        component_of: List[int] = [-1] * num_states
+        components: List[List[int]] = []
+        stack: List[int] = []
+        counter = 0
+
+        for root in range(num_states):
+            if order[root] != -1:
+                continue
+            # each frame: (state, position of its next successor)
+            frames: List[Tuple[int, int]] = [(root, 0)]
+            order[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+
+            while frames:
+                current, next_successor = frames[-1]
+                if next_successor < len(successors[current]):
+                    frames[-1] = (current, next_successor + 1)
+                    target = successors[current][next_successor]
+                    if order[target] == -1:
+                        order[target] = lowlink[target] = counter
+                        counter += 1
+                        stack.append(target)
+                        frames.append((target, 0))
+                    elif component_of[target] == -1:
+                        lowlink[current] = min(lowlink[current], order[target])
+                    continue
+
+                frames.pop()
+                if frames:
+                    parent = frames[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[current])
+                if lowlink[current] == order[current]:
+                    members: List[int] = []
+                    while True:
+                        member = stack.pop()
+                        component_of[member] = len(components)
+                        members.append(member)
+                        if member == current:
+                            break
+                    components.append(members)
+
+        return component_of, components
+
+    @staticmethod
+    def compute_closures(
+        automaton: FiniteAutomaton,
+        stats: Optional[CompilationStats] = None,
     ) -> Dict[State, FrozenSet[State]] :
         '''
         Completes a closures dictionary with 
@@ -375,23 +1286,53 @@ class utils:
         The return dict is:
             - Key: state
             - Value: set of states in the key's closure
+        The closures of a FrozenAutomaton are computed
+        only once. If stats is given, the time spent and
+        the sizes of the closures are recorded.
         '''
-        closures: Dict[State, FrozenSet[State]] = {} 
-        for closure_state in automaton.states:
-            closure = set()
-            expanding_states: Set[State] = set([closure_state])
-    
-            while expanding_states:
-                closure.update(expanding_states)
-                visited_states: Set[State] = set(
-                    automaton.name2state[transition.state]
-                    for transition in sum([state.transitions for state in expanding_states],[])
-                    if not transition.symbol and automaton.name2state[transition.state] not in closure
-                )
-                expanding_states = visited_states
-
-            closures[closure_state] = frozenset(closure)
+        if stats is not None:
+            with stats.phase("closures"):
+                measured_closures = utils.compute_closures(automaton)
+            for state_closure in measured_closures.values():
+                stats.observe("closure_size", len(state_closure))
+            return measured_closures
+        if isinstance(automaton, FrozenAutomaton):
+            return automaton.closures
+        return utils.lambda_closures(automaton)
 
+    @staticmethod
+    def lambda_closures(
+        automaton: FiniteAutomaton,
+    ) -> Dict[State, FrozenSet[State]] :
+        '''
+        Computes the closure of each state, without
+        looking at the cache of frozen automata.
+        The strongly connected components of the lambda
+        transitions are collapsed, so all the states of a
+        component share the same closure object, and the
+        closures are propagated over the components in
+        topological order (linear in the transitions plus
+        the size of the closures).
+        '''
+        states = automaton.states
+        component_of, components = utils.lambda_components(automaton)
+        successors = utils.lambda_successors(automaton)
+
+        # Tarjan's algorithm finds each component after all the components
+        # reachable from it, so their closures are already computed
+        component_closures: List[FrozenSet[State]] = []
+        for members in components:
+            closure: Set[State] = set(states[position] for position in members)
+            for position in members:
+                for target in successors[position]:
+                    if component_of[target] != len(component_closures):
+                        closure.update(component_closures[component_of[target]])
+            component_closures.append(frozenset(closure))
+
+        closures: Dict[State, FrozenSet[State]] = {
+            state: component_closures[component_of[position]]
+            for position, state in enumerate(states)
+        }
         return closures
     
     @staticmethod
@@ -442,7 +1383,8 @@ class utils:
     def states_from_in_construction_automaton(
         in_construction_automaton: Dict[FrozenSet[State], Dict[str, FrozenSet[State]]],
         empty_set_flag: bool,
-        alphabet: Set[str]
+        alphabet: Set[str],
+        complete: bool = True,
     )-> List[State]:
         '''
         Receives a dictionary of the form of in_costruction_automaton
@@ -451,6 +1393,9 @@ class utils:
         Dict[str, FrozenSet[State]] into lists of transitions.
         The empty_set_flag indicates if there is any transition to the 
         empty (frozen)set, in which case an 'empty' state will be added.
+        Otherwise, the transitions to the empty set are left out.
+        If not complete, the 'empty' state (only kept when it is the
+        initial state) has no transitions.
         '''
         new_automaton_states: List[State] = []
 
@@ -464,10 +1409,11 @@ class utils:
             while empty_state_name in new_states_names.values():
                 empty_state_name = '_'+empty_state_name
             empty_state = State(name=empty_state_name, is_final=False)
-            empty_state.add_transitions([
-                Transition(symbol=symbol, state=empty_state_name) 
-                for symbol in alphabet
-            ])
+            if complete:
+                empty_state.add_transitions([
+                    Transition(symbol=symbol, state=empty_state_name) 
+                    for symbol in alphabet
+                ])
             new_states_names[frozenset()] = empty_state_name
 
         for states_set, transitions_dict in in_construction_automaton.items():
@@ -476,6 +1422,13 @@ class utils:
                 is_final=any(state.is_final for state in states_set)
             )
             new_automaton_states.append(new_state)
+            if not empty_set_flag:
+                # partial automaton: no transitions to the empty set
+                transitions_dict = {
+                    symbol: next_set
+                    for symbol, next_set in transitions_dict.items()
+                    if next_set
+                }
             new_state.add_transitions(utils.dict_to_transitions(transitions_dict, new_states_names))
 
         if empty_set_flag:
@@ -483,6 +1436,114 @@ class utils:
 
         return new_automaton_states
 
+    @staticmethod
+    def moore_blocks(
+        table: List[List[int]],
+        finals: List[bool],
+        use_numpy: Optional[bool] = None,
+        stats: Optional[CompilationStats] = None,
+    ) -> List[int]:
+        '''
+        Returns the block of each state in the partition of
+        the equivalent states of a complete deterministic
+        automaton (table[state][symbol] is the next state).
+        Each round, the signature of a state is its block
+        and the blocks of its next states, and the states
+        with the same signature form the new blocks. The
+        rounds stop when the number of blocks is stable.
+        With NumPy, a round is one np.unique over the
+        signature matrix. By default, NumPy is used if
+        it is installed.
+        A missing transition (-1) goes to an implicit dead
+        state, and the states equivalent to it get block -1.
+        '''
+        if use_numpy is None:
+            use_numpy = _HAS_NUMPY
+        if not table:
+            return []
+
+        if any(-1 in row for row in table):
+            sink = len(table)
+            completed_blocks = utils.moore_blocks(
+                table=[
+                    [sink if target == -1 else target for target in row]
+                    for row in table
+                ] + [[sink] * len(table[0])],
+                finals=finals + [False],
+                use_numpy=use_numpy,
+                stats=stats,
+            )
+            dead_block = completed_blocks.pop()
+            return [-1 if block == dead_block else block for block in completed_blocks]
+
+        if use_numpy:
+            next_states = np.array(table, dtype=np.int64).reshape(len(table), -1)
+            _, inverse = np.unique(np.array(finals, dtype=np.int64), return_inverse=True)
+            block_array = inverse.reshape(-1)
+            num_blocks = int(block_array.max()) + 1
+            while True:
+                if stats is not None:
+                    stats.increment("partition_rounds")
+                signatures = np.column_stack((block_array, block_array[next_states]))
+                _, inverse = np.unique(signatures, axis=0, return_inverse=True)
+                block_array = inverse.reshape(-1)
+                new_num_blocks = int(block_array.max()) + 1
+                if new_num_blocks == num_blocks:
+                    return [int(block) for block in block_array]
+                num_blocks = new_num_blocks
+
+        blocks: List[int] = [int(final) for final in finals]
+        num_blocks = len(set(blocks))
+        while True:
+            if stats is not None:
+                stats.increment("partition_rounds")
+            signature_blocks: Dict[Tuple[int, ...], int] = {}
+            blocks = [
+                signature_blocks.setdefault(
+                    (blocks[state], *(blocks[target] for target in row)),
+                    len(signature_blocks),
+                )
+                for state, row in enumerate(table)
+            ]
+            if len(signature_blocks) == num_blocks:
+                return blocks
+            num_blocks = len(signature_blocks)
+
+    @staticmethod
+    def copy_states(
+        states: Iterable[State]
+    ) -> List[State]:
+        '''returns copies of the states and of their transitions'''
+        copies: List[State] = []
+        for state in states:
+            copy = State(name=state.name, is_final=state.is_final)
+            copy.transitions = [
+                Transition(symbol=transition.symbol, state=transition.state)
+                for transition in state.transitions
+            ]
+            copies.append(copy)
+        return copies
+
+    @staticmethod
+    def index_names(
+        automaton: FiniteAutomaton
+    ) -> FiniteAutomaton:
+        '''returns a copy of the automaton where each 
+        state is named after its position in the list'''
+        new_names: Dict[str, str] = {
+            state.name: str(position)
+            for position, state in enumerate(automaton.states)
+        }
+        states: List[State] = []
+        for state in automaton.states:
+            new_state = State(name=new_names[state.name], is_final=state.is_final)
+            new_state.add_transitions([
+                Transition(symbol=transition.symbol, state=new_names[transition.state])
+                for transition in state.transitions
+            ])
+            states.append(new_state)
+        return FiniteAutomaton(states)
+
     @staticmethod
     def get_equivalence_class(
         state: State,       
@@ -505,33 +1566,69 @@ class utils:
         names.sort()
         return names[0]
         
+    @staticmethod
+    def implicit_dead_state(
+        states: List[State],
+        alphabet: Iterable[str],
+    ) -> Optional[State]:
+        '''
+        If some state has no transition for some symbol (the
+        automaton is partial), returns a new non-final state
+        without transitions, with a name not used by the states,
+        that stands for the target of the missing transitions.
+        Returns None if the automaton is complete.
+        '''
+        symbols = set(alphabet)
+        if all(
+            {transition.symbol for transition in state.transitions} >= symbols
+            for state in states
+        ):
+            return None
+
+        names: Set[str] = {state.name for state in states}
+        name = 'empty'
+        while name in names:
+            name = '_' + name
+        return State(name=name, is_final=False)
+
     @staticmethod
     def get_states_list_from_partition(
         automaton: FiniteAutomaton,
-        partition: Set[FrozenSet[State]]
+        partition: Set[FrozenSet[State]],
+        dead: Optional[State] = None,
     )-> List[State]:
         '''receives the partition and returns the 
         corresponding transformation to list of states
-        with its transitions'''
+        with its transitions.
+        The class of the implicit dead state (if any) is 
+        left out, together with the transitions to it, 
+        unless it contains the initial state'''
+        if dead is not None:
+            dead_class = utils.get_equivalence_class(dead, partition)
+            if automaton.states[0] in dead_class:
+                # no string is accepted
+                return [State(name=automaton.states[0].name, is_final=False)]
+            partition = partition - {dead_class}
+
         states: List[State] = []
+        class_names: Dict[State, str] = {}
+        for eq_class in partition:
+            name = utils.get_state_name_from_equivalence_class(eq_class)
+            class_names.update((state, name) for state in eq_class)
         
         for eq_class in partition:
             state_representative, *_ = eq_class
             state: State = State(   
-                name = utils.get_state_name_from_equivalence_class(eq_class),
+                name = class_names[state_representative],
                 is_final = state_representative.is_final,
             )
             state.add_transitions([
                 Transition(
                     symbol = transition.symbol,
-                    state = utils.get_state_name_from_equivalence_class(
-                        utils.get_equivalence_class(
-                            state = automaton.name2state[transition.state],
-                            partition = partition
-                        )
-                    )
+                    state = class_names[automaton.name2state[transition.state]]
                 )
                 for transition in state_representative.transitions
+                if automaton.name2state[transition.state] in class_names
             ])
 
             # the first state has to remain the same
@@ -542,6 +1639,24 @@ class utils:
         
         return states
 
+class TrimReport(NamedTuple):
+    """
+    Number of states removed by FiniteAutomaton.trim.
+
+    Args:
+        unreachable: States not reachable from the initial state.
+        dead: Reachable states from which no final state is reachable.
+
+    """
+
+    unreachable: int
+    dead: int
+
+    @property
+    def removed(self) -> int:
+        """Total number of removed states."""
+        return self.unreachable + self.dead
+
 class PartitionError(Exception):
     """
     Exception used when a state does not have an equivalence class
@@ -551,4 +1666,43 @@ class DFAError(Exception):
     """
     Exception used when a suposedly deterministic automaton is not 
     deterministic (there is no transition for a symbol)
-    """
\ No newline at end of file
+    """
+
+class DeterminizationBudgetExceeded(Exception):
+    """
+    Exception used when the subset construction exceeds the maximum 
+    number of states or the maximum time allowed.
+
+    Args:
+        expanded_states: Number of (new)states already expanded.
+        pending_states: Number of (new)states found but not expanded yet.
+        elapsed: Seconds spent in the subset construction.
+        max_states: Maximum number of states allowed.
+        max_seconds: Maximum number of seconds allowed.
+
+    """
+
+    expanded_states: int
+    pending_states: int
+    elapsed: float
+    max_states: Optional[int]
+    max_seconds: Optional[float]
+
+    def __init__(
+        self,
+        expanded_states: int,
+        pending_states: int,
+        elapsed: float,
+        max_states: Optional[int],
+        max_seconds: Optional[float],
+    ) -> None:
+        super().__init__(
+            f"Determinization stopped after expanding {expanded_states} states "
+            f"({pending_states} pending) in {elapsed:.3f}s "
+            f"(max_states={max_states}, max_seconds={max_seconds})."
+        )
+        self.expanded_states = expanded_states
+        self.pending_states = pending_states
+        self.elapsed = elapsed
+        self.max_states = max_states
+        self.max_seconds = max_seconds
@@ -1,38 +1,119 @@
 """Evaluation of automata."""
-from typing import Set, Dict, FrozenSet
+from typing import Set, Dict, FrozenSet, List, Optional
 
-from automata.automaton import FiniteAutomaton, State, utils
+from automata.automaton import (
+    DeterminizationBudgetExceeded,
+    FiniteAutomaton,
+    State,
+)
+from automata.literals import RequiredLiterals
 
 class FiniteAutomatonEvaluator():
     """
     Definition of an automaton evaluator.
 
+    If the automaton is deterministic, the evaluator keeps a single
+    current state (its index, ``-1`` if there is none) and follows
+    the transitions with a dictionary lookup per symbol.
+
     Args:
         automaton: Automaton to evaluate.
+        trim: Whether to remove the useless states of the automaton
+            before evaluating it.
+        literals: Literals required by the strings accepted by the
+            automaton (see ``required_literals``). If given, accepts
+            checks them before evaluating a string from the initial
+            state, and rejects it without reading it if they fail.
 
     Attributes:
         current_states: Set of current states of the automaton.
+            For deterministic automata it is built from the current
+            state each time it is read (modifying it has no effect,
+            it has to be assigned).
 
     """
 
     automaton: FiniteAutomaton
-    current_states: Set[State]
+    literals: Optional[RequiredLiterals]
 
     closures: Dict[State, FrozenSet[State]]
     _alphabet: Set[str]
+    _has_lambdas: bool
+    _live_states: FrozenSet[State]
+    _current_states: Set[State]
+    _initial_states: FrozenSet[State]
+
+    # deterministic engine
+    _deterministic: bool
+    _current: int
+    _index: Dict[State, int]
+    _next: List[Dict[str, int]]
+    _finals: List[bool]
+    _live: List[bool]
 
-    def __init__(self, automaton: FiniteAutomaton) -> None:
+    def __init__(
+        self,
+        automaton: FiniteAutomaton,
+        trim: bool = False,
+        literals: Optional[RequiredLiterals] = None,
+    ) -> None:
+        if trim:
+            automaton, _ = automaton.trim()
         self.automaton = automaton
+        self.literals = literals if literals is not None and not literals.is_trivial else None
         current_states: Set[State] = {
             self.automaton.states[0],  
         }
-        self._alphabet = utils.alphabet(automaton.states)
+        self._alphabet = set(automaton.alphabet)
         # self.closures is a dictionary that contains states as keys, and the set of states in its closure as values
-        self.closures = utils.compute_closures(automaton)
+        self.closures = automaton.closures
+        self._has_lambdas = automaton.has_lambdas
+        self._live_states = automaton.live_states
+
+        self._deterministic = automaton.is_deterministic
+        if self._deterministic:
+            self._index = {
+                state: position for position, state in enumerate(automaton.states)
+            }
+            self._next = [
+                {
+                    transition.symbol: self._index[self._get_state(transition.state)]
+                    for transition in state.transitions
+                    if transition.symbol is not None
+                }
+                for state in automaton.states
+            ]
+            self._finals = [state.is_final for state in automaton.states]
+            self._live = [state in self._live_states for state in automaton.states]
+            self._current = 0
 
         self._complete_lambdas(current_states)
+        self._initial_states = frozenset(current_states)
         self.current_states = current_states
 
+    @property
+    def current_states(self) -> Set[State]:
+        """Set of current states of the automaton."""
+        if self._deterministic:
+            return {self.automaton.states[self._current]} if self._current != -1 else set()
+        return self._current_states
+
+    @current_states.setter
+    def current_states(self, states: Set[State]) -> None:
+        if self._deterministic:
+            if len(states) <= 1:
+                self._current = self._state_index(next(iter(states))) if states else -1
+                return
+            # several current states: back to the general engine
+            self._deterministic = False
+        self._current_states = states
+
+
+    def _state_index(self, state: State) -> int:
+        index = self._index.get(state)
+        if index is None:
+            raise ValueError(f"State {state.name} is not in the automaton")
+        return index
 
     def process_symbol(self, symbol: str) -> None:
         """
@@ -45,6 +126,11 @@ class FiniteAutomatonEvaluator():
         if symbol not in self._alphabet:
             raise InvalidSymbol(f"'{symbol}' is not in the alphabet.")
 
+        if self._deterministic:
+            if self._current != -1:
+                self._current = self._next[self._current].get(symbol, -1)
+            return
+
         new_states: set[State] = set()
 
         for state in self.current_states:
@@ -67,6 +153,9 @@ class FiniteAutomatonEvaluator():
         Args:
             set_to_complete: Current set of states to be completed.
         """
+        if not self._has_lambdas:
+            return
+
         completed: Set[State] = set()
 
         for state in set_to_complete:
@@ -78,20 +167,62 @@ class FiniteAutomatonEvaluator():
         """
         Process a full string of symbols.
 
+        The processing stops as soon as no current state can reach
+        a final state (see is_dead), since the string will be rejected.
+
         Args:
             string: String to process.
 
         """
+        if self._deterministic:
+            self._process_string_deterministic(string)
+            return
+
         for symbol in string:
+            if self.is_dead():
+                break
             self.process_symbol(symbol)
 
+    def _process_string_deterministic(self, string: str) -> None:
+        current = self._current
+        next_states = self._next
+        live = self._live
+        try:
+            for symbol in string:
+                if current == -1 or not live[current]:
+                    break
+                next_state = next_states[current].get(symbol)
+                if next_state is None:
+                    if symbol not in self._alphabet:
+                        raise InvalidSymbol(f"'{symbol}' is not in the alphabet.")
+                    next_state = -1
+                current = next_state
+        finally:
+            self._current = current
+
+    def is_dead(self) -> bool:
+        """
+        Check if no final state can be reached from the current states,
+        that is, if the string is rejected whatever comes next.
+        """
+        if self._deterministic:
+            return self._current == -1 or not self._live[self._current]
+        return self._live_states.isdisjoint(self.current_states)
+
 
 
     def is_accepting(self) -> bool:
         """Check if the current state is an accepting one."""
+        if self._deterministic:
+            return self._current != -1 and self._finals[self._current]
         return any(state.is_final for state in self.current_states)
         
 
+    def _at_initial_state(self) -> bool:
+        if self._deterministic:
+            return self._current == 0
+        return self._current_states == self._initial_states
+
     def accepts(self, string: str) -> bool:
         """
         Return if a string is accepted without changing state.
@@ -99,6 +230,20 @@ class FiniteAutomatonEvaluator():
         Note: This function is NOT thread-safe.
 
         """
+        if self.literals is not None and self._at_initial_state():
+            if not self.literals.may_match(string):
+                return False
+
+        if self._deterministic:
+            old_current = self._current
+            try:
+                self._process_string_deterministic(string)
+                return self.is_accepting()
+            except InvalidSymbol:
+                return False # if there is an error while processing
+            finally:
+                self._current = old_current
+
         old_states = self.current_states
         try:
             self.process_string(string)
@@ -111,6 +256,361 @@ class FiniteAutomatonEvaluator():
         return accepted
 
 
+class LazyDFAEvaluator(FiniteAutomatonEvaluator):
+    """
+    Evaluator that builds the deterministic automaton on the fly.
+
+    Each transition between sets of states is computed the first
+    time it is needed and cached. When the cache holds too many sets
+    of states it is emptied, so the memory used is bounded.
+
+    Args:
+        automaton: Automaton to evaluate.
+        trim: Whether to remove the useless states of the automaton
+            before evaluating it.
+        max_cached_states: Maximum number of sets of states cached.
+        literals: Literals required by the accepted strings.
+
+    Attributes:
+        current_states: Set of current states of the automaton.
+
+    """
+
+    max_cached_states: int
+    _cache: Dict[FrozenSet[State], Dict[str, FrozenSet[State]]]
+
+    def __init__(
+        self,
+        automaton: FiniteAutomaton,
+        trim: bool = False,
+        max_cached_states: int = 10000,
+        literals: Optional[RequiredLiterals] = None,
+    ) -> None:
+        super().__init__(automaton, trim=trim, literals=literals)
+        self.max_cached_states = max_cached_states
+        self._cache = {}
+
+    def _next_states(self, current: FrozenSet[State], symbol: str) -> FrozenSet[State]:
+        transitions = self._cache.get(current)
+        if transitions is None:
+            if len(self._cache) >= self.max_cached_states:
+                self._cache.clear()
+            transitions = self._cache[current] = {}
+
+        next_states = transitions.get(symbol)
+        if next_states is None:
+            if symbol not in self._alphabet:
+                raise InvalidSymbol(f"'{symbol}' is not in the alphabet.")
+            new_states: Set[State] = {
+                self._get_state(transition.state)
+                for state in current
+                for transition in state.transitions
+                if transition.symbol == symbol
+            }
+            self._complete_lambdas(new_states)
+            next_states = transitions[symbol] = frozenset(new_states)
+
+        return next_states
+
+    def process_symbol(self, symbol: str) -> None:
+        """
+        Process one symbol.
+
+        Args:
+            symbol: Symbol to consume.
+
+        """
+        self.current_states = set(
+            self._next_states(frozenset(self.current_states), symbol)
+        )
+
+    def process_string(self, string: str) -> None:
+        """
+        Process a full string of symbols.
+
+        Args:
+            string: String to process.
+
+        """
+        current: FrozenSet[State] = frozenset(self.current_states)
+        try:
+            for symbol in string:
+                if self._live_states.isdisjoint(current):
+                    break
+                current = self._next_states(current, symbol)
+        finally:
+            self.current_states = set(current)
+
+
+class BackwardEvaluator(FiniteAutomatonEvaluator):
+    """
+    Evaluator that reads the strings from right to left.
+
+    It evaluates the reverse of the automaton, so the strings
+    accepted are the same as in the original one. The evaluation
+    stops as soon as no current state is live (see is_dead), which makes
+    patterns with selective suffixes reject early.
+
+    Args:
+        automaton: Automaton to evaluate (not reversed).
+        trim: Whether to remove the useless states of the reversed
+            automaton before evaluating it.
+        literals: Literals required by the accepted strings.
+
+    Attributes:
+        current_states: Set of current states of the reversed automaton.
+
+    """
+
+    def __init__(
+        self,
+        automaton: FiniteAutomaton,
+        trim: bool = False,
+        literals: Optional[RequiredLiterals] = None,
+    ) -> None:
+        super().__init__(automaton.reverse(), trim=trim, literals=literals)
+
+    def process_string(self, string: str) -> None:
+        """
+        Process a full string of symbols, starting at the last one.
+
+        Args:
+            string: String to process.
+
+        """
+        for symbol in reversed(string):
+            if self.is_dead():
+                break
+            self.process_symbol(symbol)
+
+
+class BitParallelEvaluator():
+    """
+    Evaluator of lambda-free automata that stores the set of
+    current states as the bits of an integer (bit ``i`` is the
+    ``i``-th state of the automaton).
+
+    If every transition goes from a state to itself or to the next
+    one (the automata of plain concatenations, possibly with starred
+    symbols), each symbol costs one shift and a couple of masks
+    (Shift-And). Otherwise, the successors of the current set are
+    looked up in tables indexed by each byte of the integer.
+
+    Args:
+        automaton: Lambda-free automaton to evaluate.
+        trim: Whether to remove the useless states of the automaton
+            before evaluating it.
+
+    Attributes:
+        current_mask: Bits of the current states of the automaton.
+
+    """
+
+    automaton: FiniteAutomaton
+    current_mask: int
+
+    _alphabet: Set[str]
+    _final_mask: int
+    _live_mask: int
+    _linear: bool
+    _shift_masks: Dict[str, int]
+    _loop_masks: Dict[str, int]
+    _byte_tables: Dict[str, List[List[int]]]
+
+    def __init__(self, automaton: FiniteAutomaton, trim: bool = False) -> None:
+        if trim:
+            automaton, _ = automaton.trim()
+        self.automaton = automaton
+        index: Dict[str, int] = {
+            state.name: position
+            for position, state in enumerate(automaton.states)
+        }
+        transitions = [
+            (index[state.name], transition.symbol, index[transition.state])
+            for state in automaton.states
+            for transition in state.transitions
+        ]
+        if any(symbol is None for _, symbol, _ in transitions):
+            raise ValueError("The automaton has lambda transitions")
+
+        self._alphabet = set(automaton.alphabet)
+        live_states = automaton.live_states
+        self._live_mask = sum(
+            1 << position
+            for position, state in enumerate(automaton.states)
+            if state in live_states
+        )
+        self._final_mask = sum(
+            1 << position
+            for position, state in enumerate(automaton.states)
+            if state.is_final
+        )
+        self._linear = all(
+            target in (origin, origin + 1)
+            for origin, _, target in transitions
+        )
+
+        self._shift_masks = {symbol: 0 for symbol in self._alphabet}
+        self._loop_masks = {symbol: 0 for symbol in self._alphabet}
+        self._byte_tables = {}
+        if self._linear:
+            for origin, symbol, target in transitions:
+                assert symbol is not None
+                if target == origin:
+                    self._loop_masks[symbol] |= 1 << origin
+                else:
+                    self._shift_masks[symbol] |= 1 << target
+        else:
+            successors: Dict[str, List[int]] = {
+                symbol: [0] * len(automaton.states)
+                for symbol in self._alphabet
+            }
+            for origin, symbol, target in transitions:
+                assert symbol is not None
+                successors[symbol][origin] |= 1 << target
+            for symbol in self._alphabet:
+                self._byte_tables[symbol] = self._build_byte_tables(
+                    successors[symbol],
+                )
+
+        self.current_mask = 1
+
+    @staticmethod
+    def _build_byte_tables(successors: List[int]) -> List[List[int]]:
+        """
+        Build, for every group of 8 states, the table that maps
+        each subset of the group (a byte) to the union of the
+        successors of its states.
+        """
+        tables: List[List[int]] = []
+        for start in range(0, len(successors), 8):
+            group = successors[start:start + 8]
+            group.extend([0] * (8 - len(group)))
+            table = [0] * 256
+            for byte in range(1, 256):
+                lowest = byte & -byte
+                table[byte] = table[byte ^ lowest] | group[lowest.bit_length() - 1]
+            tables.append(table)
+        return tables
+
+    @property
+    def current_states(self) -> Set[State]:
+        """Set of current states of the automaton."""
+        return {
+            state
+            for position, state in enumerate(self.automaton.states)
+            if self.current_mask >> position & 1
+        }
+
+    def _step(self, mask: int, symbol: str) -> int:
+        if symbol not in self._alphabet:
+            raise InvalidSymbol(f"'{symbol}' is not in the alphabet.")
+
+        if self._linear:
+            return (
+                (mask << 1) & self._shift_masks[symbol]
+                | mask & self._loop_masks[symbol]
+            )
+
+        new_mask = 0
+        for table in self._byte_tables[symbol]:
+            if not mask:
+                break
+            new_mask |= table[mask & 0xFF]
+            mask >>= 8
+        return new_mask
+
+    def process_symbol(self, symbol: str) -> None:
+        """
+        Process one symbol.
+
+        Args:
+            symbol: Symbol to consume.
+
+        """
+        self.current_mask = self._step(self.current_mask, symbol)
+
+    def process_string(self, string: str) -> None:
+        """
+        Process a full string of symbols.
+
+        Args:
+            string: String to process.
+
+        """
+        mask = self.current_mask
+        try:
+            for symbol in string:
+                if not mask & self._live_mask:
+                    break
+                mask = self._step(mask, symbol)
+        finally:
+            self.current_mask = mask
+
+    def is_accepting(self) -> bool:
+        """Check if the current state is an accepting one."""
+        return bool(self.current_mask & self._final_mask)
+
+    def is_dead(self) -> bool:
+        """Check if no final state can be reached from the current states."""
+        return not self.current_mask & self._live_mask
+
+    def accepts(self, string: str) -> bool:
+        """
+        Return if a string is accepted without changing state.
+
+        Note: This function is NOT thread-safe.
+
+        """
+        old_mask = self.current_mask
+        try:
+            self.process_string(string)
+            accepted = self.is_accepting()
+        except InvalidSymbol:
+            accepted = False # if there is an error while processing
+        finally:
+            self.current_mask = old_mask
+
+        return accepted
+
+
+def build_evaluator(
+    automaton: FiniteAutomaton,
+    max_states: Optional[int] = None,
+    max_seconds: Optional[float] = None,
+    lazy: bool = True,
+    literals: Optional[RequiredLiterals] = None,
+) -> FiniteAutomatonEvaluator:
+    """
+    Build an evaluator of the deterministic automaton, if it can be
+    built within the limits, or of the original automaton otherwise.
+
+    Args:
+        automaton: Automaton to evaluate.
+        max_states: Maximum number of states of the deterministic automaton.
+        max_seconds: Maximum time spent building the deterministic automaton.
+        lazy: When the limits are exceeded, whether to return a
+            LazyDFAEvaluator (``True``) or a FiniteAutomatonEvaluator
+            of the original automaton (``False``).
+        literals: Literals required by the accepted strings.
+
+    Returns:
+        Evaluator for the automaton.
+
+    """
+    try:
+        deterministic = automaton.to_deterministic(
+            max_states=max_states,
+            max_seconds=max_seconds,
+        )
+    except DeterminizationBudgetExceeded:
+        if lazy:
+            return LazyDFAEvaluator(automaton, literals=literals)
+        return FiniteAutomatonEvaluator(automaton, literals=literals)
+
+    return FiniteAutomatonEvaluator(deterministic, literals=literals)
+
+
 class InvalidSymbol(Exception):
     """
     Exception used when the processed symbol 
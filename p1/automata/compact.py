@@ -0,0 +1,338 @@
+"""Compact (integer indexed) representation of deterministic automata."""
+import re
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Pattern,
+)
+
+from automata.automaton import FiniteAutomaton, State, Transition, DFAError, utils
+from automata.stats import CompilationStats
+
+
+class CompactDFA():
+    """
+    Table representation of a deterministic automaton.
+
+    States are numbered ``0..n-1`` (``0`` is the initial state) and
+    symbols are numbered following the sorted alphabet, so that
+    ``table[state][symbol_index[symbol]]`` is the next state. In a
+    partial automaton, ``-1`` stands for a missing transition.
+
+    Args:
+        alphabet: Symbols of the automaton.
+        table: Transition table, one row per state and one column
+            per symbol of the alphabet.
+        finals: Whether each state is final or not.
+        names: Name of each state (used when converting back to
+            a FiniteAutomaton). Defaults to the state indexes.
+
+    """
+
+    # minimum fraction of the alphabet a state has to loop on to be skipped
+    SKIP_MIN_LOOP_RATIO: float = 0.5
+
+    alphabet: List[str]
+    symbol_index: Dict[str, int]
+    table: List[List[int]]
+    finals: List[bool]
+    names: List[str]
+    _skip_patterns: Optional[List[Optional[Pattern[str]]]]
+    _has_skip_patterns: bool
+
+    def __init__(
+        self,
+        alphabet: List[str],
+        table: List[List[int]],
+        finals: List[bool],
+        names: Optional[List[str]] = None,
+    ) -> None:
+        if len(table) != len(finals):
+            raise ValueError(
+                "The table and the final flags have different lengths",
+            )
+        if any(len(row) != len(alphabet) for row in table):
+            raise ValueError(
+                "Every row of the table needs one entry per symbol",
+            )
+
+        self.alphabet = list(alphabet)
+        self.symbol_index = {
+            symbol: index for index, symbol in enumerate(self.alphabet)
+        }
+        self.table = table
+        self.finals = finals
+        self.names = (
+            names if names is not None
+            else [str(index) for index in range(len(table))]
+        )
+        self._skip_patterns = None
+        self._has_skip_patterns = False
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"alphabet={self.alphabet!r}, "
+            f"table={self.table!r}, "
+            f"finals={self.finals!r})"
+        )
+
+    @property
+    def num_states(self) -> int:
+        """Number of states of the automaton."""
+        return len(self.table)
+
+    @classmethod
+    def from_automaton(
+        cls,
+        automaton: FiniteAutomaton,
+        complete: bool = True,
+    ) -> 'CompactDFA':
+        """
+        Build the table of a deterministic automaton.
+
+        Args:
+            automaton: Deterministic automaton.
+            complete: Whether every transition has to be defined.
+                If ``False``, missing transitions are stored as ``-1``.
+
+        Returns:
+            Equivalent compact automaton, with the same state order.
+
+        """
+        index: Dict[str, int] = {
+            state.name: position
+            for position, state in enumerate(automaton.states)
+        }
+        alphabet = sorted(
+            {t.symbol for s in automaton.states for t in s.transitions if t.symbol}
+        )
+        symbol_index = {symbol: i for i, symbol in enumerate(alphabet)}
+
+        table: List[List[int]] = []
+        for state in automaton.states:
+            row = [-1] * len(alphabet)
+            for transition in state.transitions:
+                if transition.symbol is None:
+                    raise DFAError(f"State {state.name} has a lambda transition.")
+                column = symbol_index[transition.symbol]
+                if row[column] != -1:
+                    raise DFAError(
+                        f"State {state.name} has several transitions "
+                        f"for symbol '{transition.symbol}'."
+                    )
+                row[column] = index[transition.state]
+            if complete and -1 in row:
+                raise DFAError(
+                    f"State {state.name} does not contain a transition for "
+                    f"symbol '{alphabet[row.index(-1)]}'."
+                )
+            table.append(row)
+
+        return cls(
+            alphabet=alphabet,
+            table=table,
+            finals=[state.is_final for state in automaton.states],
+            names=[state.name for state in automaton.states],
+        )
+
+    def to_automaton(self) -> FiniteAutomaton:
+        """
+        Convert the table back to a FiniteAutomaton.
+
+        Returns:
+            Equivalent automaton, with the same state order.
+
+        """
+        states: List[State] = []
+        for row, is_final, name in zip(self.table, self.finals, self.names):
+            state = State(name=name, is_final=is_final)
+            state.add_transitions([
+                Transition(symbol=symbol, state=self.names[target])
+                for symbol, target in zip(self.alphabet, row)
+                if target != -1
+            ])
+            states.append(state)
+
+        return FiniteAutomaton(states)
+
+    def completed(self) -> 'CompactDFA':
+        """
+        Return an equivalent complete automaton.
+
+        Returns:
+            The automaton itself if it has no missing transitions.
+            Otherwise, a copy where they go to a new non-final sink
+            state, added at the end.
+
+        """
+        if not any(-1 in row for row in self.table):
+            return self
+
+        sink = self.num_states
+        sink_name = "sink"
+        while sink_name in self.names:
+            sink_name = "_" + sink_name
+        return CompactDFA(
+            alphabet=self.alphabet,
+            table=[
+                [sink if target == -1 else target for target in row]
+                for row in self.table
+            ] + [[sink] * len(self.alphabet)],
+            finals=self.finals + [False],
+            names=self.names + [sink_name],
+        )
+
+    def minimized(
+        self,
+        use_numpy: Optional[bool] = None,
+        stats: Optional[CompilationStats] = None,
+    ) -> 'CompactDFA':
+        """
+        Return the equivalent minimal automaton.
+
+        The blocks of equivalent states are found with
+        ``utils.moore_blocks`` (vectorized with NumPy if it is
+        installed). Every state has to be reachable from state 0.
+        A partial automaton gives a partial automaton, where the
+        states that can not reach a final state are removed.
+
+        Args:
+            use_numpy: Whether to use NumPy. By default, NumPy is
+                used if it is installed.
+            stats: Where to record the number of rounds.
+
+        Returns:
+            Minimal automaton. Each state is named after the first
+            state of its block.
+
+        """
+        blocks = utils.moore_blocks(
+            table=self.table,
+            finals=self.finals,
+            use_numpy=use_numpy,
+            stats=stats,
+        )
+
+        if blocks and blocks[0] == -1:
+            # no string is accepted
+            return CompactDFA(
+                alphabet=self.alphabet,
+                table=[[-1] * len(self.alphabet)],
+                finals=[False],
+                names=self.names[:1],
+            )
+
+        # number the blocks by their first state, so 0 stays initial
+        # (the dead block, -1, is left out)
+        new_index: Dict[int, int] = {-1: -1}
+        representatives: List[int] = []
+        for state, block in enumerate(blocks):
+            if block not in new_index:
+                new_index[block] = len(representatives)
+                representatives.append(state)
+
+        return CompactDFA(
+            alphabet=self.alphabet,
+            table=[
+                [
+                    -1 if target == -1 else new_index[blocks[target]]
+                    for target in self.table[state]
+                ]
+                for state in representatives
+            ],
+            finals=[self.finals[state] for state in representatives],
+            names=[self.names[state] for state in representatives],
+        )
+
+    def skip_patterns(self) -> List[Optional[Pattern[str]]]:
+        """
+        Return, for each state that loops to itself on most symbols,
+        a compiled regex that finds the next symbol that leaves it.
+
+        The regex is the negated class of the loop symbols, so it also
+        finds the symbols outside of the alphabet. The patterns are
+        computed the first time and cached (the table must not change
+        afterwards).
+
+        Returns:
+            Pattern of each state, ``None`` for the states that
+            are not worth skipping.
+
+        """
+        if self._skip_patterns is None:
+            self._skip_patterns = []
+            for state, row in enumerate(self.table):
+                loops = [
+                    symbol
+                    for symbol, target in zip(self.alphabet, row)
+                    if target == state
+                ]
+                if loops and len(loops) >= self.SKIP_MIN_LOOP_RATIO * len(self.alphabet):
+                    self._skip_patterns.append(re.compile(
+                        "[^" + "".join(re.escape(symbol) for symbol in loops) + "]",
+                    ))
+                else:
+                    self._skip_patterns.append(None)
+            self._has_skip_patterns = any(
+                pattern is not None for pattern in self._skip_patterns
+            )
+        return self._skip_patterns
+
+    def accepts(self, string: str) -> bool:
+        """
+        Check if a string is accepted by the automaton.
+
+        Symbols outside of the alphabet and missing transitions
+        reject the string. While in a state that loops on most
+        symbols, the string is scanned with the pattern of the
+        state (see skip_patterns) up to the next symbol that
+        leaves it, instead of stepping symbol by symbol.
+
+        """
+        skip_patterns = self.skip_patterns()
+        if self._has_skip_patterns:
+            return self._accepts_skipping(string, skip_patterns)
+
+        state = 0
+        table = self.table
+        symbol_index = self.symbol_index
+        for symbol in string:
+            column = symbol_index.get(symbol)
+            if column is None:
+                return False
+            state = table[state][column]
+            if state == -1:
+                return False
+
+        return self.finals[state]
+
+    def _accepts_skipping(
+        self,
+        string: str,
+        skip_patterns: List[Optional[Pattern[str]]],
+    ) -> bool:
+        """accepts, jumping over the loops of the states with a pattern."""
+        state = 0
+        table = self.table
+        symbol_index = self.symbol_index
+        position = 0
+        length = len(string)
+        while position < length:
+            pattern = skip_patterns[state]
+            if pattern is not None:
+                match = pattern.search(string, position)
+                if match is None:
+                    break
+                position = match.start()
+
+            column = symbol_index.get(string[position])
+            if column is None:
+                return False
+            state = table[state][column]
+            if state == -1:
+                return False
+            position += 1
+
+        return self.finals[state]
@@ -0,0 +1,206 @@
+"""Minimal acyclic automata (DAWG) of sorted word lists."""
+from collections import deque
+from typing import (
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Tuple,
+)
+
+from automata.automaton import FiniteAutomaton, State, Transition
+from automata.compact import CompactDFA
+
+# final flag and sorted (symbol, child) pairs of a node
+_Signature = Tuple[bool, Tuple[Tuple[str, int], ...]]
+
+
+class DAWGBuilder():
+    """
+    Incremental construction of the minimal deterministic automaton
+    that accepts a finite set of words (Daciuk et al. algorithm).
+
+    The words must be added in lexicographic order. When a word is
+    added, the nodes of the previous word that are not part of the
+    common prefix can no longer change, so each of them is replaced
+    by an equivalent node of the register (the nodes already known
+    to be minimal) or added to it. Only the last word is kept as a
+    trie, and the memory of the replaced nodes is reused.
+
+    Attributes:
+        num_words: Number of different words added.
+
+    """
+
+    num_words: int
+    _children: List[Dict[str, int]]
+    _finals: List[bool]
+    _register: Dict[_Signature, int]
+    _unchecked: List[Tuple[int, str, int]]
+    _free: List[int]
+    _previous: str
+    _finished: bool
+
+    def __init__(self) -> None:
+        self.num_words = 0
+        self._children = [{}]
+        self._finals = [False]
+        self._register = {}
+        # (parent, symbol, child) along the last word, not yet minimized
+        self._unchecked = []
+        self._free = []
+        self._previous = ""
+        self._finished = False
+
+    def add(self, word: str) -> None:
+        """
+        Add a word.
+
+        Args:
+            word: Word to add. It can not be smaller than the
+                previous one (repeated words are ignored).
+
+        """
+        if self._finished:
+            raise ValueError("No words can be added after finish()")
+        if word < self._previous:
+            raise ValueError(
+                f"Words must be added in order: '{word}' after '{self._previous}'",
+            )
+        if self.num_words and word == self._previous:
+            return
+
+        common = 0
+        for symbol, previous_symbol in zip(word, self._previous):
+            if symbol != previous_symbol:
+                break
+            common += 1
+
+        self._minimize(common)
+        node = self._unchecked[-1][2] if self._unchecked else 0
+        for symbol in word[common:]:
+            child = self._new_node()
+            self._children[node][symbol] = child
+            self._unchecked.append((node, symbol, child))
+            node = child
+        self._finals[node] = True
+
+        self._previous = word
+        self.num_words += 1
+
+    def add_words(self, words: Iterable[str]) -> None:
+        """Add every word of a sorted iterable."""
+        for word in words:
+            self.add(word)
+
+    def finish(self) -> None:
+        """Minimize the nodes of the last word. No words can be added afterwards."""
+        self._minimize(0)
+        self._finished = True
+
+    def _new_node(self) -> int:
+        if self._free:
+            node = self._free.pop()
+            self._children[node] = {}
+            self._finals[node] = False
+            return node
+        self._children.append({})
+        self._finals.append(False)
+        return len(self._children) - 1
+
+    def _minimize(self, down_to: int) -> None:
+        """Replace or register the unchecked nodes deeper than down_to."""
+        while len(self._unchecked) > down_to:
+            parent, symbol, child = self._unchecked.pop()
+            signature: _Signature = (
+                self._finals[child],
+                tuple(sorted(self._children[child].items())),
+            )
+            existing = self._register.get(signature)
+            if existing is None:
+                self._register[signature] = child
+            else:
+                self._children[parent][symbol] = existing
+                self._free.append(child)
+
+    def _reachable(self) -> List[int]:
+        """Nodes reachable from the root, in BFS order."""
+        if not self._finished:
+            self.finish()
+        order: List[int] = [0]
+        position: Dict[int, int] = {0: 0}
+        pending: Deque[int] = deque([0])
+        while pending:
+            node = pending.popleft()
+            for _, child in sorted(self._children[node].items()):
+                if child not in position:
+                    position[child] = len(order)
+                    order.append(child)
+                    pending.append(child)
+        return order
+
+    def to_automaton(self) -> FiniteAutomaton:
+        """
+        Return the minimal automaton of the words.
+
+        The automaton is partial: there is no sink state, and the
+        states are named after their BFS order (the initial one is
+        ``0``).
+
+        """
+        order = self._reachable()
+        name = {node: str(position) for position, node in enumerate(order)}
+
+        states: List[State] = []
+        for node in order:
+            state = State(name=name[node], is_final=self._finals[node])
+            state.add_transitions([
+                Transition(symbol=symbol, state=name[child])
+                for symbol, child in self._children[node].items()
+            ])
+            states.append(state)
+        return FiniteAutomaton(states)
+
+    def to_compact(self) -> CompactDFA:
+        """
+        Return the table of the minimal automaton of the words.
+
+        Missing transitions are ``-1`` and the states are numbered
+        in BFS order, as in to_automaton.
+
+        """
+        order = self._reachable()
+        position = {node: index for index, node in enumerate(order)}
+        alphabet = sorted({
+            symbol for node in order for symbol in self._children[node]
+        })
+        column = {symbol: index for index, symbol in enumerate(alphabet)}
+
+        table: List[List[int]] = []
+        for node in order:
+            row = [-1] * len(alphabet)
+            for symbol, child in self._children[node].items():
+                row[column[symbol]] = position[child]
+            table.append(row)
+
+        return CompactDFA(
+            alphabet=alphabet,
+            table=table,
+            finals=[self._finals[node] for node in order],
+        )
+
+
+def build_dawg(words: Iterable[str]) -> FiniteAutomaton:
+    """
+    Return the minimal automaton that accepts exactly some words.
+
+    Args:
+        words: Words, in lexicographic order.
+
+    Returns:
+        Minimal partial deterministic automaton (see DAWGBuilder).
+
+    """
+    builder = DAWGBuilder()
+    builder.add_words(words)
+    return builder.to_automaton()
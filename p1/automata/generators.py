@@ -0,0 +1,240 @@
+"""Seeded generation of random automata and regexes."""
+import random
+import string
+from typing import (
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+)
+
+from automata.automaton import FiniteAutomaton, State, Transition
+
+_BASE_SYMBOLS: str = string.ascii_lowercase + string.ascii_uppercase + string.digits
+# characters with a meaning in the syntax of REParser
+_RESERVED_SYMBOLS: str = "λ*+.()"
+
+
+def symbols(alphabet_size: int) -> List[str]:
+    """
+    Return the symbols used by the generators.
+
+    The first symbols are ASCII letters and digits, followed by
+    code points from U+0100 on, leaving out the operators of
+    REParser (including ``λ``) and the whitespace.
+
+    Args:
+        alphabet_size: Number of symbols.
+
+    Returns:
+        List of ``alphabet_size`` different symbols.
+
+    """
+    alphabet = list(_BASE_SYMBOLS[:alphabet_size])
+    code_point = 0x100
+    while len(alphabet) < alphabet_size:
+        symbol = chr(code_point)
+        if symbol not in _RESERVED_SYMBOLS and not symbol.isspace():
+            alphabet.append(symbol)
+        code_point += 1
+    return alphabet
+
+
+def iter_random_states(
+    num_states: int,
+    alphabet_size: int = 2,
+    transitions_per_state: float = 2.0,
+    lambda_ratio: float = 0.0,
+    final_ratio: float = 0.1,
+    seed: Optional[int] = None,
+) -> Iterator[State]:
+    """
+    Generate the states of a random automaton one by one.
+
+    States are named ``q0``, ``q1``... and ``q0`` is the initial
+    state. Only the state being generated is held in memory.
+
+    Args:
+        num_states: Number of states.
+        alphabet_size: Number of symbols of the alphabet.
+        transitions_per_state: Average number of transitions
+            leaving each state.
+        lambda_ratio: Probability of each transition being a lambda.
+        final_ratio: Probability of each state being final.
+        seed: Seed of the random generator.
+
+    Returns:
+        Iterator over the states, with their transitions.
+
+    """
+    rng = random.Random(seed)
+    alphabet = symbols(alphabet_size)
+    whole = int(transitions_per_state)
+    fraction = transitions_per_state - whole
+
+    for index in range(num_states):
+        state = State(name=f"q{index}", is_final=rng.random() < final_ratio)
+        num_transitions = whole + (1 if rng.random() < fraction else 0)
+        state.add_transitions([
+            Transition(
+                symbol=None if rng.random() < lambda_ratio else rng.choice(alphabet),
+                state=f"q{rng.randrange(num_states)}",
+            )
+            for _ in range(num_transitions)
+        ])
+        yield state
+
+
+def random_automaton(
+    num_states: int,
+    alphabet_size: int = 2,
+    transitions_per_state: float = 2.0,
+    lambda_ratio: float = 0.0,
+    final_ratio: float = 0.1,
+    seed: Optional[int] = None,
+) -> FiniteAutomaton:
+    """
+    Return a random automaton.
+
+    The arguments are the same as in :func:`iter_random_states`.
+
+    """
+    return FiniteAutomaton(list(iter_random_states(
+        num_states=num_states,
+        alphabet_size=alphabet_size,
+        transitions_per_state=transitions_per_state,
+        lambda_ratio=lambda_ratio,
+        final_ratio=final_ratio,
+        seed=seed,
+    )))
+
+
+def write_random_automaton(
+    file: TextIO,
+    num_states: int,
+    alphabet_size: int = 2,
+    transitions_per_state: float = 2.0,
+    lambda_ratio: float = 0.0,
+    final_ratio: float = 0.1,
+    seed: Optional[int] = None,
+) -> None:
+    """
+    Write a random automaton in the format of AutomataFormat.
+
+    Each state is written followed by its transitions, so that the
+    automaton is never held in memory. The arguments are the same
+    as in :func:`iter_random_states`.
+
+    Args:
+        file: Text file where the automaton is written.
+
+    """
+    file.write("Automaton:\n")
+    for state in iter_random_states(
+        num_states=num_states,
+        alphabet_size=alphabet_size,
+        transitions_per_state=transitions_per_state,
+        lambda_ratio=lambda_ratio,
+        final_ratio=final_ratio,
+        seed=seed,
+    ):
+        file.write(f"\t{state.name}{' final' if state.is_final else ''}\n")
+        file.writelines(
+            f"\t{state.name} -{t.symbol if t.symbol is not None else ''}-> {t.state}\n"
+            for t in state.transitions
+        )
+
+
+def _random_regex(
+    rng: random.Random,
+    leaves: int,
+    depth: int,
+    alphabet: List[str],
+    star_ratio: float,
+) -> str:
+    """Random regex with exactly ``leaves`` symbols and at most ``depth`` operators nested."""
+    if leaves == 1:
+        regex = rng.choice(alphabet)
+    elif depth <= 1:
+        # no depth left: flat concatenation or union of the symbols
+        operator = rng.choice(".+")
+        regex = "(" + operator.join(rng.choice(alphabet) for _ in range(leaves)) + ")"
+    else:
+        left = rng.randint(1, leaves - 1)
+        operator = rng.choice(".+")
+        regex = (
+            "("
+            + _random_regex(rng, left, depth - 1, alphabet, star_ratio)
+            + operator
+            + _random_regex(rng, leaves - left, depth - 1, alphabet, star_ratio)
+            + ")"
+        )
+
+    if rng.random() < star_ratio:
+        regex += "*"
+    return regex
+
+
+def random_regex(
+    length: int,
+    depth: int = 4,
+    alphabet_size: int = 2,
+    star_ratio: float = 0.2,
+    seed: Optional[int] = None,
+) -> str:
+    """
+    Return a random regex in the syntax of REParser.
+
+    Args:
+        length: Number of symbols of the regex (without operators).
+        depth: Maximum nesting of operators.
+        alphabet_size: Number of symbols of the alphabet.
+        star_ratio: Probability of each subexpression being starred.
+        seed: Seed of the random generator.
+
+    Returns:
+        Random regex.
+
+    """
+    return next(iter_random_regexes(
+        count=1,
+        length=length,
+        depth=depth,
+        alphabet_size=alphabet_size,
+        star_ratio=star_ratio,
+        seed=seed,
+    ))
+
+
+def iter_random_regexes(
+    count: Optional[int],
+    length: int,
+    depth: int = 4,
+    alphabet_size: int = 2,
+    star_ratio: float = 0.2,
+    seed: Optional[int] = None,
+) -> Iterator[str]:
+    """
+    Generate random regexes in the syntax of REParser.
+
+    Args:
+        count: Number of regexes. ``None`` for an endless stream.
+        length: Number of symbols of each regex (without operators).
+        depth: Maximum nesting of operators.
+        alphabet_size: Number of symbols of the alphabet.
+        star_ratio: Probability of each subexpression being starred.
+        seed: Seed of the random generator.
+
+    Returns:
+        Iterator over the regexes.
+
+    """
+    if length < 1:
+        raise ValueError("The regexes need at least one symbol")
+
+    rng = random.Random(seed)
+    alphabet = symbols(alphabet_size)
+    generated = 0
+    while count is None or generated < count:
+        yield _random_regex(rng, length, depth, alphabet, star_ratio)
+        generated += 1
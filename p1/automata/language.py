@@ -0,0 +1,457 @@
+"""Analysis of the language accepted by deterministic automata."""
+from collections import deque
+import random
+from typing import (
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from automata.automaton import FiniteAutomaton
+from automata.compact import CompactDFA
+from automata.utils import is_deterministic
+
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
+
+def _as_compact(automaton: Union[FiniteAutomaton, CompactDFA]) -> CompactDFA:
+    """
+    Return the complete table of a deterministic automaton.
+
+    The missing transitions of a partial automaton (``-1`` entries)
+    go to a sink state added at the end (see CompactDFA.completed).
+    """
+    if not isinstance(automaton, CompactDFA):
+        if not is_deterministic(automaton):
+            raise ValueError("Automaton is not deterministic")
+        automaton = CompactDFA.from_automaton(automaton, complete=False)
+    return automaton.completed()
+
+
+def _transition_counts(compact: CompactDFA) -> List[Dict[int, int]]:
+    """For each state, number of symbols that lead to each next state."""
+    counts: List[Dict[int, int]] = []
+    for row in compact.table:
+        row_counts: Dict[int, int] = {}
+        for target in row:
+            row_counts[target] = row_counts.get(target, 0) + 1
+        counts.append(row_counts)
+    return counts
+
+
+def count_accepted(
+    automaton: Union[FiniteAutomaton, CompactDFA],
+    max_len: int,
+    modulus: Optional[int] = None,
+    use_numpy: Optional[bool] = None,
+) -> List[int]:
+    """
+    Count the accepted strings of each length.
+
+    The vector with the number of strings that lead from the initial
+    state to each state is multiplied by the transition count matrix
+    (``M[i][j]`` is the number of symbols that go from ``i`` to ``j``)
+    once per length.
+
+    Args:
+        automaton: Deterministic automaton (it can be partial).
+        max_len: Maximum length of the strings.
+        modulus: If given, the counts are computed modulo this number
+            (with fixed size integers when NumPy is used).
+        use_numpy: Whether to use NumPy matrix-vector products.
+            By default, NumPy is used if it is installed.
+
+    Returns:
+        List whose ``k``-th element is the number of accepted strings
+        of length ``k``, for ``k`` from ``0`` to ``max_len``.
+
+    """
+    compact = _as_compact(automaton)
+    if use_numpy is None:
+        use_numpy = _HAS_NUMPY
+    if use_numpy:
+        return _count_accepted_numpy(compact, max_len, modulus)
+
+    transition_counts = _transition_counts(compact)
+    finals = [state for state, final in enumerate(compact.finals) if final]
+    vector: Dict[int, int] = {0: 1}
+    counts: List[int] = []
+
+    for length in range(max_len + 1):
+        counts.append(sum(vector.get(state, 0) for state in finals))
+        if length == max_len:
+            break
+        next_vector: Dict[int, int] = {}
+        for state, paths in vector.items():
+            for target, symbols in transition_counts[state].items():
+                next_vector[target] = next_vector.get(target, 0) + paths * symbols
+        if modulus is not None:
+            next_vector = {
+                state: paths % modulus
+                for state, paths in next_vector.items()
+                if paths % modulus
+            }
+        vector = next_vector
+
+    if modulus is not None:
+        counts = [count % modulus for count in counts]
+    return counts
+
+
+def _count_accepted_numpy(
+    compact: CompactDFA,
+    max_len: int,
+    modulus: Optional[int],
+) -> List[int]:
+    """count_accepted with NumPy matrix-vector products."""
+    num_states = compact.num_states
+    # int64 is enough if no product or sum can overflow
+    fixed_size = (
+        modulus is not None
+        and (modulus - 1) ** 2 * num_states < 2 ** 63
+    )
+    dtype = np.int64 if fixed_size else object
+
+    matrix = np.zeros((num_states, num_states), dtype=dtype)
+    for state, row_counts in enumerate(_transition_counts(compact)):
+        for target, symbols in row_counts.items():
+            matrix[state, target] = symbols
+    finals = np.array(compact.finals, dtype=bool)
+
+    vector = np.zeros(num_states, dtype=dtype)
+    vector[0] = 1
+    counts: List[int] = []
+    for length in range(max_len + 1):
+        count = int(vector[finals].sum())
+        counts.append(count % modulus if modulus is not None else count)
+        if length == max_len:
+            break
+        vector = vector @ matrix
+        if modulus is not None:
+            vector = vector % modulus
+
+    return counts
+
+
+def density(
+    automaton: Union[FiniteAutomaton, CompactDFA],
+    length: int,
+) -> float:
+    """
+    Fraction of the strings of a given length that are accepted.
+
+    Args:
+        automaton: Deterministic automaton (it can be partial).
+        length: Length of the strings.
+
+    Returns:
+        Number of accepted strings of that length divided by the
+        number of strings of that length over the alphabet.
+
+    """
+    compact = _as_compact(automaton)
+    accepted = count_accepted(compact, length)[length]
+    return accepted / len(compact.alphabet) ** length if compact.alphabet else float(accepted)
+
+
+def _live_states(compact: CompactDFA) -> List[bool]:
+    """For each state, whether a final state can be reached from it."""
+    predecessors: List[List[int]] = [[] for _ in range(compact.num_states)]
+    for state, row in enumerate(compact.table):
+        for target in row:
+            predecessors[target].append(state)
+
+    live = list(compact.finals)
+    pending: Deque[int] = deque(state for state, final in enumerate(live) if final)
+    while pending:
+        state = pending.popleft()
+        for origin in predecessors[state]:
+            if not live[origin]:
+                live[origin] = True
+                pending.append(origin)
+    return live
+
+
+def _path_string(
+    compact: CompactDFA,
+    node: int,
+    parents: List[int],
+    symbols: List[int],
+) -> str:
+    """Rebuild the string of a node of a BFS tree from its parent pointers."""
+    path: List[str] = []
+    while parents[node] != -1:
+        path.append(compact.alphabet[symbols[node]])
+        node = parents[node]
+    return "".join(reversed(path))
+
+
+def shortest_accepted(
+    automaton: Union[FiniteAutomaton, CompactDFA],
+) -> Optional[str]:
+    """
+    Return the shortest accepted string.
+
+    Among the shortest ones, the first in alphabetical order is returned.
+
+    Args:
+        automaton: Deterministic automaton (it can be partial).
+
+    Returns:
+        Shortest accepted string, or ``None`` if the language is empty.
+
+    """
+    compact = _as_compact(automaton)
+    parents = [-1] * compact.num_states
+    symbols = [-1] * compact.num_states
+    visited = [False] * compact.num_states
+    visited[0] = True
+    pending: Deque[int] = deque([0])
+
+    while pending:
+        state = pending.popleft()
+        if compact.finals[state]:
+            return _path_string(compact, state, parents, symbols)
+        for symbol, target in enumerate(compact.table[state]):
+            if not visited[target]:
+                visited[target] = True
+                parents[target] = state
+                symbols[target] = symbol
+                pending.append(target)
+
+    return None
+
+
+def _strings_of_length(
+    compact: CompactDFA,
+    ways: List[List[int]],
+    length: int,
+    limit: int,
+) -> List[str]:
+    """
+    First ``limit`` accepted strings of a length, in alphabetical order.
+
+    ``ways[r][state]`` is the number (or a nonzero lower bound) of
+    accepted strings of length ``r`` from each state, so the search
+    only follows symbols that lead to some accepted string.
+    """
+    found: List[str] = []
+    path: List[str] = []
+    # (state, next column to try) along the current path
+    stack: List[Tuple[int, int]] = [(0, 0)]
+    while stack and len(found) < limit:
+        state, column = stack[-1]
+        remaining = length - len(path)
+        row = compact.table[state]
+        if remaining == 0:
+            found.append("".join(path))
+            column = len(row)
+        else:
+            next_ways = ways[remaining - 1]
+            while column < len(row) and not next_ways[row[column]]:
+                column += 1
+
+        if column == len(row):
+            stack.pop()
+            if path:
+                path.pop()
+            continue
+
+        stack[-1] = (state, column + 1)
+        path.append(compact.alphabet[column])
+        stack.append((row[column], 0))
+
+    return found
+
+
+def k_shortest(
+    automaton: Union[FiniteAutomaton, CompactDFA],
+    k: int,
+) -> List[str]:
+    """
+    Return the first ``k`` accepted strings, shortest first
+    (strings of the same length in alphabetical order).
+
+    The lengths are tried in increasing order. For each one, the
+    number of accepted strings of each remaining length from each
+    state (capped at ``k``) is extended by one row, and the strings
+    are built with a depth first search that only follows symbols
+    leading to an accepted string. So the cost grows with the length
+    of the strings and ``k``, and not with the number of prefixes.
+
+    Args:
+        automaton: Deterministic automaton (it can be partial).
+        k: Number of strings.
+
+    Returns:
+        The ``k`` shortest accepted strings, or all of them if the
+        language has less than ``k`` strings.
+
+    """
+    compact = _as_compact(automaton)
+    live = _live_states(compact)
+    found: List[str] = []
+    if k <= 0 or not live[0]:
+        return found
+
+    # ways[r][state]: accepted strings of length r from state, capped at k
+    ways: List[List[int]] = [[int(final) for final in compact.finals]]
+    # live states reached by the prefixes of the current length
+    frontier: Set[int] = {0}
+    length = 0
+    while frontier and len(found) < k:
+        if length > 0:
+            previous = ways[-1]
+            ways.append([
+                min(k, sum(previous[target] for target in row))
+                for row in compact.table
+            ])
+        if ways[length][0]:
+            found.extend(_strings_of_length(compact, ways, length, k - len(found)))
+        frontier = {
+            target
+            for state in frontier
+            for target in compact.table[state]
+            if live[target]
+        }
+        length += 1
+
+    return found
+
+
+def distinguishing_string(
+    automaton1: Union[FiniteAutomaton, CompactDFA],
+    automaton2: Union[FiniteAutomaton, CompactDFA],
+) -> Optional[str]:
+    """
+    Return a shortest string accepted by one automaton but not the other.
+
+    The product automaton is explored with a BFS. Symbols that are
+    not in the alphabet of an automaton are rejected by it.
+
+    Args:
+        automaton1: Deterministic automaton (it can be partial).
+        automaton2: Deterministic automaton (it can be partial).
+
+    Returns:
+        Shortest counterexample, or ``None`` if both automata accept
+        the same language.
+
+    """
+    compact1 = _as_compact(automaton1)
+    compact2 = _as_compact(automaton2)
+    alphabet = sorted(set(compact1.alphabet) | set(compact2.alphabet))
+    columns: List[Tuple[Optional[int], Optional[int]]] = [
+        (compact1.symbol_index.get(symbol), compact2.symbol_index.get(symbol))
+        for symbol in alphabet
+    ]
+
+    # -1 is the (implicit) dead state of an automaton
+    def accepts(compact: CompactDFA, state: int) -> bool:
+        return state != -1 and compact.finals[state]
+
+    def step(compact: CompactDFA, state: int, column: Optional[int]) -> int:
+        return -1 if state == -1 or column is None else compact.table[state][column]
+
+    index: Dict[Tuple[int, int], int] = {(0, 0): 0}
+    pairs: List[Tuple[int, int]] = [(0, 0)]
+    parents: List[int] = [-1]
+    symbols: List[str] = [""]
+    pending: Deque[int] = deque([0])
+
+    while pending:
+        node = pending.popleft()
+        state1, state2 = pairs[node]
+        if accepts(compact1, state1) != accepts(compact2, state2):
+            path: List[str] = []
+            while parents[node] != -1:
+                path.append(symbols[node])
+                node = parents[node]
+            return "".join(reversed(path))
+
+        for symbol, (column1, column2) in zip(alphabet, columns):
+            pair = (step(compact1, state1, column1), step(compact2, state2, column2))
+            if pair not in index:
+                index[pair] = len(pairs)
+                pairs.append(pair)
+                parents.append(node)
+                symbols.append(symbol)
+                pending.append(index[pair])
+
+    return None
+
+
+def sample_accepted(
+    automaton: Union[FiniteAutomaton, CompactDFA],
+    length: int,
+    k: int,
+    seed: Optional[int] = None,
+) -> List[str]:
+    """
+    Draw accepted strings of a given length uniformly at random.
+
+    The number of accepted strings of each remaining length that start
+    at each state is computed once (dynamic programming over the table).
+    Then every string is drawn symbol by symbol, choosing each next state
+    with probability proportional to its number of accepted completions,
+    so no string is rejected.
+
+    Args:
+        automaton: Deterministic automaton (it can be partial).
+        length: Length of the strings.
+        k: Number of strings (drawn independently, with repetition).
+        seed: Seed of the random generator.
+
+    Returns:
+        List of ``k`` accepted strings.
+
+    Raises:
+        ValueError: If no string of that length is accepted.
+
+    """
+    compact = _as_compact(automaton)
+    # for each state, the symbols that go to each next state
+    successors: List[List[Tuple[int, List[str]]]] = []
+    for row in compact.table:
+        by_target: Dict[int, List[str]] = {}
+        for symbol, target in zip(compact.alphabet, row):
+            by_target.setdefault(target, []).append(symbol)
+        successors.append(list(by_target.items()))
+
+    # ways[r][state]: accepted strings of length r starting at state
+    ways: List[List[int]] = [[int(final) for final in compact.finals]]
+    for _ in range(length):
+        previous = ways[-1]
+        ways.append([
+            sum(len(symbols) * previous[target] for target, symbols in state_successors)
+            for state_successors in successors
+        ])
+
+    if not ways[length][0]:
+        raise ValueError(f"No string of length {length} is accepted")
+
+    rng = random.Random(seed)
+    samples: List[str] = []
+    for _ in range(k):
+        state = 0
+        string: List[str] = []
+        for remaining in range(length, 0, -1):
+            choice = rng.randrange(ways[remaining][state])
+            for target, symbols in successors[state]:
+                weight = len(symbols) * ways[remaining - 1][target]
+                if choice < weight:
+                    string.append(symbols[choice // ways[remaining - 1][target]])
+                    state = target
+                    break
+                choice -= weight
+        samples.append("".join(string))
+
+    return samples
@@ -0,0 +1,252 @@
+"""Literal strings required by the matches of a regex."""
+from difflib import SequenceMatcher
+from typing import (
+    Callable,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from automata.re_parser import _re_to_rpn
+
+
+class RequiredLiterals():
+    """
+    Literal strings that every string accepted by a regex contains.
+
+    They are checked with ``str`` methods (``in``, ``startswith``,
+    ``endswith``), which run in C, so most of the strings that are
+    not accepted can be rejected without running an automaton.
+
+    Args:
+        exact: The accepted strings, if they are few.
+            ``None`` if they are unknown (too many or infinite).
+        prefixes: Every accepted string starts with one of them.
+            ``{""}`` if nothing is known.
+        suffixes: Every accepted string ends with one of them.
+            ``{""}`` if nothing is known.
+        required: Every accepted string contains all of them.
+
+    """
+
+    MAX_LITERALS: int = 16
+
+    exact: Optional[FrozenSet[str]]
+    prefixes: FrozenSet[str]
+    suffixes: FrozenSet[str]
+    required: FrozenSet[str]
+    _prefixes: Tuple[str, ...]
+    _suffixes: Tuple[str, ...]
+
+    def __init__(
+        self,
+        exact: Optional[Iterable[str]] = None,
+        prefixes: Iterable[str] = ("",),
+        suffixes: Iterable[str] = ("",),
+        required: Iterable[str] = (),
+    ) -> None:
+        self.exact = frozenset(exact) if exact is not None else None
+        # among alternatives, the shortest ones are enough:
+        # starting with "abc" implies starting with "ab"
+        self.prefixes = _minimal(prefixes, lambda x, y: x.startswith(y))
+        self.suffixes = _minimal(suffixes, lambda x, y: x.endswith(y))
+        # among requirements, the longest ones are enough
+        self.required = _minimal(
+            (literal for literal in required if literal),
+            lambda x, y: x in y,
+        )
+        self._prefixes = tuple(self.prefixes)
+        self._suffixes = tuple(self.suffixes)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"exact={_sorted(self.exact)!r}, "
+            f"prefixes={_sorted(self.prefixes)!r}, "
+            f"suffixes={_sorted(self.suffixes)!r}, "
+            f"required={_sorted(self.required)!r})"
+        )
+
+    @property
+    def is_trivial(self) -> bool:
+        """Whether no string can be rejected by the literals."""
+        return (
+            self.exact is None
+            and "" in self.prefixes
+            and "" in self.suffixes
+            and not self.required
+        )
+
+    def may_match(self, string: str) -> bool:
+        """
+        Check a string against the literals.
+
+        Args:
+            string: String to check.
+
+        Returns:
+            ``False`` if the string can not be accepted by the regex.
+            If the accepted strings are known (``exact``), the result
+            is exact, otherwise ``True`` only means that the string
+            has to be checked with an automaton.
+
+        """
+        if self.exact is not None:
+            return string in self.exact
+        return (
+            string.startswith(self._prefixes)
+            and string.endswith(self._suffixes)
+            and all(literal in string for literal in self.required)
+        )
+
+    def _known(self) -> FrozenSet[str]:
+        """Literals contained in every accepted string."""
+        known = set(self.required)
+        for literals in (self.exact, self.prefixes, self.suffixes):
+            if literals is not None and len(literals) == 1:
+                known |= literals
+        known.discard("")
+        return frozenset(known)
+
+
+def _sorted(literals: Optional[FrozenSet[str]]) -> Optional[List[str]]:
+    return sorted(literals) if literals is not None else None
+
+
+def _minimal(
+    literals: Iterable[str],
+    implied: Callable[[str, str], bool],
+) -> FrozenSet[str]:
+    """Remove the literals ``x`` such that ``implied(x, y)`` for another one ``y``."""
+    unique = set(literals)
+    return frozenset(
+        literal for literal in unique
+        if not any(other != literal and implied(literal, other) for other in unique)
+    )
+
+
+def _product(
+    first: FrozenSet[str],
+    second: FrozenSet[str],
+) -> Optional[FrozenSet[str]]:
+    """Concatenations of the literals, or ``None`` if there are too many."""
+    if len(first) * len(second) > RequiredLiterals.MAX_LITERALS:
+        return None
+    return frozenset(x + y for x in first for y in second)
+
+
+def _bounded(literals: FrozenSet[str]) -> FrozenSet[str]:
+    """Alternatives, or no information if there are too many."""
+    if len(literals) > RequiredLiterals.MAX_LITERALS:
+        return frozenset({""})
+    return literals
+
+
+def _longest_common_substring(first: str, second: str) -> str:
+    """Longest string contained in both (the first one if there are several)."""
+    matcher = SequenceMatcher(None, first, second, autojunk=False)
+    match = matcher.find_longest_match(0, len(first), 0, len(second))
+    return first[match.a:match.a + match.size]
+
+
+def _symbol(symbol: str) -> RequiredLiterals:
+    return RequiredLiterals(
+        exact={symbol},
+        prefixes={symbol},
+        suffixes={symbol},
+    )
+
+
+def _star(literals: RequiredLiterals) -> RequiredLiterals:
+    if literals.exact is not None and literals.exact <= {""}:
+        return RequiredLiterals(exact={""})
+    return RequiredLiterals()
+
+
+def _union(first: RequiredLiterals, second: RequiredLiterals) -> RequiredLiterals:
+    exact: Optional[FrozenSet[str]] = None
+    if first.exact is not None and second.exact is not None:
+        exact = first.exact | second.exact
+        if len(exact) > RequiredLiterals.MAX_LITERALS:
+            exact = None
+
+    # the common parts of a literal required by each side are required
+    required = {
+        _longest_common_substring(literal1, literal2)
+        for literal1 in first._known()
+        for literal2 in second._known()
+    }
+
+    return RequiredLiterals(
+        exact=exact,
+        prefixes=_bounded(first.prefixes | second.prefixes),
+        suffixes=_bounded(first.suffixes | second.suffixes),
+        required=required,
+    )
+
+
+def _concat(first: RequiredLiterals, second: RequiredLiterals) -> RequiredLiterals:
+    exact: Optional[FrozenSet[str]] = None
+    if first.exact is not None and second.exact is not None:
+        exact = _product(first.exact, second.exact)
+
+    prefixes: Optional[FrozenSet[str]] = None
+    if first.exact is not None:
+        prefixes = _product(first.exact, second.prefixes)
+
+    suffixes: Optional[FrozenSet[str]] = None
+    if second.exact is not None:
+        suffixes = _product(first.suffixes, second.exact)
+
+    required = set(first._known() | second._known())
+    if len(first.suffixes) == 1 and len(second.prefixes) == 1:
+        # the end of the first part is followed by the start of the second
+        required.add(next(iter(first.suffixes)) + next(iter(second.prefixes)))
+
+    return RequiredLiterals(
+        exact=exact,
+        prefixes=prefixes if prefixes is not None else first.prefixes,
+        suffixes=suffixes if suffixes is not None else second.suffixes,
+        required=required,
+    )
+
+
+def required_literals(re_string: str) -> RequiredLiterals:
+    """
+    Extract the literals required by a regex.
+
+    The regex is read in reverse polish notation, as in
+    ``REParser.create_automaton``, and the literals of each
+    subexpression are computed from those of its operands.
+
+    Args:
+        re_string: Regular expression in the syntax of REParser.
+
+    Returns:
+        Literals that every string accepted by the regex satisfies.
+
+    """
+    if not re_string:
+        # empty language: every string is rejected
+        return RequiredLiterals(exact=())
+
+    stack: List[RequiredLiterals] = []
+    for x in _re_to_rpn(re_string):
+        if x == "*":
+            stack.append(_star(stack.pop()))
+        elif x == "+":
+            second = stack.pop()
+            first = stack.pop()
+            stack.append(_union(first, second))
+        elif x == ".":
+            second = stack.pop()
+            first = stack.pop()
+            stack.append(_concat(first, second))
+        elif x == "λ":
+            stack.append(RequiredLiterals(exact={""}))
+        else:
+            stack.append(_symbol(x))
+
+    return stack.pop()
@@ -0,0 +1,460 @@
+"""Automata whose transitions are labeled with ranges of code points."""
+from bisect import bisect_right
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from automata.automaton import FiniteAutomaton, State, Transition
+
+# sorted, disjoint and non adjacent (first, last) code point pairs
+CodePointRanges = Tuple[Tuple[int, int], ...]
+
+MAX_CODE_POINT: int = 0x10FFFF
+
+
+def normalize_ranges(ranges: Iterable[Tuple[int, int]]) -> CodePointRanges:
+    """
+    Sort and merge ranges of code points.
+
+    Args:
+        ranges: Pairs ``(first, last)`` of code points (both included).
+
+    Returns:
+        Equivalent sorted ranges, where overlapping or adjacent
+        ranges are merged.
+
+    """
+    merged: List[Tuple[int, int]] = []
+    for first, last in sorted(ranges):
+        if first > last or first < 0 or last > MAX_CODE_POINT:
+            raise ValueError(f"Invalid code point range ({first}, {last})")
+        if merged and first <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], last))
+        else:
+            merged.append((first, last))
+    return tuple(merged)
+
+
+def char_ranges(chars: str) -> CodePointRanges:
+    """Ranges of the code points of some characters."""
+    return normalize_ranges((ord(char), ord(char)) for char in chars)
+
+
+class RangeTransition():
+    """
+    Transition labeled with a set of code points.
+
+    Args:
+        ranges: Code points consumed in the transition.
+            ``None`` for a lambda transition.
+        state: Name of the final state of the transition.
+
+    """
+
+    ranges: Optional[CodePointRanges]
+    state: str
+
+    def __init__(
+        self,
+        ranges: Optional[Iterable[Tuple[int, int]]],
+        state: str,
+    ) -> None:
+        self.ranges = normalize_ranges(ranges) if ranges is not None else None
+        self.state = state
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, type(self)):
+            return NotImplemented
+
+        return (
+            self.ranges == other.ranges
+            and self.state == other.state
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"{self.ranges!r}, {self.state!r})"
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.ranges, self.state))
+
+
+class RangeState():
+    """
+    State of an automaton with range transitions.
+
+    Args:
+        name: Name of the state.
+        is_final: Whether the state is a final state or not.
+        transitions: The list of transitions starting at this state.
+
+    """
+
+    name: str
+    is_final: bool
+    transitions: List[RangeTransition]
+
+    def __init__(
+        self,
+        name: str,
+        is_final: bool = False,
+        transitions: Optional[List[RangeTransition]] = None,
+    ) -> None:
+        self.name = name
+        self.is_final = is_final
+        self.transitions = list(transitions) if transitions is not None else []
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({self.name!r}, is_final={self.is_final!r}, "
+            f"transitions={self.transitions!r})"
+        )
+
+
+class RangeAutomaton():
+    """
+    Automaton whose transitions consume any code point of a set of
+    ranges, so that big character classes take one transition.
+
+    Determinization and minimization split the code points into
+    minterms (maximal ranges where every transition label is either
+    fully in or fully out), run the algorithms of FiniteAutomaton
+    with one representative symbol per minterm and merge the
+    minterms of each transition back into ranges.
+
+    Args:
+        states: List of states of the automaton. The first state in the
+            list is the initial state.
+
+    """
+
+    states: List[RangeState]
+    name2state: Dict[str, RangeState]
+
+    def __init__(self, states: List[RangeState]) -> None:
+        names = {state.name for state in states}
+        if len(names) != len(states):
+            raise ValueError(
+                "There are states with the same name",
+            )
+        if not {t.state for s in states for t in s.transitions} <= names:
+            raise ValueError(
+                "There are transitions to an undefined state",
+            )
+        self.states = states
+        self.name2state = {state.name: state for state in states}
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"states={self.states!r})"
+        )
+
+    @classmethod
+    def from_automaton(cls, automaton: FiniteAutomaton) -> 'RangeAutomaton':
+        """
+        Convert an automaton with single character symbols.
+
+        Args:
+            automaton: Automaton to convert.
+
+        Returns:
+            Equivalent automaton, with the same states, where the
+            transitions with the same origin and target are merged.
+
+        """
+        states: List[RangeState] = []
+        for state in automaton.states:
+            new_state = RangeState(name=state.name, is_final=state.is_final)
+            code_points: Dict[str, List[Tuple[int, int]]] = {}
+            for transition in state.transitions:
+                if transition.symbol is None:
+                    new_state.transitions.append(RangeTransition(None, transition.state))
+                else:
+                    code_point = ord(transition.symbol)
+                    code_points.setdefault(transition.state, []).append(
+                        (code_point, code_point),
+                    )
+            new_state.transitions.extend(
+                RangeTransition(ranges, target)
+                for target, ranges in code_points.items()
+            )
+            states.append(new_state)
+
+        return cls(states)
+
+    def minterms(self) -> List[Tuple[int, int]]:
+        """
+        Split the code points used by the transitions into minterms.
+
+        Returns:
+            Sorted disjoint ranges such that every range of every
+            transition is a union of some of them.
+
+        """
+        boundaries: Set[int] = set()
+        for state in self.states:
+            for transition in state.transitions:
+                for first, last in transition.ranges or ():
+                    boundaries.add(first)
+                    boundaries.add(last + 1)
+
+        points = sorted(boundaries)
+        # keep the pieces between consecutive boundaries that are used
+        used = self._covered(points)
+        return [
+            (first, next_first - 1)
+            for first, next_first, is_used in zip(points, points[1:], used)
+            if is_used
+        ]
+
+    def _covered(self, points: List[int]) -> List[bool]:
+        """For each piece [points[i], points[i + 1]), whether some transition uses it."""
+        # +1 where a range starts, -1 where it ends
+        delta = [0] * len(points)
+        position = {point: index for index, point in enumerate(points)}
+        for state in self.states:
+            for transition in state.transitions:
+                for first, last in transition.ranges or ():
+                    delta[position[first]] += 1
+                    delta[position[last + 1]] -= 1
+
+        covered: List[bool] = []
+        active = 0
+        for change in delta[:-1]:
+            active += change
+            covered.append(active > 0)
+        return covered
+
+    def to_symbolic(self) -> Tuple[FiniteAutomaton, List[Tuple[int, int]]]:
+        """
+        Convert to an automaton with one symbol per minterm.
+
+        Each minterm is represented by the character of its first
+        code point.
+
+        Returns:
+            Equivalent automaton over the representatives, and
+            the minterms.
+
+        """
+        minterms = self.minterms()
+        starts = [first for first, _ in minterms]
+
+        states: List[State] = []
+        for state in self.states:
+            new_state = State(name=state.name, is_final=state.is_final)
+            transitions: List[Transition] = []
+            for transition in state.transitions:
+                if transition.ranges is None:
+                    transitions.append(Transition(symbol=None, state=transition.state))
+                    continue
+                for first, last in transition.ranges:
+                    index = bisect_right(starts, first) - 1
+                    while index < len(minterms) and minterms[index][0] <= last:
+                        transitions.append(
+                            Transition(symbol=chr(starts[index]), state=transition.state),
+                        )
+                        index += 1
+            new_state.add_transitions(transitions)
+            states.append(new_state)
+
+        return FiniteAutomaton(states), minterms
+
+    @classmethod
+    def from_symbolic(
+        cls,
+        automaton: FiniteAutomaton,
+        minterms: List[Tuple[int, int]],
+    ) -> 'RangeAutomaton':
+        """
+        Inverse of to_symbolic: replace each representative
+        by its minterm and merge the transitions with the same
+        origin and target.
+        """
+        minterm_of: Dict[str, Tuple[int, int]] = {
+            chr(first): (first, last) for first, last in minterms
+        }
+        states: List[RangeState] = []
+        for state in automaton.states:
+            new_state = RangeState(name=state.name, is_final=state.is_final)
+            ranges: Dict[str, List[Tuple[int, int]]] = {}
+            for transition in state.transitions:
+                if transition.symbol is None:
+                    new_state.transitions.append(RangeTransition(None, transition.state))
+                else:
+                    ranges.setdefault(transition.state, []).append(
+                        minterm_of[transition.symbol],
+                    )
+            new_state.transitions.extend(
+                RangeTransition(target_ranges, target)
+                for target, target_ranges in ranges.items()
+            )
+            states.append(new_state)
+
+        return cls(states)
+
+    def to_deterministic(self) -> 'RangeAutomaton':
+        """
+        Return an equivalent deterministic automaton.
+
+        The result is partial: the code points without transition
+        reject the string.
+
+        Returns:
+            Equivalent deterministic automaton, whose transitions
+            from each state have disjoint ranges.
+
+        """
+        symbolic, minterms = self.to_symbolic()
+        return RangeAutomaton.from_symbolic(
+            symbolic.to_deterministic(complete=False),
+            minterms,
+        )
+
+    def to_minimized(self, strategy: str = "hopcroft") -> 'RangeAutomaton':
+        """
+        Return an equivalent minimal (partial) deterministic automaton.
+
+        Args:
+            strategy: Minimization algorithm (see
+                ``FiniteAutomaton.to_minimized``).
+
+        Returns:
+            Equivalent minimal automaton.
+
+        """
+        symbolic, minterms = self.to_symbolic()
+        return RangeAutomaton.from_symbolic(
+            symbolic.to_minimized(strategy=strategy, complete=False),
+            minterms,
+        )
+
+
+class RangeDFAEvaluator():
+    """
+    Evaluator of deterministic range automata.
+
+    For each state, the ranges of its transitions are sorted, and
+    the transition of a code point is found with a binary search.
+    Code points below 128 use a direct lookup table instead.
+
+    Args:
+        automaton: Deterministic automaton to evaluate.
+
+    Attributes:
+        current_state: Index of the current state, ``-1`` once a
+            code point without transition has been read.
+
+    """
+
+    ASCII_SIZE: int = 128
+
+    automaton: RangeAutomaton
+    current_state: int
+    _finals: List[bool]
+    _starts: List[List[int]]
+    _ends: List[List[int]]
+    _targets: List[List[int]]
+    _ascii: List[List[int]]
+
+    def __init__(self, automaton: RangeAutomaton) -> None:
+        self.automaton = automaton
+        index: Dict[str, int] = {
+            state.name: position
+            for position, state in enumerate(automaton.states)
+        }
+        self._finals = [state.is_final for state in automaton.states]
+        self._starts = []
+        self._ends = []
+        self._targets = []
+        self._ascii = []
+
+        for state in automaton.states:
+            labeled: List[Tuple[int, int, int]] = []
+            for transition in state.transitions:
+                if transition.ranges is None:
+                    raise ValueError("The automaton has lambda transitions")
+                labeled.extend(
+                    (first, last, index[transition.state])
+                    for first, last in transition.ranges
+                )
+            labeled.sort()
+            for (_, last, _), (next_first, _, _) in zip(labeled, labeled[1:]):
+                if next_first <= last:
+                    raise ValueError(
+                        f"State {state.name} has overlapping transitions",
+                    )
+
+            self._starts.append([first for first, _, _ in labeled])
+            self._ends.append([last for _, last, _ in labeled])
+            self._targets.append([target for _, _, target in labeled])
+            self._ascii.append([
+                self._search(len(self._starts) - 1, code_point)
+                for code_point in range(self.ASCII_SIZE)
+            ])
+
+        self.current_state = 0
+
+    def _search(self, state: int, code_point: int) -> int:
+        position = bisect_right(self._starts[state], code_point) - 1
+        if position >= 0 and code_point <= self._ends[state][position]:
+            return self._targets[state][position]
+        return -1
+
+    def _step(self, state: int, code_point: int) -> int:
+        if code_point < self.ASCII_SIZE:
+            return self._ascii[state][code_point]
+        return self._search(state, code_point)
+
+    def process_symbol(self, symbol: str) -> None:
+        """
+        Process one symbol.
+
+        Args:
+            symbol: Symbol to consume.
+
+        """
+        if self.current_state != -1:
+            self.current_state = self._step(self.current_state, ord(symbol))
+
+    def process_string(self, string: str) -> None:
+        """
+        Process a full string of symbols. The processing stops at
+        the first code point without transition.
+
+        Args:
+            string: String to process.
+
+        """
+        state = self.current_state
+        for symbol in string:
+            if state == -1:
+                break
+            state = self._step(state, ord(symbol))
+        self.current_state = state
+
+    def is_accepting(self) -> bool:
+        """Check if the current state is an accepting one."""
+        return self.current_state != -1 and self._finals[self.current_state]
+
+    def accepts(self, string: str) -> bool:
+        """
+        Return if a string is accepted without changing state.
+
+        Note: This function is NOT thread-safe.
+
+        """
+        old_state = self.current_state
+        try:
+            self.process_string(string)
+            return self.is_accepting()
+        finally:
+            self.current_state = old_state
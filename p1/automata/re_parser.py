@@ -1,7 +1,8 @@
 """Conversion from regex to automata."""
-from typing import List, Dict, Set
+from typing import List, Dict, Set, Optional
 
 from automata.automaton import FiniteAutomaton, State, Transition, utils
+from automata.stats import CompilationStats
 from automata.utils import AutomataFormat
 
 import copy 
@@ -234,17 +235,26 @@ class REParser():
     def create_automaton(
         self,
         re_string: str,
+        stats: Optional[CompilationStats] = None,
     ) -> FiniteAutomaton:
         """
         Create an automaton from a regex.
 
         Args:
             re_string: String with the regular expression in Kleene notation.
+            stats: Where to record the time spent and the size of
+                the automaton.
 
         Returns:
             Automaton equivalent to the regex.
 
         """
+        if stats is not None:
+            with stats.phase("regex_parsing"):
+                automaton = self.create_automaton(re_string)
+            stats.update_peak("nfa_states", len(automaton.states))
+            return automaton
+
         if not re_string:
             return self._create_automaton_empty()
         
@@ -0,0 +1,87 @@
+"""Statistics of the construction of automata."""
+from contextlib import contextmanager
+import json
+import time
+from typing import (
+    Dict,
+    Iterator,
+)
+
+
+class CompilationStats():
+    """
+    Collects statistics of the algorithms that build automata.
+
+    An instance can be passed (``stats`` argument) to
+    ``utils.compute_closures``, ``FiniteAutomaton.to_deterministic``,
+    ``FiniteAutomaton.to_minimized`` and ``REParser.create_automaton``.
+    The same instance can be reused along several calls: counters,
+    histograms and phase times are accumulated.
+
+    Attributes:
+        counters: Number of times something happened
+            (e.g. ``subsets_expanded``, ``partition_rounds``).
+        histograms: For each histogram, number of times each
+            value was observed (e.g. ``closure_size``).
+        phase_times: Seconds spent in each phase.
+        peaks: Maximum value seen of a magnitude
+            (e.g. ``live_states``).
+
+    """
+
+    counters: Dict[str, int]
+    histograms: Dict[str, Dict[int, int]]
+    phase_times: Dict[str, float]
+    peaks: Dict[str, int]
+
+    def __init__(self) -> None:
+        self.counters = {}
+        self.histograms = {}
+        self.phase_times = {}
+        self.peaks = {}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.as_dict()!r})"
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Add ``amount`` to a counter."""
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def observe(self, name: str, value: int) -> None:
+        """Add one observation of ``value`` to a histogram."""
+        histogram = self.histograms.setdefault(name, {})
+        histogram[value] = histogram.get(value, 0) + 1
+
+    def update_peak(self, name: str, value: int) -> None:
+        """Keep the maximum value of a magnitude."""
+        if value > self.peaks.get(name, value - 1):
+            self.peaks[name] = value
+
+    def add_time(self, name: str, seconds: float) -> None:
+        """Add ``seconds`` to the time spent in a phase."""
+        self.phase_times[name] = self.phase_times.get(name, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Context manager that adds the time spent inside it to a phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def as_dict(self) -> Dict[str, object]:
+        """Return the statistics as a dictionary."""
+        return {
+            "counters": dict(self.counters),
+            "histograms": {
+                name: dict(sorted(histogram.items()))
+                for name, histogram in self.histograms.items()
+            },
+            "phase_times": dict(self.phase_times),
+            "peaks": dict(self.peaks),
+        }
+
+    def to_json(self, indent: int = 2) -> str:
+        """Return the statistics as a JSON document."""
+        return json.dumps(self.as_dict(), indent=indent)
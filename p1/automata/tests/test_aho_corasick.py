@@ -0,0 +1,63 @@
+"""Test Aho-Corasick automata."""
+import unittest
+
+from automata.aho_corasick import AhoCorasick
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.compact import CompactDFA
+from automata.re_parser import REParser
+from automata.utils import is_deterministic
+
+
+class TestAhoCorasick(unittest.TestCase):
+    """Tests for the Aho-Corasick construction."""
+
+    def test_matches(self) -> None:
+        """Test multi-match reporting."""
+        matcher = AhoCorasick(["he", "she", "his", "hers"])
+
+        self.assertEqual(
+            list(matcher.iter_matches("ushers")),
+            [(1, "she"), (2, "he"), (2, "hers")],
+        )
+        self.assertEqual(list(matcher.iter_matches("ahishe")), [
+            (1, "his"), (3, "she"), (4, "he"),
+        ])
+        self.assertEqual(list(matcher.iter_matches("xyz")), [])
+
+    def test_search_automaton(self) -> None:
+        """Test that the search automaton accepts strings ending in a literal."""
+        matcher = AhoCorasick(["ab", "b"], alphabet="abc")
+        automaton = matcher.to_automaton()
+        self.assertTrue(is_deterministic(automaton))
+
+        evaluator = FiniteAutomatonEvaluator(automaton)
+        for string in ["ab", "b", "cab", "ccb", "abab"]:
+            with self.subTest(string=string):
+                self.assertTrue(evaluator.accepts(string))
+        for string in ["", "a", "ba", "abc"]:
+            with self.subTest(string=string):
+                self.assertFalse(evaluator.accepts(string))
+
+    def test_union_automaton(self) -> None:
+        """Test that the exact automaton matches the union regex."""
+        words = ["hello", "goodbye", "help", "he"]
+        compact = AhoCorasick(words).to_compact(search=False)
+        regex = FiniteAutomatonEvaluator(
+            REParser().create_automaton("+".join(".".join(w) for w in words)),
+        )
+
+        for string in words + ["", "h", "hell", "helpo", "goodbyee", "x"]:
+            with self.subTest(string=string):
+                self.assertEqual(compact.accepts(string), regex.accepts(string))
+
+    def test_compact_round_trip(self) -> None:
+        """Test conversion between tables and automata."""
+        compact = AhoCorasick(["ab", "ba"]).to_compact()
+        round_trip = CompactDFA.from_automaton(compact.to_automaton())
+
+        self.assertEqual(round_trip.table, compact.table)
+        self.assertEqual(round_trip.finals, compact.finals)
+
+
+if __name__ == '__main__':
+    unittest.main()
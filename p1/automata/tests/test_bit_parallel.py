@@ -0,0 +1,83 @@
+"""Test bit-parallel evaluation of automatas."""
+import itertools
+import unittest
+
+from automata.automaton import FiniteAutomaton
+from automata.automaton_evaluator import (
+    BitParallelEvaluator,
+    FiniteAutomatonEvaluator,
+)
+from automata.utils import AutomataFormat
+
+
+class TestBitParallel(unittest.TestCase):
+    """Compare the bit-parallel evaluator with the set based one."""
+
+    def _check_same(self, automaton: FiniteAutomaton, alphabet: str, length: int) -> None:
+        expected = FiniteAutomatonEvaluator(automaton)
+        evaluator = BitParallelEvaluator(automaton)
+
+        for size in range(length + 1):
+            for symbols in itertools.product(alphabet, repeat=size):
+                string = "".join(symbols)
+                with self.subTest(string=string):
+                    self.assertEqual(
+                        evaluator.accepts(string),
+                        expected.accepts(string),
+                    )
+
+    def test_linear(self) -> None:
+        """Test an automaton evaluated with Shift-And."""
+        automaton = AutomataFormat.read(
+            """
+            Automaton:
+                0
+                1
+                2
+                3 final
+
+                0 -a-> 0
+                0 -a-> 1
+                1 -b-> 2
+                2 -b-> 2
+                2 -a-> 3
+            """
+        )
+        self._check_same(automaton, "abc", 6)
+
+        evaluator = BitParallelEvaluator(automaton)
+        evaluator.process_string("aab")
+        self.assertEqual(
+            {state.name for state in evaluator.current_states},
+            {"2"},
+        )
+
+    def test_general(self) -> None:
+        """Test an automaton with more than one byte of states."""
+        description = "Automaton:\n" + "".join(
+            f"q{i}{' final' if i % 4 == 3 else ''}\n" for i in range(12)
+        ) + "".join(
+            f"q{i} -a-> q{(i * 5 + 1) % 12}\n"
+            f"q{i} -b-> q{(i * 7 + 3) % 12}\n"
+            f"q{i} -b-> q{(i + 2) % 12}\n"
+            for i in range(12)
+        )
+        self._check_same(AutomataFormat.read(description), "ab", 8)
+
+    def test_lambdas(self) -> None:
+        """Test that automata with lambdas are rejected."""
+        automaton = AutomataFormat.read(
+            """
+            Automaton:
+                0
+                1 final
+
+                0 --> 1
+            """
+        )
+        with self.assertRaises(ValueError):
+            BitParallelEvaluator(automaton)
+
+
+if __name__ == '__main__':
+    unittest.main()
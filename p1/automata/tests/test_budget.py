@@ -0,0 +1,84 @@
+"""Test the limits of the subset construction."""
+import itertools
+import unittest
+
+from automata.automaton import DeterminizationBudgetExceeded
+from automata.automaton_evaluator import (
+    FiniteAutomatonEvaluator,
+    LazyDFAEvaluator,
+    build_evaluator,
+)
+from automata.re_parser import REParser
+
+
+class TestBudget(unittest.TestCase):
+    """Tests for to_deterministic limits and build_evaluator."""
+
+    def setUp(self) -> None:
+        """Automaton whose deterministic version has more than 2^7 states."""
+        self.automaton = REParser().create_automaton(
+            "(a+b)*.a" + ".(a+b)" * 6,
+        )
+
+    def test_max_states(self) -> None:
+        """Test that the construction stops."""
+        with self.assertRaises(DeterminizationBudgetExceeded) as context:
+            self.automaton.to_deterministic(max_states=20)
+
+        self.assertEqual(context.exception.expanded_states, 20)
+        self.assertGreater(context.exception.pending_states, 0)
+        self.assertEqual(context.exception.max_states, 20)
+
+    def test_exact_budget(self) -> None:
+        """Test that max_states bounds the result, counting the empty set."""
+        for regex in ("a.b", "(a+b)*.a.(a+b)"):
+            automaton = REParser().create_automaton(regex)
+            for complete in (True, False):
+                with self.subTest(regex=regex, complete=complete):
+                    size = len(automaton.to_deterministic(complete=complete).states)
+                    deterministic = automaton.to_deterministic(
+                        max_states=size,
+                        complete=complete,
+                    )
+                    self.assertEqual(len(deterministic.states), size)
+                    with self.assertRaises(DeterminizationBudgetExceeded):
+                        automaton.to_deterministic(max_states=size - 1, complete=complete)
+
+    def test_within_budget(self) -> None:
+        """Test that big enough limits do not change the result."""
+        deterministic = self.automaton.to_deterministic(
+            max_states=200,
+            max_seconds=60,
+        )
+        self.assertEqual(
+            len(deterministic.states),
+            len(self.automaton.to_deterministic().states),
+        )
+
+    def test_fallback(self) -> None:
+        """Test the evaluator returned when the limit is exceeded."""
+        evaluator = build_evaluator(self.automaton, max_states=20)
+        self.assertIsInstance(evaluator, LazyDFAEvaluator)
+
+        plain = build_evaluator(self.automaton, max_states=20, lazy=False)
+        self.assertNotIsInstance(plain, LazyDFAEvaluator)
+
+        expected = FiniteAutomatonEvaluator(self.automaton)
+        for symbols in itertools.product("ab", repeat=8):
+            string = "".join(symbols)
+            with self.subTest(string=string):
+                self.assertEqual(evaluator.accepts(string), expected.accepts(string))
+        self.assertFalse(evaluator.accepts("aaaaaaac"))
+
+    def test_lazy_cache_limit(self) -> None:
+        """Test that the lazy evaluator works with a tiny cache."""
+        evaluator = LazyDFAEvaluator(self.automaton, max_cached_states=2)
+        expected = FiniteAutomatonEvaluator(self.automaton)
+        for symbols in itertools.product("ab", repeat=8):
+            string = "".join(symbols)
+            with self.subTest(string=string):
+                self.assertEqual(evaluator.accepts(string), expected.accepts(string))
+
+
+if __name__ == '__main__':
+    unittest.main()
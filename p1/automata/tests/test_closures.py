@@ -0,0 +1,99 @@
+"""Test the computation of lambda closures."""
+import unittest
+from typing import Dict, FrozenSet, Set
+
+from automata.automaton import FiniteAutomaton, State, Transition, utils
+from automata.generators import random_automaton
+from automata.re_parser import REParser
+from automata.utils import AutomataFormat
+
+
+def closures_by_search(automaton: FiniteAutomaton) -> Dict[str, FrozenSet[str]]:
+    """Closure of each state with a separate search per state."""
+    closures: Dict[str, FrozenSet[str]] = {}
+    for state in automaton.states:
+        closure: Set[str] = {state.name}
+        pending = [state]
+        while pending:
+            current = pending.pop()
+            for transition in current.transitions:
+                if not transition.symbol and transition.state not in closure:
+                    closure.add(transition.state)
+                    pending.append(automaton.name2state[transition.state])
+        closures[state.name] = frozenset(closure)
+    return closures
+
+
+class TestClosures(unittest.TestCase):
+    """Tests for utils.compute_closures and utils.lambda_components."""
+
+    def _check_closures(self, automaton: FiniteAutomaton) -> None:
+        closures = utils.compute_closures(automaton)
+        self.assertEqual(
+            {
+                state.name: frozenset(member.name for member in closure)
+                for state, closure in closures.items()
+            },
+            closures_by_search(automaton),
+        )
+
+    def test_random(self) -> None:
+        """Test random automata with many lambdas."""
+        for seed in range(30):
+            with self.subTest(seed=seed):
+                self._check_closures(random_automaton(
+                    num_states=40,
+                    transitions_per_state=2.5,
+                    lambda_ratio=0.5,
+                    seed=seed,
+                ))
+
+    def test_regex(self) -> None:
+        """Test automata of regexes with nested stars."""
+        for regex in ["a*", "(a*.b*)*", "((a+λ)*.(b+λ)*)*.c", "λ"]:
+            with self.subTest(regex=regex):
+                self._check_closures(REParser().create_automaton(regex))
+
+    def test_shared_in_cycle(self) -> None:
+        """Test that the states of a lambda cycle share their closure."""
+        automaton = AutomataFormat.read(
+            """
+            Automaton:
+                q0
+                q1
+                q2
+                q3 final
+
+                q0 --> q1
+                q1 --> q2
+                q2 --> q0
+                q2 -a-> q3
+                q1 --> q3
+            """,
+        )
+        closures = utils.compute_closures(automaton)
+        q0, q1, q2, q3 = (automaton.name2state[f"q{i}"] for i in range(4))
+        self.assertIs(closures[q0], closures[q1])
+        self.assertIs(closures[q0], closures[q2])
+        self.assertEqual(closures[q0], frozenset([q0, q1, q2, q3]))
+        self.assertEqual(closures[q3], frozenset([q3]))
+
+        component_of, components = utils.lambda_components(automaton)
+        self.assertEqual(len(components), 2)
+        # q3 is reachable from the cycle, so its component comes first
+        self.assertLess(component_of[3], component_of[0])
+
+    def test_long_chain(self) -> None:
+        """Test a lambda chain longer than the recursion limit."""
+        states = [State(name=f"q{i}", is_final=False) for i in range(5000)]
+        for origin, target in zip(states, states[1:]):
+            origin.add_transitions([Transition(symbol=None, state=target.name)])
+        states[-1].is_final = True
+        automaton = FiniteAutomaton(states)
+        closures = utils.compute_closures(automaton)
+        self.assertEqual(len(closures[states[0]]), 5000)
+        self.assertEqual(len(closures[states[-1]]), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
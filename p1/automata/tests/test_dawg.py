@@ -0,0 +1,100 @@
+"""Test the construction of minimal acyclic automata."""
+import itertools
+import random
+import unittest
+from typing import List
+
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.dawg import DAWGBuilder, build_dawg
+from automata.language import (
+    _HAS_NUMPY,
+    count_accepted,
+    k_shortest,
+    sample_accepted,
+    shortest_accepted,
+)
+from automata.re_parser import REParser
+from automata.utils import is_deterministic
+
+
+class TestDAWG(unittest.TestCase):
+    """Tests for DAWGBuilder and build_dawg."""
+
+    def setUp(self) -> None:
+        """Random words over a small alphabet, with shared suffixes."""
+        rng = random.Random(0)
+        stems = ["".join(rng.choice("abc") for _ in range(rng.randint(0, 4))) for _ in range(40)]
+        self.words: List[str] = sorted({stem + suffix for stem in stems for suffix in ["", "ab", "cab"]})
+
+    def test_language(self) -> None:
+        """Test that exactly the words are accepted."""
+        automaton = build_dawg(self.words)
+        evaluator = FiniteAutomatonEvaluator(automaton)
+        self.assertTrue(is_deterministic(automaton))
+
+        words = set(self.words)
+        for size in range(8):
+            for symbols in itertools.product("abc", repeat=size):
+                string = "".join(symbols)
+                with self.subTest(string=string):
+                    self.assertEqual(evaluator.accepts(string), string in words)
+
+    def test_minimal(self) -> None:
+        """Test that the automaton is the minimal partial one."""
+        regex = "+".join(".".join(word) if word else "λ" for word in self.words)
+        minimized = REParser().create_automaton(regex).to_minimized(
+            strategy="hopcroft",
+            complete=False,
+        )
+        self.assertEqual(len(build_dawg(self.words).states), len(minimized.states))
+
+    def test_compact(self) -> None:
+        """Test the table of the automaton."""
+        builder = DAWGBuilder()
+        builder.add_words(["cat", "cats", "dog", "dog", "dogs"])
+        compact = builder.to_compact()
+
+        self.assertEqual(builder.num_words, 4)
+        self.assertEqual(compact.num_states, 7)
+        for word in ["cat", "cats", "dog", "dogs"]:
+            self.assertTrue(compact.accepts(word))
+        for word in ["", "ca", "catss", "do", "cog"]:
+            self.assertFalse(compact.accepts(word))
+
+    def test_language_analysis(self) -> None:
+        """Test the language functions on the partial tables of the words."""
+        for words in (self.words, ["ab", "b", "ba"]):
+            builder = DAWGBuilder()
+            builder.add_words(words)
+            max_len = max(len(word) for word in words)
+            expected = [
+                sum(1 for word in words if len(word) == length)
+                for length in range(max_len + 1)
+            ]
+            shortlex = sorted(words, key=lambda word: (len(word), word))
+
+            for automaton in (builder.to_compact(), builder.to_automaton()):
+                with self.subTest(words=words, automaton=type(automaton).__name__):
+                    self.assertEqual(count_accepted(automaton, max_len, use_numpy=False), expected)
+                    if _HAS_NUMPY:
+                        self.assertEqual(count_accepted(automaton, max_len, use_numpy=True), expected)
+                    self.assertEqual(shortest_accepted(automaton), shortlex[0])
+                    self.assertEqual(k_shortest(automaton, len(words) + 1), shortlex)
+                    self.assertEqual(
+                        set(sample_accepted(automaton, max_len, 200, seed=0)),
+                        {word for word in words if len(word) == max_len},
+                    )
+
+    def test_order(self) -> None:
+        """Test that the words must be sorted."""
+        builder = DAWGBuilder()
+        builder.add("b")
+        with self.assertRaises(ValueError):
+            builder.add("a")
+        builder.finish()
+        with self.assertRaises(ValueError):
+            builder.add("c")
+
+
+if __name__ == '__main__':
+    unittest.main()
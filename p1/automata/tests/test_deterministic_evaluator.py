@@ -0,0 +1,111 @@
+"""Test the deterministic engine of FiniteAutomatonEvaluator."""
+import itertools
+import unittest
+
+from automata.automaton import State
+from automata.automaton_evaluator import FiniteAutomatonEvaluator, InvalidSymbol
+from automata.generators import random_automaton
+from automata.re_parser import REParser
+
+
+class TestDeterministicEvaluator(unittest.TestCase):
+    """Tests for the evaluation of deterministic automata."""
+
+    def test_same_results(self) -> None:
+        """Test that deterministic and nondeterministic evaluations agree."""
+        for seed in range(10):
+            automaton = random_automaton(
+                num_states=8,
+                transitions_per_state=3,
+                lambda_ratio=0.2,
+                final_ratio=0.3,
+                seed=seed,
+            )
+            deterministic = automaton.to_minimized(complete=seed % 2 == 0)
+            expected = FiniteAutomatonEvaluator(automaton)
+            evaluator = FiniteAutomatonEvaluator(deterministic)
+            for size in range(6):
+                for symbols in itertools.product("ab", repeat=size):
+                    string = "".join(symbols)
+                    with self.subTest(seed=seed, string=string):
+                        self.assertEqual(evaluator.accepts(string), expected.accepts(string))
+
+    def test_same_states(self) -> None:
+        """Test that the current states follow the transitions of the automaton."""
+        for seed in range(5):
+            automaton = random_automaton(
+                num_states=8,
+                transitions_per_state=3,
+                lambda_ratio=0.2,
+                final_ratio=0.3,
+                seed=seed,
+            )
+            deterministic = automaton.to_minimized(complete=seed % 2 == 0)
+            expected = FiniteAutomatonEvaluator(automaton)
+            evaluator = FiniteAutomatonEvaluator(deterministic)
+            state = deterministic.states[0]
+            current = {state}
+            for symbol in "abbaabab":
+                with self.subTest(seed=seed, symbol=symbol):
+                    evaluator.process_symbol(symbol)
+                    expected.process_symbol(symbol)
+                    current = {
+                        deterministic.name2state[transition.state]
+                        for state in current
+                        for transition in state.transitions
+                        if transition.symbol == symbol
+                    }
+                    self.assertEqual(evaluator.current_states, current)
+                    self.assertEqual(evaluator.is_accepting(), expected.is_accepting())
+
+    def test_current_states(self) -> None:
+        """Test the current_states view."""
+        deterministic = REParser().create_automaton("a.b*").to_deterministic(complete=False)
+        evaluator = FiniteAutomatonEvaluator(deterministic)
+        self.assertEqual(evaluator.current_states, {deterministic.states[0]})
+
+        evaluator.process_symbol("a")
+        self.assertEqual(len(evaluator.current_states), 1)
+        self.assertTrue(evaluator.is_accepting())
+
+        evaluator.process_string("ba")
+        self.assertEqual(evaluator.current_states, set())
+        self.assertFalse(evaluator.is_accepting())
+
+        evaluator.current_states = {deterministic.states[0]}
+        self.assertTrue(evaluator.accepts("abb"))
+        self.assertFalse(evaluator.is_accepting())
+
+    def test_invalid_symbol(self) -> None:
+        """Test that unknown symbols are still reported."""
+        evaluator = FiniteAutomatonEvaluator(REParser().create_automaton("a.b").to_minimized())
+        with self.assertRaises(InvalidSymbol):
+            evaluator.process_symbol("x")
+        with self.assertRaises(InvalidSymbol):
+            evaluator.process_string("ax")
+        self.assertFalse(evaluator.accepts("ax"))
+
+    def test_unknown_state(self) -> None:
+        """Test that assigning a state of another automaton fails."""
+        evaluator = FiniteAutomatonEvaluator(REParser().create_automaton("a.b").to_minimized())
+        with self.assertRaises(ValueError):
+            evaluator.current_states = {State("unknown")}
+
+    def test_several_states(self) -> None:
+        """Test that assigning several states falls back to sets of states."""
+        deterministic = REParser().create_automaton("a.b+b.a").to_minimized()
+        evaluator = FiniteAutomatonEvaluator(deterministic)
+        initial = deterministic.states[0]
+        after_a = deterministic.name2state[
+            next(t.state for t in initial.transitions if t.symbol == "a")
+        ]
+        after_b = deterministic.name2state[
+            next(t.state for t in initial.transitions if t.symbol == "b")
+        ]
+        evaluator.current_states = {after_a, after_b}
+        evaluator.process_symbol("a")
+        self.assertTrue(evaluator.is_accepting())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""Test the early rejection of the evaluators."""
+import unittest
+from typing import List, Union
+
+from automata.automaton_evaluator import (
+    BackwardEvaluator,
+    BitParallelEvaluator,
+    FiniteAutomatonEvaluator,
+    LazyDFAEvaluator,
+)
+from automata.re_parser import REParser
+
+
+class CountingEvaluator(FiniteAutomatonEvaluator):
+    """Evaluator that counts the symbols processed."""
+
+    processed: int = 0
+
+    def process_symbol(self, symbol: str) -> None:
+        self.processed += 1
+        super().process_symbol(symbol)
+
+
+class TestEarlyRejection(unittest.TestCase):
+    """Tests for is_dead and the short-circuit of process_string."""
+
+    def setUp(self) -> None:
+        """Deterministic automaton with an 'empty' sink state."""
+        self.automaton = REParser().create_automaton("a.b*.c")
+        self.deterministic = self.automaton.to_deterministic()
+
+    def test_sink(self) -> None:
+        """Test that the evaluation stops in the sink state."""
+        evaluator = FiniteAutomatonEvaluator(self.deterministic)
+        self.assertFalse(evaluator.is_dead())
+
+        # the symbols after the sink state are not even read
+        evaluator.process_string("aca" + "x" * 1000)
+        self.assertTrue(evaluator.is_dead())
+        self.assertEqual(evaluator.current_states, {self.deterministic.name2state["empty"]})
+
+        self.assertFalse(evaluator.accepts("bx"))
+
+    def test_nondeterministic(self) -> None:
+        """Test that states that can not reach a final state are dead."""
+        evaluator = CountingEvaluator(self.automaton)
+        self.assertTrue(evaluator.accepts("abbbc"))
+        evaluator.processed = 0
+        evaluator.process_string("b" + "c" * 100)
+        self.assertTrue(evaluator.is_dead())
+        self.assertEqual(evaluator.processed, 1)
+
+    def test_other_evaluators(self) -> None:
+        """Test that the other evaluators give the same results."""
+        expected = FiniteAutomatonEvaluator(self.deterministic)
+        evaluators: List[Union[FiniteAutomatonEvaluator, BitParallelEvaluator]] = [
+            LazyDFAEvaluator(self.automaton),
+            BitParallelEvaluator(self.deterministic),
+            BackwardEvaluator(self.automaton),
+        ]
+        for evaluator in evaluators:
+            for string in ["ac", "abbc", "ca", "acc", "a", "", "ab" * 50]:
+                with self.subTest(evaluator=type(evaluator).__name__, string=string):
+                    self.assertEqual(evaluator.accepts(string), expected.accepts(string))
+
+        bit_parallel = BitParallelEvaluator(self.deterministic)
+        bit_parallel.process_string("c")
+        self.assertTrue(bit_parallel.is_dead())
+
+
+if __name__ == '__main__':
+    unittest.main()
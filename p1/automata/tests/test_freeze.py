@@ -0,0 +1,99 @@
+"""Test the frozen automata."""
+import unittest
+
+from automata.automaton import (
+    FiniteAutomaton,
+    FrozenAutomaton,
+    State,
+    Transition,
+    utils,
+)
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.re_parser import REParser
+from automata.utils import AutomataFormat, deterministic_automata_isomorphism
+
+
+class TestFreeze(unittest.TestCase):
+    """Tests for FiniteAutomaton.freeze and FrozenAutomaton."""
+
+    def setUp(self) -> None:
+        """Automaton of a regex with lambdas."""
+        self.automaton = REParser().create_automaton("(a.b+c)*.a")
+
+    def test_properties(self) -> None:
+        """Test that the cached properties match the original ones."""
+        frozen = self.automaton.freeze()
+
+        self.assertEqual(frozen.alphabet, self.automaton.alphabet)
+        self.assertEqual(frozen.final_states, self.automaton.final_states)
+        self.assertEqual(frozen.closures, self.automaton.closures)
+        self.assertEqual(frozen.accessible_states, self.automaton.accessible_states)
+        self.assertTrue(frozen.has_lambdas)
+        self.assertFalse(frozen.is_deterministic)
+        self.assertTrue(frozen.to_minimized().is_deterministic)
+
+    def test_cached(self) -> None:
+        """Test that the properties are computed only once."""
+        frozen = self.automaton.freeze()
+        self.assertIs(frozen.closures, frozen.closures)
+        self.assertIs(utils.compute_closures(frozen), frozen.closures)
+        self.assertIs(
+            FiniteAutomatonEvaluator(frozen).closures,
+            FiniteAutomatonEvaluator(frozen).closures,
+        )
+        self.assertIs(frozen.freeze(), frozen)
+
+    def test_immutable(self) -> None:
+        """Test that the frozen automaton is a copy and can not be modified."""
+        frozen = self.automaton.freeze()
+        with self.assertRaises(AttributeError):
+            frozen.states = ()
+        with self.assertRaises(AttributeError):
+            frozen.states.append(State("new"))  # type: ignore[attr-defined]
+        with self.assertRaises(AttributeError):
+            frozen.states[0].add_transitions([Transition(symbol="a", state="0")])
+        with self.assertRaises(AttributeError):
+            frozen.states[0].transitions.append(
+                Transition(symbol="a", state="0"),
+            )
+        with self.assertRaises(AttributeError):
+            frozen.states[0].is_final = True
+        with self.assertRaises(AttributeError):
+            frozen.states[0].transitions[0].state = "0"
+
+        self.automaton.states[0].is_final = True
+        self.assertFalse(frozen.states[0].is_final)
+
+    def test_thaw(self) -> None:
+        """Test that thaw gives a mutable copy."""
+        frozen = self.automaton.freeze()
+        thawed = frozen.thaw()
+
+        self.assertNotIsInstance(thawed, FrozenAutomaton)
+        self.assertIsInstance(thawed, FiniteAutomaton)
+        thawed.states[0].is_final = True
+        self.assertFalse(frozen.states[0].is_final)
+
+    def test_same_results(self) -> None:
+        """Test that the algorithms give the same results when frozen."""
+        frozen = self.automaton.freeze()
+        for strategy in ["moore", "hopcroft", "brzozowski", "auto"]:
+            with self.subTest(strategy=strategy):
+                self.assertIsNotNone(deterministic_automata_isomorphism(
+                    frozen.to_minimized(strategy=strategy),
+                    self.automaton.to_minimized(strategy=strategy),
+                ))
+
+        expected = FiniteAutomatonEvaluator(self.automaton)
+        evaluator = FiniteAutomatonEvaluator(frozen)
+        for string in ["a", "aba", "ca", "cab", "abcaba", ""]:
+            with self.subTest(string=string):
+                self.assertEqual(evaluator.accepts(string), expected.accepts(string))
+        self.assertEqual(
+            AutomataFormat.write(frozen.thaw()),
+            AutomataFormat.write(frozen),
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+"""Test the random generators."""
+import io
+import unittest
+
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.generators import (
+    iter_random_regexes,
+    random_automaton,
+    random_regex,
+    symbols,
+    write_random_automaton,
+)
+from automata.re_parser import REParser
+from automata.utils import AutomataFormat
+
+
+class TestGenerators(unittest.TestCase):
+    """Tests for the random automata and regexes."""
+
+    def test_seed(self) -> None:
+        """Test that the same seed gives the same output."""
+        self.assertEqual(
+            AutomataFormat.write(random_automaton(50, seed=3)),
+            AutomataFormat.write(random_automaton(50, seed=3)),
+        )
+        self.assertEqual(random_regex(20, seed=3), random_regex(20, seed=3))
+        self.assertNotEqual(
+            list(iter_random_regexes(5, length=20, seed=3)),
+            list(iter_random_regexes(5, length=20, seed=4)),
+        )
+
+    def test_symbols(self) -> None:
+        """Test that the symbols are not part of the regex syntax."""
+        alphabet = symbols(2000)
+        self.assertEqual(len(set(alphabet)), 2000)
+        self.assertTrue(set(alphabet).isdisjoint("λ*+.()"))
+        self.assertEqual(symbols(3), ["a", "b", "c"])
+
+    def test_automaton_parameters(self) -> None:
+        """Test the shape of the random automata."""
+        automaton = random_automaton(
+            200,
+            alphabet_size=70,
+            transitions_per_state=3,
+            lambda_ratio=0.0,
+            final_ratio=1.0,
+            seed=1,
+        )
+        self.assertEqual(len(automaton.states), 200)
+        self.assertTrue(all(state.is_final for state in automaton.states))
+        self.assertTrue(all(
+            transition.symbol is not None
+            for state in automaton.states
+            for transition in state.transitions
+        ))
+
+        lambdas = random_automaton(200, lambda_ratio=1.0, seed=1)
+        self.assertTrue(all(
+            transition.symbol is None
+            for state in lambdas.states
+            for transition in state.transitions
+        ))
+
+    def test_write(self) -> None:
+        """Test that the streamed automaton can be read back."""
+        output = io.StringIO()
+        write_random_automaton(output, 100, lambda_ratio=0.2, seed=7)
+        automaton = AutomataFormat.read(output.getvalue())
+        expected = random_automaton(100, lambda_ratio=0.2, seed=7)
+
+        self.assertEqual(
+            [(s.name, s.is_final, set(s.transitions)) for s in automaton.states],
+            [(s.name, s.is_final, set(s.transitions)) for s in expected.states],
+        )
+
+    def test_regexes(self) -> None:
+        """Test that the random regexes can be parsed."""
+        for regex in iter_random_regexes(50, length=12, depth=5, alphabet_size=3, seed=0):
+            with self.subTest(regex=regex):
+                self.assertEqual(sum(symbol in "abc" for symbol in regex), 12)
+                evaluator = FiniteAutomatonEvaluator(REParser().create_automaton(regex))
+                evaluator.accepts("abcabc")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,238 @@
+"""Test the analysis of the accepted language."""
+import itertools
+from typing import List
+import unittest
+
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.compact import CompactDFA
+from automata.generators import random_automaton
+from automata.language import (
+    _HAS_NUMPY,
+    count_accepted,
+    density,
+    distinguishing_string,
+    k_shortest,
+    sample_accepted,
+    shortest_accepted,
+)
+from automata.re_parser import REParser
+
+
+class TestCountAccepted(unittest.TestCase):
+    """Tests for count_accepted and density."""
+
+    def _brute_force(self, regex: str, alphabet: str, max_len: int) -> List[int]:
+        evaluator = FiniteAutomatonEvaluator(REParser().create_automaton(regex))
+        return [
+            sum(
+                evaluator.accepts("".join(symbols))
+                for symbols in itertools.product(alphabet, repeat=length)
+            )
+            for length in range(max_len + 1)
+        ]
+
+    def test_counts(self) -> None:
+        """Compare with the enumeration of every string."""
+        for regex, alphabet in [
+            ("(a+b)*.a.(a+b)", "ab"),
+            ("a.b*.(a+c.b)*", "abc"),
+            ("(a*.b.a*.b.a*)*", "ab"),
+        ]:
+            deterministic = REParser().create_automaton(regex).to_minimized()
+            expected = self._brute_force(regex, alphabet, 7)
+            with self.subTest(regex=regex):
+                self.assertEqual(count_accepted(deterministic, 7, use_numpy=False), expected)
+                if _HAS_NUMPY:
+                    self.assertEqual(count_accepted(deterministic, 7, use_numpy=True), expected)
+
+    def test_big_counts(self) -> None:
+        """Test counts that do not fit in 64 bits."""
+        deterministic = REParser().create_automaton("(a+b+c)*").to_deterministic()
+
+        self.assertEqual(count_accepted(deterministic, 100, use_numpy=False)[100], 3 ** 100)
+        self.assertEqual(
+            count_accepted(deterministic, 100, modulus=1000003, use_numpy=False)[100],
+            pow(3, 100, 1000003),
+        )
+        if _HAS_NUMPY:
+            self.assertEqual(count_accepted(deterministic, 100, use_numpy=True)[100], 3 ** 100)
+            self.assertEqual(
+                count_accepted(deterministic, 100, modulus=1000003, use_numpy=True)[100],
+                pow(3, 100, 1000003),
+            )
+
+    def test_density(self) -> None:
+        """Test the fraction of accepted strings."""
+        deterministic = REParser().create_automaton("(a+b)*.a").to_deterministic()
+
+        self.assertEqual(density(deterministic, 0), 0.0)
+        self.assertEqual(density(deterministic, 10), 0.5)
+
+    def test_not_deterministic(self) -> None:
+        """Test that non deterministic automata are rejected."""
+        with self.assertRaises(ValueError):
+            count_accepted(REParser().create_automaton("a*"), 3)
+
+
+class TestShortest(unittest.TestCase):
+    """Tests for shortest_accepted, k_shortest and distinguishing_string."""
+
+    def test_shortest(self) -> None:
+        """Test the shortest accepted string."""
+        parser = REParser()
+        self.assertEqual(
+            shortest_accepted(parser.create_automaton("b.b.b+a.(a+b).(a+b)*").to_deterministic()),
+            "aa",
+        )
+        self.assertEqual(shortest_accepted(parser.create_automaton("a*").to_deterministic()), "")
+        self.assertIsNone(shortest_accepted(parser.create_automaton("").to_deterministic()))
+
+    def test_k_shortest(self) -> None:
+        """Test the first accepted strings in shortlex order."""
+        deterministic = REParser().create_automaton("(a+b)*.a").to_minimized()
+
+        self.assertEqual(
+            k_shortest(deterministic, 6),
+            ["a", "aa", "ba", "aaa", "aba", "baa"],
+        )
+        finite = REParser().create_automaton("a.b+b+a.a.a").to_deterministic()
+        self.assertEqual(k_shortest(finite, 10), ["b", "ab", "aaa"])
+
+    def test_k_shortest_deep(self) -> None:
+        """Test a language whose strings are all long."""
+        deterministic = REParser().create_automaton(".".join(["(a+b)"] * 30) + ".c").to_minimized()
+        self.assertEqual(k_shortest(deterministic, 1), ["a" * 30 + "c"])
+        self.assertEqual(
+            k_shortest(deterministic, 3),
+            ["a" * 30 + "c", "a" * 29 + "bc", "a" * 28 + "bac"],
+        )
+
+    def test_k_shortest_random(self) -> None:
+        """Compare with the enumeration of every string."""
+        for seed in range(10):
+            automaton = random_automaton(
+                num_states=6,
+                transitions_per_state=2.5,
+                final_ratio=0.3,
+                seed=seed,
+            )
+            evaluator = FiniteAutomatonEvaluator(automaton)
+            expected = [
+                "".join(symbols)
+                for length in range(7)
+                for symbols in itertools.product("ab", repeat=length)
+                if evaluator.accepts("".join(symbols))
+            ][:20]
+            with self.subTest(seed=seed):
+                self.assertEqual(
+                    k_shortest(automaton.to_minimized(complete=seed % 2 == 0), 20)[:len(expected)],
+                    expected,
+                )
+
+    def test_distinguishing_string(self) -> None:
+        """Test the counterexamples of equivalence."""
+        parser = REParser()
+        even_b1 = parser.create_automaton("(a*.b.a*.b.a*)*").to_deterministic()
+        even_b2 = parser.create_automaton("(a+b.a*.b)*").to_minimized()
+        no_bb = parser.create_automaton("(λ+b).(a+a.b)*").to_deterministic()
+
+        self.assertIsNone(distinguishing_string(even_b1, even_b2))
+        self.assertEqual(distinguishing_string(even_b1, no_bb), "b")
+        self.assertEqual(
+            distinguishing_string(
+                parser.create_automaton("a.a*").to_deterministic(),
+                parser.create_automaton("a+a.c").to_deterministic(),
+            ),
+            "aa",
+        )
+
+
+class TestSample(unittest.TestCase):
+    """Tests for sample_accepted."""
+
+    def test_accepted(self) -> None:
+        """Test that every sample is accepted and has the right length."""
+        automaton = REParser().create_automaton("a.b*.(a+c.b)*")
+        evaluator = FiniteAutomatonEvaluator(automaton)
+        samples = sample_accepted(automaton.to_minimized(), 12, 200, seed=1)
+
+        self.assertEqual(len(samples), 200)
+        for sample in samples:
+            self.assertEqual(len(sample), 12)
+            self.assertTrue(evaluator.accepts(sample))
+        self.assertEqual(samples, sample_accepted(automaton.to_minimized(), 12, 200, seed=1))
+
+    def test_uniform(self) -> None:
+        """Test that all the accepted strings are drawn evenly."""
+        deterministic = REParser().create_automaton("(a+b)*.a.(a+b)").to_minimized()
+        samples = sample_accepted(deterministic, 3, 4000, seed=0)
+        frequencies = {sample: samples.count(sample) for sample in set(samples)}
+
+        self.assertEqual(set(frequencies), {"aaa", "aab", "baa", "bab"})
+        for frequency in frequencies.values():
+            self.assertGreater(frequency, 850)
+            self.assertLess(frequency, 1150)
+
+    def test_empty(self) -> None:
+        """Test a length without accepted strings."""
+        deterministic = REParser().create_automaton("a.a").to_deterministic()
+        with self.assertRaises(ValueError):
+            sample_accepted(deterministic, 3, 1)
+
+
+class TestPartial(unittest.TestCase):
+    """Tests for partial automata, whose missing transitions are -1."""
+
+    def setUp(self) -> None:
+        """Partial tables of the language {ab, b, ba}."""
+        self.compact = CompactDFA(
+            alphabet=["a", "b"],
+            table=[[1, 2], [-1, 3], [3, -1], [-1, -1]],
+            finals=[False, False, True, True],
+        )
+        self.automaton = REParser().create_automaton("a.b+b+b.a").to_minimized(complete=False)
+        self.assertTrue(any(-1 in row for row in CompactDFA.from_automaton(
+            self.automaton,
+            complete=False,
+        ).table))
+
+    def test_count(self) -> None:
+        """Test the counts with both backends."""
+        for automaton in (self.compact, self.automaton):
+            with self.subTest(automaton=automaton):
+                self.assertEqual(count_accepted(automaton, 3, use_numpy=False), [0, 1, 2, 0])
+                if _HAS_NUMPY:
+                    self.assertEqual(count_accepted(automaton, 3, use_numpy=True), [0, 1, 2, 0])
+                self.assertEqual(density(automaton, 2), 0.5)
+
+    def test_shortest(self) -> None:
+        """Test the shortest strings."""
+        for automaton in (self.compact, self.automaton):
+            with self.subTest(automaton=automaton):
+                self.assertEqual(shortest_accepted(automaton), "b")
+                self.assertEqual(k_shortest(automaton, 10), ["b", "ab", "ba"])
+
+    def test_distinguishing_string(self) -> None:
+        """Test partial and complete automata of the same language."""
+        complete = REParser().create_automaton("a.b+b+b.a").to_minimized()
+        self.assertIsNone(distinguishing_string(self.compact, complete))
+        self.assertIsNone(distinguishing_string(self.automaton, self.compact))
+        self.assertEqual(
+            distinguishing_string(
+                self.compact,
+                REParser().create_automaton("a.b+b+b.b").to_minimized(complete=False),
+            ),
+            "ba",
+        )
+
+    def test_sample(self) -> None:
+        """Test that the samples are accepted."""
+        for automaton in (self.compact, self.automaton):
+            with self.subTest(automaton=automaton):
+                self.assertEqual(set(sample_accepted(automaton, 2, 100, seed=0)), {"ab", "ba"})
+                with self.assertRaises(ValueError):
+                    sample_accepted(automaton, 3, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+"""Test the extraction of the literals required by a regex."""
+import itertools
+import unittest
+
+from automata.automaton_evaluator import FiniteAutomatonEvaluator, LazyDFAEvaluator
+from automata.generators import iter_random_regexes
+from automata.literals import RequiredLiterals, required_literals
+from automata.re_parser import REParser
+
+
+class TestRequiredLiterals(unittest.TestCase):
+    """Tests for required_literals and the evaluators that use them."""
+
+    def test_concatenation(self) -> None:
+        """Test literals around starred subexpressions."""
+        literals = required_literals("(a+b)*.u.a.m.(a+b)*.e.s")
+        self.assertIsNone(literals.exact)
+        self.assertEqual(literals.prefixes, {""})
+        self.assertEqual(literals.suffixes, {"es"})
+        self.assertEqual(literals.required, {"uam", "es"})
+
+        self.assertTrue(literals.may_match("abuamaes"))
+        self.assertFalse(literals.may_match("abuames"[:-1]))
+        self.assertFalse(literals.may_match("abaes"))
+
+    def test_union(self) -> None:
+        """Test alternatives."""
+        literals = required_literals("(a.b+a.c).d*.x.y.z")
+        self.assertEqual(literals.prefixes, {"ab", "ac"})
+        self.assertEqual(literals.suffixes, {"xyz"})
+        self.assertEqual(literals.required, {"a", "xyz"})
+
+        literals = required_literals("(x.a.b.c+a.b.c.y).z*")
+        self.assertEqual(literals.required, {"abc"})
+
+    def test_exact(self) -> None:
+        """Test regexes with few strings."""
+        self.assertEqual(required_literals("a.(b+c).(λ+d)").exact, {"ab", "ac", "abd", "acd"})
+        self.assertEqual(required_literals("λ*").exact, {""})
+        self.assertEqual(required_literals("").exact, set())
+        self.assertTrue(required_literals("(a+b)*").is_trivial)
+
+    def test_random_regexes(self) -> None:
+        """Test that no accepted string is rejected by the literals."""
+        for regex in iter_random_regexes(count=100, length=6, alphabet_size=3, seed=0):
+            automaton = REParser().create_automaton(regex)
+            evaluator = FiniteAutomatonEvaluator(automaton)
+            literals = required_literals(regex)
+            for size in range(6):
+                for symbols in itertools.product("abc", repeat=size):
+                    string = "".join(symbols)
+                    with self.subTest(regex=regex, string=string):
+                        accepted = evaluator.accepts(string)
+                        if literals.exact is not None:
+                            self.assertEqual(literals.may_match(string), accepted)
+                        elif accepted:
+                            self.assertTrue(literals.may_match(string))
+
+    def test_evaluator(self) -> None:
+        """Test that the evaluators reject without reading the string."""
+        regex = "(a+b)*.u.a.m.(a+b)*"
+        automaton = REParser().create_automaton(regex)
+        literals = required_literals(regex)
+
+        for evaluator in (
+            FiniteAutomatonEvaluator(automaton, literals=literals),
+            FiniteAutomatonEvaluator(automaton.to_deterministic(), literals=literals),
+            LazyDFAEvaluator(automaton, literals=literals),
+        ):
+            with self.subTest(evaluator=evaluator):
+                self.assertTrue(evaluator.accepts("abuamb"))
+                self.assertFalse(evaluator.accepts("abuab"))
+                # symbols out of the alphabet are never read
+                self.assertFalse(evaluator.accepts("x" * 1000))
+
+                # the literals are not checked in the middle of a string
+                evaluator.process_string("ua")
+                self.assertTrue(evaluator.accepts("m"))
+
+    def test_trivial(self) -> None:
+        """Test that trivial literals are ignored."""
+        automaton = REParser().create_automaton("(a+b)*")
+        evaluator = FiniteAutomatonEvaluator(automaton, literals=RequiredLiterals())
+        self.assertIsNone(evaluator.literals)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+"""Test the deterministic automata without sink state."""
+import itertools
+import unittest
+
+from automata.automaton import DFAError, FiniteAutomaton, Transition
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.compact import CompactDFA
+from automata.re_parser import REParser
+from automata.utils import AutomataFormat, is_deterministic
+
+STRATEGIES = ["moore", "hopcroft", "brzozowski", "vectorized", "auto"]
+
+
+class TestPartial(unittest.TestCase):
+    """Tests for partial deterministic automata."""
+
+    def _assert_same_language(
+        self,
+        automaton1: FiniteAutomaton,
+        automaton2: FiniteAutomaton,
+        alphabet: str,
+    ) -> None:
+        evaluator1 = FiniteAutomatonEvaluator(automaton1)
+        evaluator2 = FiniteAutomatonEvaluator(automaton2)
+        for size in range(6):
+            for symbols in itertools.product(alphabet, repeat=size):
+                string = "".join(symbols)
+                with self.subTest(string=string):
+                    self.assertEqual(evaluator1.accepts(string), evaluator2.accepts(string))
+
+    def test_to_deterministic(self) -> None:
+        """Test that no sink state is added."""
+        automaton = REParser().create_automaton("a.b*.(a+c.b)")
+        complete = automaton.to_deterministic()
+        partial = automaton.to_deterministic(complete=False)
+
+        self.assertTrue(is_deterministic(partial))
+        self.assertEqual(len(partial.states), len(complete.states) - 1)
+        self.assertNotIn("empty", partial.name2state)
+        self._assert_same_language(partial, automaton, "abc")
+
+    def test_to_minimized(self) -> None:
+        """Test the minimal partial automaton of every strategy."""
+        automaton = REParser().create_automaton("(a.b+c)*.a.(a+b)")
+        expected = len(automaton.to_minimized().states) - 1
+        for strategy in STRATEGIES:
+            with self.subTest(strategy=strategy):
+                minimized = automaton.to_minimized(strategy=strategy, complete=False)
+                self.assertTrue(is_deterministic(minimized))
+                self.assertEqual(len(minimized.states), expected)
+                self._assert_same_language(minimized, automaton, "abc")
+
+    def test_implicit_dead_state(self) -> None:
+        """Test that explicit dead states join the missing transitions."""
+        automaton = AutomataFormat.read(
+            """
+            Automaton:
+                q0
+                q1 final
+                d1
+                d2
+
+                q0 -a-> q1
+                q0 -b-> d1
+                q1 -a-> q1
+                d1 -a-> d2
+                d2 -b-> d1
+            """,
+        )
+        for strategy in STRATEGIES:
+            with self.subTest(strategy=strategy):
+                minimized = automaton.to_minimized(strategy=strategy, complete=False)
+                self.assertEqual(len(minimized.states), 2)
+                self._assert_same_language(minimized, automaton, "ab")
+
+                completed = automaton.to_minimized(strategy=strategy)
+                self.assertEqual(len(completed.states), 3)
+
+    def test_empty_language(self) -> None:
+        """Test an automaton that accepts nothing."""
+        automaton = AutomataFormat.read(
+            """
+            Automaton:
+                q0
+                q1
+
+                q0 -a-> q1
+            """,
+        )
+        for strategy in STRATEGIES:
+            with self.subTest(strategy=strategy):
+                minimized = automaton.to_minimized(strategy=strategy, complete=False)
+                self.assertEqual(len(minimized.states), 1)
+                self.assertFalse(minimized.states[0].is_final)
+                self.assertEqual(minimized.states[0].transitions, [])
+
+                completed = automaton.to_minimized(strategy=strategy)
+                self.assertEqual(len(completed.states), 1)
+                self.assertEqual(
+                    completed.states[0].transitions,
+                    [Transition(symbol="a", state=completed.states[0].name)],
+                )
+
+    def test_compact(self) -> None:
+        """Test tables with missing transitions."""
+        automaton = REParser().create_automaton("a.b*.(a+c.b)")
+        partial = automaton.to_deterministic(complete=False)
+        with self.assertRaises(DFAError):
+            CompactDFA.from_automaton(partial)
+
+        compact = CompactDFA.from_automaton(partial, complete=False)
+        self.assertTrue(any(-1 in row for row in compact.table))
+        self.assertTrue(compact.accepts("abbcb"))
+        self.assertFalse(compact.accepts("abbcbc"))
+        self.assertFalse(compact.accepts("b"))
+
+        minimized = compact.minimized(use_numpy=False)
+        self.assertEqual(
+            minimized.num_states,
+            len(automaton.to_minimized(complete=False).states),
+        )
+        self._assert_same_language(minimized.to_automaton(), automaton, "abc")
+
+        completed = compact.completed()
+        self.assertEqual(completed.num_states, compact.num_states + 1)
+        self.assertFalse(any(-1 in row for row in completed.table))
+        self._assert_same_language(completed.to_automaton(), automaton, "abc")
+        self.assertIs(completed.completed(), completed)
+
+    def test_evaluator_stops(self) -> None:
+        """Test that the evaluation stops after a missing transition."""
+        partial = REParser().create_automaton("a.b").to_deterministic(complete=False)
+        evaluator = FiniteAutomatonEvaluator(partial)
+        evaluator.process_string("bxyz")
+        self.assertEqual(evaluator.current_states, set())
+        self.assertFalse(evaluator.accepts("abz"))
+
+
+if __name__ == '__main__':
+    unittest.main()
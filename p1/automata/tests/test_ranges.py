@@ -0,0 +1,132 @@
+"""Test the automata with range transitions."""
+import unittest
+from typing import List, Set
+
+from automata.ranges import (
+    RangeAutomaton,
+    RangeDFAEvaluator,
+    RangeState,
+    RangeTransition,
+    char_ranges,
+    normalize_ranges,
+)
+from automata.re_parser import REParser
+
+LETTERS = [(ord("A"), ord("Z")), (ord("a"), ord("z")), (0xC0, 0x24F), (0x391, 0x3C9)]
+DIGITS = [(ord("0"), ord("9"))]
+
+
+def nfa_accepts(automaton: RangeAutomaton, string: str) -> bool:
+    """Simulate the automaton directly on the ranges."""
+    def closure(names: Set[str]) -> Set[str]:
+        pending = list(names)
+        while pending:
+            state = automaton.name2state[pending.pop()]
+            for transition in state.transitions:
+                if transition.ranges is None and transition.state not in names:
+                    names.add(transition.state)
+                    pending.append(transition.state)
+        return names
+
+    current = closure({automaton.states[0].name})
+    for symbol in string:
+        code_point = ord(symbol)
+        current = closure({
+            transition.state
+            for name in current
+            for transition in automaton.name2state[name].transitions
+            if transition.ranges is not None
+            and any(first <= code_point <= last for first, last in transition.ranges)
+        })
+    return any(automaton.name2state[name].is_final for name in current)
+
+
+class TestRanges(unittest.TestCase):
+    """Tests for RangeAutomaton and RangeDFAEvaluator."""
+
+    def setUp(self) -> None:
+        """Identifiers (a letter and then letters, digits or '_'),
+        or a word with a Greek letter, with overlapping transitions."""
+        self.automaton = RangeAutomaton([
+            RangeState("q0", transitions=[
+                RangeTransition(LETTERS, "ident"),
+                RangeTransition(None, "w0"),
+            ]),
+            RangeState("ident", is_final=True, transitions=[
+                RangeTransition(LETTERS + DIGITS + [(ord("_"), ord("_"))], "ident"),
+            ]),
+            RangeState("w0", transitions=[
+                RangeTransition(LETTERS, "w0"),
+                RangeTransition([(0x391, 0x3C9)], "w1"),
+            ]),
+            RangeState("w1", is_final=True, transitions=[
+                RangeTransition(LETTERS, "w1"),
+            ]),
+        ])
+        self.strings: List[str] = [
+            "", "a", "a1", "1a", "x_9", "αβγ", "aλ", "Ñandú2", "a b",
+            "ωa1", "_", "zz一", "一", "Ωmega", "b\U0001F600",
+        ]
+
+    def test_normalize(self) -> None:
+        """Test that ranges are sorted and merged."""
+        self.assertEqual(
+            normalize_ranges([(10, 20), (0, 3), (4, 5), (15, 30), (40, 40)]),
+            ((0, 5), (10, 30), (40, 40)),
+        )
+        self.assertEqual(char_ranges("cab"), ((97, 99),))
+        with self.assertRaises(ValueError):
+            normalize_ranges([(5, 4)])
+
+    def test_minterms(self) -> None:
+        """Test that the minterms split the overlapping ranges."""
+        minterms = self.automaton.minterms()
+        self.assertIn((0x391, 0x3C9), minterms)
+        self.assertIn((ord("0"), ord("9")), minterms)
+        for (_, last), (next_first, _) in zip(minterms, minterms[1:]):
+            self.assertLess(last, next_first)
+
+    def test_deterministic(self) -> None:
+        """Test the determinization and the evaluator."""
+        deterministic = self.automaton.to_deterministic()
+        evaluator = RangeDFAEvaluator(deterministic)
+        for string in self.strings:
+            with self.subTest(string=string):
+                self.assertEqual(
+                    evaluator.accepts(string),
+                    nfa_accepts(self.automaton, string),
+                )
+
+    def test_minimized(self) -> None:
+        """Test that the minimal automaton has one transition per state
+        (the words are also identifiers)."""
+        minimized = self.automaton.to_minimized()
+        evaluator = RangeDFAEvaluator(minimized)
+        for string in self.strings:
+            with self.subTest(string=string):
+                self.assertEqual(
+                    evaluator.accepts(string),
+                    nfa_accepts(self.automaton, string),
+                )
+        self.assertEqual(len(minimized.states), 2)
+        for state in minimized.states:
+            self.assertEqual(len(state.transitions), 1)
+
+    def test_from_automaton(self) -> None:
+        """Test the conversion of an automaton of a regex."""
+        automaton = REParser().create_automaton("(a+b+c).(d+e)*")
+        evaluator = RangeDFAEvaluator(
+            RangeAutomaton.from_automaton(automaton).to_minimized(),
+        )
+        self.assertTrue(evaluator.accepts("bdede"))
+        self.assertFalse(evaluator.accepts("bdx"))
+        self.assertFalse(evaluator.accepts("d"))
+
+    def test_nondeterministic(self) -> None:
+        """Test that the evaluator rejects overlapping transitions."""
+        with self.assertRaises(ValueError):
+            RangeDFAEvaluator(self.automaton)
+
+
+if __name__ == '__main__':
+    unittest.main()
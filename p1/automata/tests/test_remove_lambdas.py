@@ -0,0 +1,43 @@
+"""Test lambda elimination."""
+import itertools
+import unittest
+
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.re_parser import REParser
+
+
+class TestRemoveLambdas(unittest.TestCase):
+    """Check that removing lambdas keeps the language."""
+
+    def _check_regex(self, regex: str, alphabet: str, length: int) -> None:
+        original = REParser().create_automaton(regex)
+        lambda_free = original.remove_lambdas()
+
+        self.assertFalse(any(
+            transition.symbol is None
+            for state in lambda_free.states
+            for transition in state.transitions
+        ))
+        self.assertLess(len(lambda_free.states), len(original.states))
+
+        original_evaluator = FiniteAutomatonEvaluator(original)
+        evaluator = FiniteAutomatonEvaluator(lambda_free)
+        for size in range(length + 1):
+            for symbols in itertools.product(alphabet, repeat=size):
+                string = "".join(symbols)
+                with self.subTest(regex=regex, string=string):
+                    self.assertEqual(
+                        evaluator.accepts(string),
+                        original_evaluator.accepts(string),
+                    )
+
+    def test_regexes(self) -> None:
+        """Test several regexes."""
+        self._check_regex("H.e.l.l.o", "Hello", 5)
+        self._check_regex("a.b*.(a+c.b)*", "abc", 5)
+        self._check_regex("(λ+b).(a+a.b)*", "ab", 6)
+        self._check_regex("(a*.b.a*.b.a*)*", "ab", 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
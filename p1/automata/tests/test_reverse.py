@@ -0,0 +1,52 @@
+"""Test reversed automata and backward evaluation."""
+import itertools
+import unittest
+
+from automata.automaton_evaluator import BackwardEvaluator, FiniteAutomatonEvaluator
+from automata.re_parser import REParser
+from automata.utils import AutomataFormat
+
+
+class TestReverse(unittest.TestCase):
+    """Tests for FiniteAutomaton.reverse and BackwardEvaluator."""
+
+    def _check_regex(self, regex: str, alphabet: str, length: int) -> None:
+        automaton = REParser().create_automaton(regex)
+        evaluator = FiniteAutomatonEvaluator(automaton)
+        reversed_evaluator = FiniteAutomatonEvaluator(automaton.reverse())
+        backward_evaluator = BackwardEvaluator(automaton)
+
+        for size in range(length + 1):
+            for symbols in itertools.product(alphabet, repeat=size):
+                string = "".join(symbols)
+                with self.subTest(regex=regex, string=string):
+                    accepted = evaluator.accepts(string)
+                    self.assertEqual(reversed_evaluator.accepts(string[::-1]), accepted)
+                    self.assertEqual(backward_evaluator.accepts(string), accepted)
+
+    def test_regexes(self) -> None:
+        """Test several regexes."""
+        self._check_regex("H.e.l.l.o", "Hlo", 5)
+        self._check_regex("a.b*.(a+c.b)*", "abc", 5)
+        self._check_regex("(a+b)*.a.(a+b)", "ab", 6)
+
+    def test_name_clash(self) -> None:
+        """Test that the new initial state gets a fresh name."""
+        automaton = AutomataFormat.read(
+            """
+            Automaton:
+                start
+                end final
+
+                start -a-> end
+            """
+        )
+        reversed_automaton = automaton.reverse()
+
+        self.assertEqual(reversed_automaton.states[0].name, "_start")
+        self.assertTrue(reversed_automaton.name2state["start"].is_final)
+        self.assertFalse(reversed_automaton.name2state["end"].is_final)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+"""Test the skipping of self loops in CompactDFA.accepts."""
+import itertools
+import random
+import unittest
+
+from automata.aho_corasick import AhoCorasick
+from automata.compact import CompactDFA
+from automata.re_parser import REParser
+
+
+class TestSkipLoops(unittest.TestCase):
+    """Tests for CompactDFA.skip_patterns and the accelerated accepts."""
+
+    def _check(self, compact: CompactDFA, alphabet: str, length: int) -> None:
+        plain = CompactDFA(compact.alphabet, compact.table, compact.finals)
+        plain.SKIP_MIN_LOOP_RATIO = 2.0
+        self.assertTrue(all(pattern is None for pattern in plain.skip_patterns()))
+        self.assertTrue(any(pattern is not None for pattern in compact.skip_patterns()))
+
+        for size in range(length + 1):
+            for symbols in itertools.product(alphabet, repeat=size):
+                string = "".join(symbols)
+                with self.subTest(string=string):
+                    self.assertEqual(compact.accepts(string), plain.accepts(string))
+
+    def test_regex(self) -> None:
+        """Test a regex with a starred class and an unknown symbol."""
+        automaton = REParser().create_automaton("(a+b+c)*.d.(a+b+c+d)*.e")
+        self._check(CompactDFA.from_automaton(automaton.to_minimized()), "abcdex", 6)
+
+    def test_partial(self) -> None:
+        """Test a partial automaton."""
+        automaton = REParser().create_automaton("(a+b)*.c.(a+b)*")
+        compact = CompactDFA.from_automaton(
+            automaton.to_minimized(complete=False),
+            complete=False,
+        )
+        self._check(compact, "abcx", 6)
+
+    def test_special_symbols(self) -> None:
+        """Test symbols that have a meaning inside a regex class."""
+        matcher = AhoCorasick(["^]", "\\-"], alphabet="^]\\-ab")
+        compact = matcher.to_compact()
+        self._check(compact, "^]\\-a", 5)
+
+        rng = random.Random(0)
+        text = "".join(rng.choice("ab") for _ in range(10000))
+        self.assertFalse(compact.accepts(text))
+        self.assertTrue(compact.accepts(text + "^]"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+"""Test the statistics of the construction of automata."""
+import json
+import unittest
+
+from automata.automaton import utils
+from automata.re_parser import REParser
+from automata.stats import CompilationStats
+
+
+class TestStats(unittest.TestCase):
+    """Tests for CompilationStats."""
+
+    def test_pipeline(self) -> None:
+        """Test the statistics recorded from regex to minimal automaton."""
+        stats = CompilationStats()
+        automaton = REParser().create_automaton("(a+b)*.a.(a+b)", stats=stats)
+        deterministic = automaton.to_deterministic(stats=stats)
+        automaton.to_minimized(stats=stats)
+
+        self.assertEqual(stats.peaks["nfa_states"], len(automaton.states))
+        self.assertEqual(stats.peaks["deterministic_states"], len(deterministic.states))
+        # both determinizations are counted
+        self.assertEqual(stats.counters["subsets_expanded"], 2 * len(deterministic.states))
+        self.assertGreater(stats.counters["partition_rounds"], 0)
+        self.assertEqual(stats.peaks["minimized_states"], 4)
+        self.assertEqual(
+            sum(stats.histograms["closure_size"].values()),
+            2 * len(automaton.states),
+        )
+        for phase in ["regex_parsing", "closures", "subset_construction", "minimization"]:
+            self.assertIn(phase, stats.phase_times)
+
+        exported = json.loads(stats.to_json())
+        self.assertEqual(exported["counters"], stats.counters)
+
+    def test_closures(self) -> None:
+        """Test the histogram of closure sizes."""
+        stats = CompilationStats()
+        utils.compute_closures(REParser().create_automaton("a*"), stats=stats)
+
+        self.assertEqual(stats.histograms["closure_size"], {2: 2, 3: 1})
+
+    def test_strategies(self) -> None:
+        """Test that every strategy records the minimal automaton size."""
+        for strategy in ["moore", "hopcroft", "brzozowski", "vectorized"]:
+            stats = CompilationStats()
+            REParser().create_automaton("(a+b)*.a.(a+b)").to_minimized(
+                strategy=strategy,
+                stats=stats,
+            )
+            with self.subTest(strategy=strategy):
+                self.assertGreaterEqual(stats.peaks["deterministic_states"], 4)
+                self.assertEqual(stats.peaks["minimized_states"], 4)
+                self.assertIn("subset_construction", stats.phase_times)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""Test the minimization strategies."""
+import itertools
+import unittest
+from typing import List, Tuple
+
+from automata.automaton import _HAS_NUMPY, utils
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.compact import CompactDFA
+from automata.generators import random_automaton
+from automata.re_parser import REParser
+from automata.utils import deterministic_automata_isomorphism
+
+STRATEGIES: List[str] = ["moore", "hopcroft", "brzozowski", "vectorized", "auto"]
+
+# regex, alphabet, number of states of the minimal automaton
+CASES: List[Tuple[str, str, int]] = [
+    ("H.e.l.l.o", "Helo", 7),
+    ("a.b*.(a+c.b)*", "abc", 5),
+    ("(a+b)*", "ab", 1),
+    ("(λ+b).(a+a.b)*", "ab", 3),
+    ("(a*.b.a*.b.a*)*", "ab", 2),
+    ("(a+b.a*.b)*", "ab", 2),
+    ("(a+b)*.a.(a+b).(a+b)", "ab", 8),
+]
+
+
+class TestMinimizationStrategies(unittest.TestCase):
+    """Every strategy must build the same minimal automaton."""
+
+    def test_strategies(self) -> None:
+        """Test the number of states and the language."""
+        for regex, alphabet, num_states in CASES:
+            original = REParser().create_automaton(regex)
+            original_evaluator = FiniteAutomatonEvaluator(original)
+
+            for strategy in STRATEGIES:
+                minimized = original.to_minimized(strategy=strategy)
+                evaluator = FiniteAutomatonEvaluator(minimized)
+
+                with self.subTest(regex=regex, strategy=strategy):
+                    self.assertEqual(len(minimized.states), num_states)
+
+                for size in range(6):
+                    for symbols in itertools.product(alphabet, repeat=size):
+                        string = "".join(symbols)
+                        with self.subTest(regex=regex, strategy=strategy, string=string):
+                            self.assertEqual(
+                                evaluator.accepts(string),
+                                original_evaluator.accepts(string),
+                            )
+
+    def test_unknown_strategy(self) -> None:
+        """Test that unknown strategies are rejected."""
+        with self.assertRaises(ValueError):
+            REParser().create_automaton("a").to_minimized(strategy="fast")
+
+
+class TestMooreBlocks(unittest.TestCase):
+    """Tests for utils.moore_blocks and CompactDFA.minimized."""
+
+    def test_numpy_and_python(self) -> None:
+        """Test that both versions find the same partition as Hopcroft."""
+        for seed in range(20):
+            deterministic = random_automaton(
+                num_states=12,
+                alphabet_size=3,
+                transitions_per_state=3,
+                final_ratio=0.3,
+                seed=seed,
+            ).to_deterministic()
+            compact = CompactDFA.from_automaton(deterministic)
+            expected = len(deterministic.to_minimized(strategy="hopcroft").states)
+
+            for use_numpy in ([False, True] if _HAS_NUMPY else [False]):
+                with self.subTest(seed=seed, use_numpy=use_numpy):
+                    blocks = utils.moore_blocks(
+                        compact.table, compact.finals, use_numpy=use_numpy,
+                    )
+                    self.assertEqual(len(set(blocks)), expected)
+
+    def test_compact_minimized(self) -> None:
+        """Test the minimization of the table of a deterministic automaton."""
+        automaton = REParser().create_automaton("(a+b)*.a.(a+b).(a+b)")
+        compact = CompactDFA.from_automaton(automaton.to_deterministic())
+        minimized = compact.minimized(use_numpy=False)
+
+        self.assertEqual(minimized.num_states, 8)
+        self.assertIsNotNone(deterministic_automata_isomorphism(
+            minimized.to_automaton(),
+            automaton.to_minimized(),
+        ))
+
+
+if __name__ == '__main__':
+    unittest.main()
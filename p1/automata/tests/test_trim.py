@@ -0,0 +1,73 @@
+"""Test removal of useless states."""
+import unittest
+
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.re_parser import REParser
+from automata.utils import AutomataFormat
+
+
+class TestTrim(unittest.TestCase):
+    """Tests for FiniteAutomaton.trim."""
+
+    def test_trim(self) -> None:
+        """Test an automaton with unreachable and dead states."""
+        automaton = AutomataFormat.read(
+            """
+            Automaton:
+                q0
+                q1 final
+                dead
+                deadloop
+                unreachable final
+
+                q0 -a-> q1
+                q0 -b-> dead
+                dead -a-> deadloop
+                deadloop --> dead
+                q1 -a-> q1
+                unreachable -a-> q0
+            """
+        )
+        trimmed, report = automaton.trim()
+
+        self.assertEqual([state.name for state in trimmed.states], ["q0", "q1"])
+        self.assertEqual(report.unreachable, 1)
+        self.assertEqual(report.dead, 2)
+        self.assertEqual(report.removed, 3)
+
+        evaluator = FiniteAutomatonEvaluator(automaton, trim=True)
+        self.assertTrue(evaluator.accepts("aaa"))
+        self.assertFalse(evaluator.accepts("ab"))
+        self.assertNotIn("dead", AutomataFormat.write(automaton, trim=True))
+
+    def test_empty_language(self) -> None:
+        """Test that the initial state is kept."""
+        automaton = AutomataFormat.read(
+            """
+            Automaton:
+                q0
+                q1
+
+                q0 -a-> q1
+            """
+        )
+        trimmed, report = automaton.trim()
+
+        self.assertEqual([state.name for state in trimmed.states], ["q0"])
+        self.assertEqual(trimmed.states[0].transitions, [])
+        self.assertEqual(report.dead, 1)
+
+    def test_deterministic(self) -> None:
+        """Test that trimming keeps the language of the determinized automaton."""
+        automaton = REParser().create_automaton("(a.b+a.c).b*")
+        trimmed = automaton.to_deterministic(trim=True)
+        evaluator = FiniteAutomatonEvaluator(trimmed)
+
+        for string in ["ab", "acbb", "abb"]:
+            self.assertTrue(evaluator.accepts(string))
+        for string in ["", "a", "abc", "b"]:
+            self.assertFalse(evaluator.accepts(string))
+
+
+if __name__ == '__main__':
+    unittest.main()
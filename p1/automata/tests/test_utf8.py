@@ -0,0 +1,91 @@
+"""Test the byte level (UTF-8) automata."""
+import mmap
+import tempfile
+import unittest
+
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.ranges import RangeAutomaton, RangeState, RangeTransition
+from automata.re_parser import REParser
+from automata.utf8 import ByteDFA, ByteDFAEvaluator, utf8_sequences
+
+STRINGS = ["", "a", "ñ", "añb", "€", "a€€", "😀", "a😀b", "ab", "ñ€😀", "é", "abc"]
+
+
+class TestUTF8(unittest.TestCase):
+    """Tests for utf8_sequences, ByteDFA and ByteDFAEvaluator."""
+
+    def test_sequences(self) -> None:
+        """Test that the sequences match exactly the encodings of the range."""
+        for first, last in [(0, 0x10FFFF), (0x41, 0x7A), (0x7F, 0x800), (0xD000, 0xE100), (0x1F600, 0x1F64F)]:
+            sequences = utf8_sequences(first, last)
+            for code_point in list(range(first, min(last, first + 3000) + 1)) + [last]:
+                if 0xD800 <= code_point <= 0xDFFF:
+                    continue
+                encoded = chr(code_point).encode("utf-8")
+                matching = [
+                    sequence for sequence in sequences
+                    if len(sequence) == len(encoded)
+                    and all(low <= byte <= high for byte, (low, high) in zip(encoded, sequence))
+                ]
+                with self.subTest(code_point=code_point):
+                    self.assertEqual(len(matching), 1)
+
+        self.assertEqual(utf8_sequences(0x80, 0x7FF), [[(0xC2, 0xDF), (0x80, 0xBF)]])
+        self.assertEqual(utf8_sequences(0xD800, 0xDFFF), [])
+
+    def test_regex(self) -> None:
+        """Test a regex with multi-byte characters."""
+        automaton = REParser().create_automaton("(a+ñ+€+😀)*.(b+é)")
+        expected = FiniteAutomatonEvaluator(automaton)
+        dfa = ByteDFA.from_automaton(automaton)
+        evaluator = ByteDFAEvaluator(dfa)
+        for string in STRINGS + ["añ€😀b", "😀é", "€€€é"]:
+            with self.subTest(string=string):
+                self.assertEqual(
+                    evaluator.accepts(string.encode("utf-8")),
+                    expected.accepts(string),
+                )
+
+    def test_ranges(self) -> None:
+        """Test a range automaton that accepts any non ASCII text."""
+        automaton = RangeAutomaton([
+            RangeState("q0", is_final=True, transitions=[
+                RangeTransition([(0x80, 0x10FFFF)], "q0"),
+            ]),
+        ])
+        dfa = ByteDFA.from_automaton(automaton)
+        for string in STRINGS:
+            with self.subTest(string=string):
+                self.assertEqual(
+                    dfa.accepts(string.encode("utf-8")),
+                    all(ord(char) >= 0x80 for char in string),
+                )
+        self.assertFalse(dfa.accepts(b"\xff"))
+        self.assertFalse(dfa.accepts("ñ".encode("utf-8")[:1] + b"a"))
+
+    def test_buffers(self) -> None:
+        """Test the types of inputs and the processing in chunks."""
+        dfa = ByteDFA.from_automaton(REParser().create_automaton("(a+ñ)*.€"))
+        data = "aññaa€".encode("utf-8")
+        self.assertTrue(dfa.accepts(data))
+        self.assertTrue(dfa.accepts(bytearray(data)))
+        self.assertTrue(dfa.accepts(memoryview(data)))
+
+        with tempfile.TemporaryFile() as file:
+            file.write(data)
+            file.flush()
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                self.assertTrue(dfa.accepts(mapped))
+
+        evaluator = ByteDFAEvaluator(dfa)
+        for position in range(len(data)):
+            evaluator.process_bytes(data[position:position + 1])
+        self.assertTrue(evaluator.is_accepting())
+
+        evaluator.process_bytes(b"x")
+        self.assertEqual(evaluator.current_state, -1)
+        self.assertFalse(evaluator.is_accepting())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""Test the streaming writers of automata."""
+import io
+import unittest
+
+from automata.generators import random_automaton
+from automata.utils import AutomataFormat, nearest_states, write_dot, write_dot_to
+
+
+class TestWriters(unittest.TestCase):
+    """Tests for AutomataFormat.write_to and write_dot_to."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        self.automaton = AutomataFormat.read(
+            """
+            Automaton:
+                q0
+                q1
+                q2 final
+                q3
+
+                q0 -a-> q1
+                q0 -b-> q1
+                q1 -a-> q2
+                q1 --> q0
+                q2 -c-> q3
+            """
+        )
+
+    def test_merge_edges(self) -> None:
+        """Test that parallel edges are merged."""
+        output = io.StringIO()
+        write_dot_to(self.automaton, output)
+        dot = output.getvalue()
+
+        self.assertIn('q0 -> q1[label="a,b"]', dot)
+        self.assertIn('q1 -> q0[label="λ"]', dot)
+        self.assertEqual(dot.count("->"), 5)
+
+    def test_max_states(self) -> None:
+        """Test that only the nearest states are written."""
+        output = io.StringIO()
+        write_dot_to(self.automaton, output, max_states=2)
+        dot = output.getvalue()
+
+        self.assertIn("2 states not shown", dot)
+        self.assertNotIn("q2", dot)
+
+        output = io.StringIO()
+        AutomataFormat.write_to(self.automaton, output, max_states=3)
+        partial = AutomataFormat.read(output.getvalue())
+        self.assertEqual([s.name for s in partial.states], ["q0", "q1", "q2"])
+
+        with self.assertRaises(ValueError):
+            write_dot_to(self.automaton, io.StringIO(), max_states=0)
+
+    def test_max_states_order(self) -> None:
+        """Test that the states written do not depend on the transition order."""
+        expected = [state.name for state in nearest_states(self.automaton, 3)]
+        self.assertEqual(expected, ["q0", "q1", "q2"])
+
+        for state in self.automaton.states:
+            state.transitions.reverse()
+        self.assertEqual(
+            [state.name for state in nearest_states(self.automaton, 3)],
+            expected,
+        )
+
+    def test_same_as_string(self) -> None:
+        """Test that the string writers give the streamed output."""
+        automaton = random_automaton(300, lambda_ratio=0.1, seed=5)
+
+        output = io.StringIO()
+        AutomataFormat.write_to(automaton, output)
+        self.assertEqual(output.getvalue(), AutomataFormat.write(automaton))
+
+        output = io.StringIO()
+        write_dot_to(automaton, output, merge_edges=False)
+        self.assertEqual(output.getvalue(), write_dot(automaton))
+
+
+if __name__ == '__main__':
+    unittest.main()
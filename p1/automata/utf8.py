@@ -0,0 +1,284 @@
+"""Byte level (UTF-8) deterministic automata."""
+import mmap
+from typing import (
+    List,
+    Set,
+    Tuple,
+    Union,
+)
+
+from automata.automaton import FiniteAutomaton, State, Transition
+from automata.ranges import MAX_CODE_POINT, RangeAutomaton
+
+# objects whose bytes can be read without copying them
+BytesLike = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+_SURROGATES: Tuple[int, int] = (0xD800, 0xDFFF)
+# last code point encoded with 1, 2 and 3 bytes
+_LENGTH_LIMITS: Tuple[int, ...] = (0x7F, 0x7FF, 0xFFFF)
+
+
+def utf8_sequences(first: int, last: int) -> List[List[Tuple[int, int]]]:
+    """
+    Split a range of code points into sequences of byte ranges.
+
+    The UTF-8 encodings of the code points of the range are exactly
+    the byte strings matched by one of the sequences, where the
+    ``i``-th byte has to be in the ``i``-th range of the sequence.
+    Surrogates (which have no UTF-8 encoding) are left out.
+
+    Args:
+        first: First code point of the range.
+        last: Last code point of the range (included).
+
+    Returns:
+        Sequences of ``(first byte, last byte)`` ranges.
+
+    """
+    sequences: List[List[Tuple[int, int]]] = []
+    pending: List[Tuple[int, int]] = [(first, min(last, MAX_CODE_POINT))]
+
+    while pending:
+        start, end = pending.pop()
+        if start > end:
+            continue
+
+        # leave out the surrogates
+        if start <= _SURROGATES[1] and _SURROGATES[0] <= end:
+            pending.append((_SURROGATES[1] + 1, end))
+            pending.append((start, _SURROGATES[0] - 1))
+            continue
+
+        # every part has to be encoded with the same number of bytes
+        limit = next((limit for limit in _LENGTH_LIMITS if start <= limit < end), None)
+        if limit is not None:
+            pending.append((limit + 1, end))
+            pending.append((start, limit))
+            continue
+
+        if end <= 0x7F:
+            sequences.append([(start, end)])
+            continue
+
+        # split until every continuation byte covers a whole block
+        for continuation in range(1, 4):
+            mask = (1 << (6 * continuation)) - 1
+            if start & ~mask != end & ~mask:
+                if start & mask:
+                    pending.append(((start | mask) + 1, end))
+                    pending.append((start, start | mask))
+                    break
+                if end & mask != mask:
+                    pending.append((end & ~mask, end))
+                    pending.append((start, (end & ~mask) - 1))
+                    break
+        else:
+            start_bytes = chr(start).encode("utf-8")
+            end_bytes = chr(end).encode("utf-8")
+            sequences.append(list(zip(start_bytes, end_bytes)))
+
+    return sequences
+
+
+def byte_automaton(automaton: Union[FiniteAutomaton, RangeAutomaton]) -> FiniteAutomaton:
+    """
+    Lower a character automaton to an automaton over bytes.
+
+    Each transition is replaced by chains of new states that read
+    the UTF-8 encodings of its symbols. Each byte is represented by
+    the character with the same code (``chr(byte)``).
+
+    Args:
+        automaton: Automaton over characters.
+
+    Returns:
+        Automaton (not deterministic) that accepts the UTF-8
+        encodings of the strings accepted by the original one.
+
+    """
+    if isinstance(automaton, FiniteAutomaton):
+        automaton = RangeAutomaton.from_automaton(automaton)
+
+    names: Set[str] = {state.name for state in automaton.states}
+    prefix = '_u'
+    while any(name.startswith(prefix) for name in names):
+        prefix = '_' + prefix
+
+    states: List[State] = [
+        State(name=state.name, is_final=state.is_final)
+        for state in automaton.states
+    ]
+    for range_state, state in zip(automaton.states, list(states)):
+        transitions: List[Transition] = []
+        for range_transition in range_state.transitions:
+            if range_transition.ranges is None:
+                transitions.append(Transition(symbol=None, state=range_transition.state))
+                continue
+
+            for first, last in range_transition.ranges:
+                for sequence in utf8_sequences(first, last):
+                    # transitions of the state that reads the next byte
+                    reading: List[Transition] = transitions
+                    for position, (first_byte, last_byte) in enumerate(sequence):
+                        if position == len(sequence) - 1:
+                            target = range_transition.state
+                        else:
+                            target = f"{prefix}{len(states)}"
+                            states.append(State(name=target))
+                        reading.extend(
+                            Transition(symbol=chr(byte), state=target)
+                            for byte in range(first_byte, last_byte + 1)
+                        )
+                        reading = states[-1].transitions
+        state.add_transitions(transitions)
+
+    return FiniteAutomaton(states)
+
+
+class ByteDFA():
+    """
+    Deterministic automaton over bytes, with 256 columns per state.
+
+    The table is stored as a flat list where the entry of state ``s``
+    and byte ``b`` is at ``256 * s + b`` and holds ``256 * t`` for the
+    next state ``t``, or ``-1`` if the transition is missing (the
+    input is rejected).
+
+    Args:
+        table: Flat transition table (see above).
+        finals: Whether each state is final or not.
+
+    """
+
+    table: List[int]
+    finals: List[bool]
+
+    def __init__(self, table: List[int], finals: List[bool]) -> None:
+        if len(table) != 256 * len(finals):
+            raise ValueError("The table needs 256 entries per state")
+        self.table = table
+        self.finals = finals
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(num_states={self.num_states!r})"
+
+    @property
+    def num_states(self) -> int:
+        """Number of states of the automaton."""
+        return len(self.finals)
+
+    @classmethod
+    def from_automaton(
+        cls,
+        automaton: Union[FiniteAutomaton, RangeAutomaton],
+        strategy: str = "hopcroft",
+    ) -> 'ByteDFA':
+        """
+        Compile a character automaton to a minimal byte automaton
+        that reads UTF-8.
+
+        Args:
+            automaton: Automaton over characters.
+            strategy: Minimization algorithm (see
+                ``FiniteAutomaton.to_minimized``).
+
+        Returns:
+            Byte automaton that accepts the UTF-8 encodings of
+            the strings accepted by the original one.
+
+        """
+        minimized = byte_automaton(automaton).to_minimized(
+            strategy=strategy,
+            complete=False,
+        )
+        index = {state.name: position for position, state in enumerate(minimized.states)}
+
+        table: List[int] = [-1] * (256 * len(minimized.states))
+        for position, state in enumerate(minimized.states):
+            for transition in state.transitions:
+                assert transition.symbol is not None
+                table[256 * position + ord(transition.symbol)] = 256 * index[transition.state]
+
+        return cls(table, [state.is_final for state in minimized.states])
+
+    def accepts(self, data: BytesLike) -> bool:
+        """
+        Check if some bytes are accepted by the automaton.
+
+        Args:
+            data: Bytes to check (``bytes``, ``bytearray``, ``memoryview``,
+                ``mmap``... any object with the buffer protocol).
+
+        """
+        evaluator = ByteDFAEvaluator(self)
+        evaluator.process_bytes(data)
+        return evaluator.is_accepting()
+
+
+class ByteDFAEvaluator():
+    """
+    Evaluator of byte automata.
+
+    The bytes are read through a memoryview, so they are not copied
+    nor decoded, and they can be given in chunks (a chunk can end in
+    the middle of a character).
+
+    Args:
+        automaton: Byte automaton to evaluate.
+
+    Attributes:
+        current_offset: ``256`` times the current state, or ``-1``
+            once a missing transition has been found.
+
+    """
+
+    automaton: ByteDFA
+    current_offset: int
+
+    def __init__(self, automaton: ByteDFA) -> None:
+        self.automaton = automaton
+        self.current_offset = 0
+
+    @property
+    def current_state(self) -> int:
+        """Index of the current state (``-1`` if the input was rejected)."""
+        return self.current_offset // 256 if self.current_offset != -1 else -1
+
+    def process_bytes(self, data: BytesLike) -> None:
+        """
+        Process a chunk of bytes. The processing stops at the
+        first missing transition.
+
+        Args:
+            data: Bytes to process (any object with the buffer protocol).
+
+        """
+        offset = self.current_offset
+        if offset == -1:
+            return
+
+        table = self.automaton.table
+        with memoryview(data) as view, view.cast("B") as octets:
+            for byte in octets:
+                offset = table[offset + byte]
+                if offset == -1:
+                    break
+        self.current_offset = offset
+
+    def is_accepting(self) -> bool:
+        """Check if the current state is an accepting one."""
+        return self.current_offset != -1 and self.automaton.finals[self.current_offset // 256]
+
+    def accepts(self, data: BytesLike) -> bool:
+        """
+        Return if some bytes are accepted without changing state.
+
+        Note: This function is NOT thread-safe.
+
+        """
+        old_offset = self.current_offset
+        try:
+            self.process_bytes(data)
+            return self.is_accepting()
+        finally:
+            self.current_offset = old_offset
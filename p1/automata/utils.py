@@ -1,4 +1,5 @@
 """General utilities to work with automatas."""
+import io
 import re
 from collections import defaultdict, deque
 from typing_extensions import Final
@@ -7,11 +8,13 @@ import automata.automaton as aut
 
 from typing import (
     DefaultDict,
+    Deque,
     Dict,
     Mapping,
     Optional,
     Set,
     List,
+    TextIO,
 )
 
 class FormatParseError(Exception):
@@ -65,36 +68,99 @@ class AutomataFormat():
         return aut.FiniteAutomaton(states=list(states.values()))
 
     @classmethod
-    def write(cls, automaton: aut.FiniteAutomaton) -> str:
-        """Write the automaton description in our custom format."""
-        return (
-            "Automaton:\n"
-            + "".join(
-                f"\t{s.name}{' final' if s.is_final else ''}\n"
-                for s in automaton.states
-            )
-            + "\n"
-            + "".join(
+    def write(cls, automaton: aut.FiniteAutomaton, trim: bool = False) -> str:
+        """
+        Write the automaton description in our custom format.
+
+        If ``trim`` is ``True``, the useless states are not written.
+        """
+        output = io.StringIO()
+        cls.write_to(automaton, output, trim=trim)
+        return output.getvalue()
+
+    @classmethod
+    def write_to(
+        cls,
+        automaton: aut.FiniteAutomaton,
+        file: TextIO,
+        trim: bool = False,
+        max_states: Optional[int] = None,
+    ) -> None:
+        """
+        Write the automaton description in our custom format to a file,
+        line by line.
+
+        Args:
+            automaton: Automaton to write.
+            file: Text file where the automaton is written.
+            trim: Whether to leave out the useless states.
+            max_states: If given, only the ``max_states`` states nearest
+                to the initial state (and the transitions among them)
+                are written.
+
+        """
+        if trim:
+            automaton, _ = automaton.trim()
+        states = nearest_states(automaton, max_states)
+        names = {s.name for s in states}
+
+        file.write("Automaton:\n")
+        for s in states:
+            file.write(f"\t{s.name}{' final' if s.is_final else ''}\n")
+        file.write("\n")
+        for s in states:
+            file.writelines(
                 f"\t{s.name} "
                 f"-{t.symbol if t.symbol is not None else ''}->"
                 f" {t.state}\n"
-                for s in automaton.states for t in s.transitions
+                for t in s.transitions
+                if t.state in names
             )
-        )
 
 
     
-def write_dot(automaton: aut.FiniteAutomaton) -> str:
+def write_dot(automaton: aut.FiniteAutomaton, trim: bool = False) -> str:
     """
     Write a dot representation of the automaton.
 
     Args:
         automaton: Automaton to print.
+        trim: Whether to leave out the useless states.
 
     Returns:
         Representation of the automaton in dot (Graphviz) language.
 
     """
+    output = io.StringIO()
+    write_dot_to(automaton, output, trim=trim, merge_edges=False)
+    return output.getvalue()
+
+def write_dot_to(
+    automaton: aut.FiniteAutomaton,
+    file: TextIO,
+    trim: bool = False,
+    max_states: Optional[int] = None,
+    merge_edges: bool = True,
+) -> None:
+    """
+    Write a dot representation of the automaton to a file, line by line.
+
+    Args:
+        automaton: Automaton to print.
+        file: Text file where the representation is written.
+        trim: Whether to leave out the useless states.
+        max_states: If given, only the ``max_states`` states nearest
+            to the initial state (and the transitions among them)
+            are written.
+        merge_edges: Whether to draw the transitions between the same
+            two states as a single edge labeled ``a,b,c``.
+
+    """
+    if trim:
+        automaton, _ = automaton.trim()
+    states = nearest_states(automaton, max_states)
+    names = {s.name for s in states}
+
     shape_dict = {
         True: "doublecircle",
         False: "circle",
@@ -103,26 +169,80 @@ def write_dot(automaton: aut.FiniteAutomaton) -> str:
     def symbol_repr(symbol: Optional[str]) -> str:
         return "λ" if symbol is None else symbol
 
-    return (
+    file.write(
         "digraph {\n"
         "  rankdir=LR;\n"
         "\n"
-        + "  node [shape = point]; __start_point__\n"
-        + "".join(
-            f"  {s.name}[shape={shape_dict[s.is_final]}]\n"
-            for s in automaton.states
-        )
-        + "\n"
-        + f"  __start_point__ -> {automaton.states[0].name}\n"
-        + "".join(
-            f"  {s.name} -> {t.state}"
-            f"[label=\"{symbol_repr(t.symbol)}\"]\n"
-            for s in automaton.states
-            if s.transitions is not None
-            for t in s.transitions 
-        )
-        + "}\n"
+        "  node [shape = point]; __start_point__\n"
     )
+    for s in states:
+        file.write(f"  {s.name}[shape={shape_dict[s.is_final]}]\n")
+    if len(states) < len(automaton.states):
+        file.write(f"  // {len(automaton.states) - len(states)} states not shown\n")
+    file.write("\n")
+    file.write(f"  __start_point__ -> {automaton.states[0].name}\n")
+
+    for s in states:
+        if not merge_edges:
+            file.writelines(
+                f"  {s.name} -> {t.state}"
+                f"[label=\"{symbol_repr(t.symbol)}\"]\n"
+                for t in s.transitions
+                if t.state in names
+            )
+            continue
+
+        labels: Dict[str, List[str]] = {}
+        for t in s.transitions:
+            if t.state in names:
+                labels.setdefault(t.state, []).append(symbol_repr(t.symbol))
+        file.writelines(
+            f"  {s.name} -> {target}"
+            f"[label=\"{','.join(sorted(symbols))}\"]\n"
+            for target, symbols in labels.items()
+        )
+
+    file.write("}\n")
+
+def nearest_states(
+    automaton: aut.FiniteAutomaton,
+    max_states: Optional[int] = None,
+) -> List[aut.State]:
+    """
+    Return the states nearest to the initial state.
+
+    Args:
+        automaton: Automaton whose states are returned.
+        max_states: Maximum number of states (at least 1).
+            ``None`` for all of them.
+
+    Returns:
+        All the states (in their order) if ``max_states`` is ``None`` or
+        not smaller than the number of states. Otherwise, the first
+        ``max_states`` states found by a BFS from the initial state,
+        which visits the successors of each state sorted by name.
+
+    Raises:
+        ValueError: If ``max_states`` is smaller than 1.
+
+    """
+    if max_states is not None and max_states < 1:
+        raise ValueError(f"max_states must be at least 1, not {max_states}")
+    if max_states is None or max_states >= len(automaton.states):
+        return automaton.states
+
+    found: List[aut.State] = [automaton.states[0]]
+    visited: Set[str] = {automaton.states[0].name}
+    pending: Deque[aut.State] = deque(found)
+    while pending and len(found) < max_states:
+        state = pending.popleft()
+        for name in sorted({t.state for t in state.transitions}):
+            if name not in visited and len(found) < max_states:
+                visited.add(name)
+                found.append(automaton.name2state[name])
+                pending.append(found[-1])
+
+    return found
 
 def is_deterministic(automaton: aut.FiniteAutomaton) -> bool:
     """
@@ -136,20 +256,7 @@ def is_deterministic(automaton: aut.FiniteAutomaton) -> bool:
         ``False`` otherwise.
 
     """
-    checked_origins = set()
-
-    for s in automaton.states:
-        for t in s.transitions:
-            if t.symbol is None:
-                return False
-
-            origin = (s, t.symbol)
-            if origin in checked_origins:
-                return False
-
-            checked_origins.add(origin)
-
-    return True
+    return automaton.is_deterministic
 
 def deterministic_automata_isomorphism(
     automaton1: aut.FiniteAutomaton,
@@ -0,0 +1,222 @@
+"""
+Benchmarks of the automata package.
+
+Times REParser.create_automaton, to_deterministic, to_minimized and
+FiniteAutomatonEvaluator.accepts over families of regexes of growing
+size, writes the results as JSON and compares them with a baseline.
+
+Usage (from the p1 directory):
+
+    python -m benchmarks.bench_automata [--quick] [--output results.json]
+        [--baseline benchmarks/baseline.json] [--save-baseline]
+
+The stored baseline depends on the machine where it was generated;
+regenerate it with --save-baseline before comparing on a new machine.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from automata.automaton import FiniteAutomaton
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.re_parser import REParser
+
+BASELINE_PATH: str = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'baseline.json')
+
+Result = Dict[str, object]
+
+
+def regex_concatenation(size: int) -> Tuple[str, str]:
+    """Regex with ``size`` concatenated symbols, and an input accepted by it."""
+    symbols = [chr(ord('a') + i % 26) for i in range(size)]
+    return ".".join(symbols), "".join(symbols)
+
+
+def regex_alphabet(size: int) -> Tuple[str, str]:
+    """Regex over an alphabet of ``size`` symbols: (s1+...+sn)*.s1"""
+    symbols = [chr(ord('a') + i) if i < 26 else chr(ord('A') + i - 26) for i in range(size)]
+    return "(" + "+".join(symbols) + ")*." + symbols[0], "".join(symbols) * 4 + symbols[0]
+
+
+def regex_nested_stars(size: int) -> Tuple[str, str]:
+    """Regex with ``size`` nested starred unions, which gives big NFAs."""
+    regex = "a"
+    for _ in range(size):
+        regex = f"({regex}+b.{regex})*"
+    return regex, "ab" * 20
+
+
+def regex_blowup(size: int) -> Tuple[str, str]:
+    """(a+b)*.a.(a+b)^n: its deterministic automaton has 2^(n+1) states."""
+    return "(a+b)*.a" + ".(a+b)" * size, "ab" * 20 + "a" + "b" * size
+
+
+WORKLOADS: Dict[str, Tuple[Callable[[int], Tuple[str, str]], List[int], List[int]]] = {
+    # name: (generator, sizes, quick sizes)
+    "concatenation": (regex_concatenation, [16, 48, 96], [16, 48]),
+    "alphabet": (regex_alphabet, [4, 16, 52], [4, 16]),
+    "nested_stars": (regex_nested_stars, [2, 3, 4], [2, 3]),
+    "blowup": (regex_blowup, [4, 6, 8], [4, 6]),
+}
+
+
+def _best_time(function: Callable[[], object], repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_workload(name: str, size: int, repeat: int) -> List[Result]:
+    """
+    Time every operation on one regex of a family.
+
+    Args:
+        name: Name of the family (key of WORKLOADS).
+        size: Size parameter of the family.
+        repeat: Number of repetitions (the best time is kept).
+
+    Returns:
+        One result per operation.
+
+    """
+    generator = WORKLOADS[name][0]
+    regex, string = generator(size)
+
+    automaton: FiniteAutomaton = REParser().create_automaton(regex)
+    deterministic: FiniteAutomaton = automaton.to_deterministic()
+    minimized: FiniteAutomaton = automaton.to_minimized()
+    evaluator = FiniteAutomatonEvaluator(automaton)
+
+    operations: Dict[str, Callable[[], object]] = {
+        "create_automaton": lambda: REParser().create_automaton(regex),
+        "to_deterministic": automaton.to_deterministic,
+        "to_minimized": automaton.to_minimized,
+        "accepts": lambda: evaluator.accepts(string),
+    }
+
+    return [
+        {
+            "workload": name,
+            "size": size,
+            "operation": operation,
+            "seconds": _best_time(function, repeat),
+            "nfa_states": len(automaton.states),
+            "dfa_states": len(deterministic.states),
+            "min_states": len(minimized.states),
+        }
+        for operation, function in operations.items()
+    ]
+
+
+def run_all(quick: bool = False, repeat: int = 3) -> List[Result]:
+    """Run every workload at every size."""
+    results: List[Result] = []
+    for name, (_, sizes, quick_sizes) in WORKLOADS.items():
+        for size in (quick_sizes if quick else sizes):
+            results.extend(run_workload(name, size, repeat))
+    return results
+
+
+def _key(result: Result) -> Tuple[str, str, str]:
+    return str(result["workload"]), str(result["size"]), str(result["operation"])
+
+
+def compare(
+    results: List[Result],
+    baseline: List[Result],
+    threshold: float,
+    min_seconds: float = 0.001,
+) -> List[str]:
+    """
+    Compare the results with a baseline.
+
+    Args:
+        results: Results of the current run.
+        baseline: Results of the baseline run.
+        threshold: Maximum allowed ratio between the current time
+            and the baseline time.
+        min_seconds: Times below this are too noisy to be compared.
+
+    Returns:
+        Description of each regression found.
+
+    """
+    baseline_times: Dict[Tuple[str, str, str], float] = {
+        _key(result): float(str(result["seconds"])) for result in baseline
+    }
+    regressions: List[str] = []
+    for result in results:
+        old = baseline_times.get(_key(result))
+        new = float(str(result["seconds"]))
+        if old is None or max(old, new) < min_seconds:
+            continue
+        ratio = new / max(old, min_seconds)
+        if ratio > threshold:
+            workload, size, operation = _key(result)
+            regressions.append(
+                f"{workload}[{size}] {operation}: {ratio:.2f}x slower than baseline"
+            )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point. Returns the exit code."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--quick", action="store_true", help="only the small sizes")
+    parser.add_argument("--repeat", type=int, default=3, help="repetitions per operation")
+    parser.add_argument("--output", help="file where the results are written (JSON)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline to compare with")
+    parser.add_argument("--save-baseline", action="store_true", help="overwrite the baseline")
+    parser.add_argument(
+        "--threshold", type=float, default=1.5,
+        help="slowdown ratio considered a regression",
+    )
+    parser.add_argument(
+        "--min-seconds", type=float, default=0.001,
+        help="times below this are not compared",
+    )
+    args = parser.parse_args(argv)
+
+    results = run_all(quick=args.quick, repeat=args.repeat)
+    for result in results:
+        print(
+            f"{result['workload']:>14} {result['size']:>4} "
+            f"{result['operation']:>17} {float(str(result['seconds'])) * 1000:10.3f} ms"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline found at {args.baseline}")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline: List[Result] = json.load(f)
+    regressions = compare(results, baseline, args.threshold, args.min_seconds)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())